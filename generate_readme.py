@@ -93,7 +93,7 @@ def main() -> None:
 ```bash
 pip install imgviz
 
-# there are optional dependencies like skimage, below installs all.
+# there are optional dependencies like scikit-learn, below installs all.
 pip install imgviz[all]
 ```
 
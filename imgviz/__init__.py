@@ -7,6 +7,9 @@ from . import data
 from . import draw
 from . import fill
 from . import io
+from ._autorange import EmaRange
+from ._autorange import PercentileRange
+from ._autorange import RangeEstimator
 from ._blur import blur
 from ._centerize import centerize
 from ._color import asgray
@@ -28,8 +31,11 @@ from ._dtype import bool2ubyte
 from ._dtype import float2ubyte
 from ._flags import flags2rgb
 from ._flow import Flow2Rgb
+from ._flow import flow2quiver
 from ._flow import flow2rgb
+from ._heatmap import Heatmap
 from ._heatmap import heatmap
+from ._instances import instance_map_to_bboxes
 from ._instances import instances2rgb
 from ._instances import masks_to_bboxes
 from ._label import label2rgb
@@ -41,6 +47,9 @@ from ._nchannel import nchannel2rgb
 from ._normalize import normalize
 from ._pad import pad
 from ._pixelate import pixelate
+from ._redact import redact
+from ._region_stats import RegionStats
+from ._region_stats import region_stats
 from ._resize import resize
 from ._scalebar import scalebar
 from ._tile import tile
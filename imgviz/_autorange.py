@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import abc
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class RangeEstimator(abc.ABC):
+    """Abstract base class for value ranges tracked over a stream of frames.
+
+    Subclasses must implement update to fold new samples into the estimate.
+
+    Args:
+        stride: Step along each of the first two axes when subsampling a
+            frame, so a 1080p frame is estimated from ~1/stride**2 of its
+            pixels.
+    """
+
+    def __init__(self, stride: int = 4) -> None:
+        if stride < 1:
+            raise ValueError(f"stride must be >= 1, but got {stride}")
+        self._stride = stride
+        self._vmin: float | None = None
+        self._vmax: float | None = None
+
+    @property
+    def stride(self) -> int:
+        return self._stride
+
+    @property
+    def vmin(self) -> float | None:
+        return self._vmin
+
+    @property
+    def vmax(self) -> float | None:
+        return self._vmax
+
+    def subsample(self, frame: NDArray) -> NDArray:
+        """Strided view of a frame's first two axes."""
+        return frame[:: self._stride, :: self._stride]
+
+    @abc.abstractmethod
+    def update(self, samples: NDArray) -> None:
+        """Fold samples into the estimate.
+
+        Args:
+            samples: Values of any shape, e.g. ``subsample(frame)``. NaNs and
+                infs are ignored; without finite samples this is a no-op, and
+                vmin and vmax stay None until the first finite ones.
+        """
+        pass
+
+
+class EmaRange(RangeEstimator):
+    """Exponential moving average of the per-frame minimum and maximum.
+
+    Args:
+        decay: Weight of the previous estimate in [0, 1). 0 follows each frame;
+            values close to 1 smooth over many frames.
+        stride: Subsampling stride, see :class:`~imgviz.RangeEstimator`.
+
+    Example:
+        >>> colorizer = imgviz.Colorize(autorange=imgviz.EmaRange(decay=0.9))
+        >>> for depth in stream:
+        ...     depthviz = colorizer(depth)
+    """
+
+    def __init__(self, decay: float = 0.9, stride: int = 4) -> None:
+        super().__init__(stride=stride)
+        if not 0 <= decay < 1:
+            raise ValueError(f"decay must be in [0, 1), but got {decay}")
+        self._decay = decay
+
+    def update(self, samples: NDArray) -> None:
+        finite = _finite(samples)
+        if finite.size > 0:
+            frame_min = float(finite.min())
+            frame_max = float(finite.max())
+            if self._vmin is None or self._vmax is None:
+                self._vmin, self._vmax = frame_min, frame_max
+            else:
+                self._vmin = self._decay * self._vmin + (1 - self._decay) * frame_min
+                self._vmax = self._decay * self._vmax + (1 - self._decay) * frame_max
+
+
+class PercentileRange(RangeEstimator):
+    """Robust percentiles from a fixed-bin histogram updated per frame.
+
+    Each update decays the counts, then adds the histogram of the new samples.
+    When samples fall outside the binned interval it is widened and the old
+    counts are re-binned, so memory stays at ``bins`` counts.
+
+    Args:
+        low: Lower percentile in [0, 100].
+        high: Upper percentile in [0, 100].
+        bins: Number of histogram bins.
+        decay: Weight of the previous counts in [0, 1]. 1 accumulates the whole
+            stream.
+        stride: Subsampling stride, see :class:`~imgviz.RangeEstimator`.
+    """
+
+    def __init__(
+        self,
+        low: float = 1.0,
+        high: float = 99.0,
+        bins: int = 1024,
+        decay: float = 0.9,
+        stride: int = 4,
+    ) -> None:
+        super().__init__(stride=stride)
+        if not 0 <= low <= high <= 100:
+            raise ValueError(
+                f"percentiles must satisfy 0 <= low <= high <= 100, "
+                f"but got {low=}, {high=}"
+            )
+        if bins < 1:
+            raise ValueError(f"bins must be >= 1, but got {bins}")
+        if not 0 <= decay <= 1:
+            raise ValueError(f"decay must be in [0, 1], but got {decay}")
+        self._low = low
+        self._high = high
+        self._decay = decay
+        self._counts = np.zeros(bins, dtype=np.float64)
+        self._edges: tuple[float, float] | None = None
+
+    def update(self, samples: NDArray) -> None:
+        finite = _finite(samples).astype(np.float64, copy=False)
+        if finite.size > 0:
+            lo, hi = float(finite.min()), float(finite.max())
+            if self._edges is None:
+                self._edges = (lo, hi if hi > lo else lo + 1)
+            elif lo < self._edges[0] or hi > self._edges[1]:
+                self._rebin(min(lo, self._edges[0]), max(hi, self._edges[1]))
+
+            self._counts *= self._decay
+            self._counts += np.bincount(
+                self._bin_index(finite), minlength=len(self._counts)
+            )
+            self._vmin = self._percentile(self._low)
+            self._vmax = self._percentile(self._high)
+
+    def _bin_index(self, values: NDArray[np.float64]) -> NDArray[np.intp]:
+        assert self._edges is not None
+        lo, hi = self._edges
+        n_bin = len(self._counts)
+        index = ((values - lo) * (n_bin / (hi - lo))).astype(np.intp)
+        return np.clip(index, 0, n_bin - 1)
+
+    def _rebin(self, lo: float, hi: float) -> None:
+        # Widen to at least double the span so a drifting stream re-bins
+        # O(log) times, and move each old bin's count to its center's new bin.
+        assert self._edges is not None
+        old_lo, old_hi = self._edges
+        n_bin = len(self._counts)
+        width = (old_hi - old_lo) / n_bin
+        centers = old_lo + (np.arange(n_bin) + 0.5) * width
+        span = max(hi - lo, 2 * (old_hi - old_lo))
+        if lo < old_lo:
+            lo = hi - span
+        else:
+            hi = lo + span
+        self._edges = (lo, hi)
+        self._counts = np.bincount(
+            self._bin_index(centers), weights=self._counts, minlength=n_bin
+        )
+
+    def _percentile(self, q: float) -> float:
+        assert self._edges is not None
+        lo, hi = self._edges
+        width = (hi - lo) / len(self._counts)
+        cumsum = np.cumsum(self._counts)
+        target = q / 100 * cumsum[-1]
+        if target <= 0:
+            return lo + int(np.flatnonzero(self._counts)[0]) * width
+        k = min(int(np.searchsorted(cumsum, target)), len(cumsum) - 1)
+        # Interpolate linearly inside the bin the target count falls in.
+        below = cumsum[k - 1] if k > 0 else 0.0
+        return lo + (k + (target - below) / self._counts[k]) * width
+
+
+def _finite(samples: NDArray) -> NDArray:
+    samples = np.asarray(samples)
+    if np.issubdtype(samples.dtype, np.floating):
+        return samples[np.isfinite(samples)]
+    return samples.ravel()
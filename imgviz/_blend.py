@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import functools
+from typing import Literal
+
+import numpy as np
+from numpy.typing import DTypeLike
+from numpy.typing import NDArray
+
+from . import _utils
+
+Rounding = Literal["round", "floor"]
+
+# Largest number of distinct alphas blended through stacked lookup tables
+# (64 KiB each) before falling back to float arithmetic.
+_MAX_LUT_ALPHAS: int = 16
+
+
+def blend(
+    image: NDArray[np.uint8],
+    color: float | NDArray,
+    alpha: float | NDArray[np.floating],
+    index: NDArray[np.integer] | None = None,
+    mask: NDArray[np.bool_] | None = None,
+    out: NDArray[np.uint8] | None = None,
+    rounding: Rounding = "round",
+    dtype: DTypeLike = np.float64,
+) -> NDArray[np.uint8]:
+    """Alpha-blend colors onto a uint8 image.
+
+    Computes ``(1 - alpha) * image + alpha * color`` in ``dtype``, then rounds
+    (or floors) and clips to uint8. With uint8 colors and few distinct alphas
+    the result is read from a 256x256 table of that same expression indexed by
+    ``image << 8 | color``, so it matches the float arithmetic bit for bit
+    without float temporaries.
+
+    Args:
+        image: Image with shape (H, W) or (H, W, C).
+        color: Color as a scalar or shape (C,), per-label colors with shape
+            (K, C) indexed by ``index``, or per-pixel colors with the shape of
+            image.
+        alpha: Alpha as a scalar, per-label alphas with shape (K,) indexed by
+            ``index``, or per-pixel alphas with shape (H, W).
+        index: Label index of each pixel with shape (H, W), required by
+            per-label color or alpha.
+        mask: Pixels to blend with shape (H, W). Others are copied from image.
+        out: Output with the shape of image, which may be image or color.
+        rounding: 'round' to round half to even, 'floor' to truncate.
+        dtype: Float dtype whose arithmetic the result reproduces.
+
+    Returns:
+        Blended image with the shape of image.
+    """
+    if image.dtype != np.uint8:
+        raise ValueError(f"image dtype must be np.uint8, but got {image.dtype}")
+    if rounding not in ("round", "floor"):
+        raise ValueError(f"unsupported rounding: {rounding}")
+
+    n_channel = image.shape[2] if image.ndim == 3 else 1
+    height, width = image.shape[:2]
+    dtype = np.dtype(dtype)
+
+    color = np.asarray(color)
+    alpha = np.asarray(alpha, dtype=np.float64)
+    per_label_color = color.ndim == 2 and image.ndim == 3
+    per_label_alpha = alpha.ndim == 1
+    if (per_label_color or per_label_alpha) and index is None:
+        raise ValueError("index is required by per-label color or alpha")
+    if color.ndim in (0, 1):
+        color = np.broadcast_to(color, (n_channel,))
+
+    if out is None:
+        out = image.copy() if mask is not None else np.empty_like(image)
+    else:
+        if out.shape != image.shape or out.dtype != np.uint8:
+            raise ValueError(f"out must be uint8 with shape {image.shape}")
+        if not out.flags.c_contiguous:
+            # Blended pixels are written through a flat view of out.
+            np.copyto(
+                out,
+                blend(image, color, alpha, index, mask, None, rounding, dtype),
+            )
+            return out
+        if mask is not None and out is not image:
+            np.copyto(out, image)
+
+    # Per-label alphas that take few distinct values are blended through one
+    # table per value, addressed by the value's group.
+    alpha_group = None
+    if per_label_alpha:
+        alpha_values, alpha_group = np.unique(alpha, return_inverse=True)
+        if len(alpha_values) == 1:
+            alpha, alpha_group, per_label_alpha = alpha_values[0], None, False
+        elif len(alpha_values) > _MAX_LUT_ALPHAS:
+            alpha_values = None
+    color_u8 = _as_uint8(color)
+    use_lut = color_u8 is not None and alpha.ndim != 2
+    if use_lut:
+        color = color_u8
+        if alpha_group is None:
+            lut = _blend_lut(float(alpha), rounding=rounding, dtype=dtype.str)
+        elif alpha_values is not None:
+            lut = np.stack(
+                [
+                    _blend_lut(float(a), rounding=rounding, dtype=dtype.str)
+                    for a in alpha_values
+                ]
+            )
+        else:
+            use_lut = False
+
+    image_flat = image.reshape(height * width, n_channel)
+    out_flat = out.reshape(height * width, n_channel)
+    if mask is None:
+        positions = None
+        n_pixel = height * width
+    else:
+        positions = np.flatnonzero(mask)
+        n_pixel = len(positions)
+
+    for start in range(0, n_pixel, _utils.CHUNK_SIZE):
+        if positions is None:
+            pixels = slice(start, start + _utils.CHUNK_SIZE)
+        else:
+            pixels = positions[start : start + _utils.CHUNK_SIZE]
+
+        src = image_flat[pixels]
+        label = None if index is None else index.reshape(-1)[pixels]
+        if per_label_color:
+            dst = color[label]
+        elif color.ndim == 1:
+            dst = color
+        else:
+            dst = color.reshape(-1, n_channel)[pixels]
+
+        if use_lut:
+            if per_label_alpha:
+                group = alpha_group[label].astype(np.uint32)[:, None] << 16
+                out_flat[pixels] = lut.reshape(-1)[group | _pair_index(src, dst)]
+            elif dst.ndim == 1:
+                for channel in range(n_channel):
+                    out_flat[pixels, channel] = lut[src[:, channel], dst[channel]]
+            else:
+                out_flat[pixels] = lut.reshape(-1)[_pair_index(src, dst)]
+            continue
+
+        if per_label_alpha:
+            a = alpha[label][:, None]
+        elif alpha.ndim == 2:
+            a = alpha.reshape(-1)[pixels][:, None]
+        else:
+            a = alpha
+        out_flat[pixels] = _finish(
+            _mix(src.astype(dtype), dst.astype(dtype), a, dtype), rounding
+        )
+    return out
+
+
+def _as_uint8(color: NDArray) -> NDArray[np.uint8] | None:
+    if color.dtype == np.uint8:
+        return color
+    if color.size > 0 and not (
+        np.issubdtype(color.dtype, np.number)
+        and (color >= 0).all()
+        and (color <= 255).all()
+        and (color == np.round(color)).all()
+    ):
+        return None
+    return color.astype(np.uint8)
+
+
+def _pair_index(src: NDArray[np.uint8], dst: NDArray[np.uint8]) -> NDArray:
+    # Flat index of (image, color) into a 256x256 table, in uint16 arithmetic.
+    pair = src.astype(np.uint16) << 8
+    pair |= dst
+    return pair
+
+
+def _mix(
+    src: NDArray[np.floating],
+    dst: NDArray[np.floating],
+    alpha: float | NDArray[np.floating],
+    dtype: np.dtype,
+) -> NDArray[np.floating]:
+    alpha = np.asarray(alpha, dtype=np.float64)
+    return (1 - alpha).astype(dtype) * src + alpha.astype(dtype) * dst
+
+
+def _finish(values: NDArray[np.floating], rounding: Rounding) -> NDArray[np.uint8]:
+    if rounding == "round":
+        values = values.round()
+    return np.clip(values, 0, 255).astype(np.uint8)
+
+
+@functools.lru_cache(maxsize=64)
+def _blend_lut(alpha: float, rounding: Rounding, dtype: str) -> NDArray[np.uint8]:
+    # Every (image, color) pair blended with the exact expression of the float
+    # path, so looking it up is bit-identical to computing it.
+    values = np.arange(256, dtype=dtype)
+    lut = _finish(
+        _mix(values[:, None], values[None, :], alpha, np.dtype(dtype)), rounding
+    )
+    lut.setflags(write=False)
+    return lut
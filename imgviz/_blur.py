@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Literal
+
 import numpy as np
 import PIL.Image
 import PIL.ImageFilter
@@ -7,20 +9,47 @@ from numpy.typing import NDArray
 
 from . import _utils
 
+# Pillow modes blurring up to 4 uint8 channels in one call.
+_PILLOW_MODES: dict[int, str] = {1: "L", 2: "LA", 3: "RGB", 4: "RGBA"}
+
+# Gaussian kernels are truncated at this many sigmas.
+_TRUNCATE: float = 4.0
+
+# Largest kernel radius convolved by shifted adds; wider kernels are applied
+# through an FFT along the axis, whose cost does not grow with the radius.
+_MAX_DIRECT_RADIUS: int = 12
+
 
 def blur(
-    image: NDArray[np.uint8],
+    image: NDArray,
     sigma: float = 8.0,
     mask: NDArray[np.bool_] | None = None,
-) -> NDArray[np.uint8]:
+    method: Literal["gaussian", "box"] = "gaussian",
+) -> NDArray:
     """Apply Gaussian blur to an image.
 
+    uint8 images are blurred by Pillow, up to 4 channels per call (e.g. RGB
+    and RGBA in one multi-band filter), whose Gaussian is already three
+    extended box blurs with constant cost per pixel. Other dtypes are blurred
+    in float32 (float64 for float64 input) by separable convolution, and
+    integers are rounded back.
+
     Args:
-        image: Input uint8 image with shape (H, W) or (H, W, C).
+        image: Input image with shape (H, W) or (H, W, C).
         sigma: Gaussian blur radius in pixels.
         mask: Optional boolean mask (H, W). If given, only pixels inside the
             mask are blurred and the rest are byte-identical to the input
-            (e.g. for redaction). If None, the whole image is blurred.
+            (e.g. for redaction). Only the bounding boxes of the groups of
+            mask pixels, padded by the blur's support, are blurred, with the
+            same result as blurring the whole image (up to float rounding for
+            non-uint8 images). If None, the whole image is blurred.
+        method: For non-uint8 images, 'gaussian' to convolve with the
+            Gaussian truncated at 4 sigma (through an FFT for large sigmas),
+            or 'box' to approximate it with three box blurs of the same
+            variance at constant cost per pixel (at least one of radius 1 for
+            any positive sigma). uint8 images are always
+            blurred by Pillow's GaussianBlur, which is itself three extended
+            box blurs, so ``method`` does not change their output.
 
     Returns:
         Blurred image with the same shape and dtype as the input.
@@ -36,27 +65,204 @@ def blur(
     """
     if sigma < 0:
         raise ValueError(f"sigma must be >= 0, got {sigma}")
-    if image.dtype != np.uint8:
-        raise ValueError(f"image.dtype must be uint8, got {image.dtype}")
+    if not (
+        np.issubdtype(image.dtype, np.integer)
+        or np.issubdtype(image.dtype, np.floating)
+    ):
+        raise ValueError(f"image.dtype must be integer or floating, got {image.dtype}")
     if image.ndim not in (2, 3):
         raise ValueError(f"image.ndim must be 2 or 3, got {image.ndim}")
+    if method not in ("gaussian", "box"):
+        raise ValueError(f"method must be 'gaussian' or 'box', got {method!r}")
 
-    blurred = _gaussian_blur(image=image, sigma=sigma)
-    return _utils.apply_mask(image=image, transformed=blurred, mask=mask)
+    if mask is None:
+        return _gaussian_blur(image=image, sigma=sigma, method=method)
+    _utils.check_mask(image=image, mask=mask)
+
+    dst = image.copy()
+    _blur_within_mask(image=image, mask=mask, sigma=sigma, method=method, out=dst)
+    return dst
 
 
-def _gaussian_blur(image: NDArray, sigma: float) -> NDArray:
+def _blur_within_mask(
+    image: NDArray,
+    mask: NDArray[np.bool_],
+    sigma: float,
+    method: Literal["gaussian", "box"],
+    out: NDArray,
+) -> None:
+    H, W = image.shape[:2]
+    support = _blur_support(sigma=sigma, dtype=image.dtype, method=method)
+    patches: list[tuple[slice, slice, NDArray]] = []
+    for ys, xs in _utils.mask_regions(mask, gap=(2 * support, 2 * support)):
+        # Pixels within the support of the box see the same neighborhood as in
+        # the whole image, whose borders are clamped the same way.
+        y1 = max(ys.start - support, 0)
+        x1 = max(xs.start - support, 0)
+        y2 = min(ys.stop + support, H)
+        x2 = min(xs.stop + support, W)
+        blurred = _gaussian_blur(image=image[y1:y2, x1:x2], sigma=sigma, method=method)
+        blurred = blurred[ys.start - y1 : ys.stop - y1, xs.start - x1 : xs.stop - x1]
+        patches.append((ys, xs, blurred))
+    _utils.paste_within_mask(out=out, mask=mask, patches=patches)
+
+
+def _blur_support(
+    sigma: float, dtype: np.dtype, method: Literal["gaussian", "box"]
+) -> int:
+    if dtype == np.uint8:
+        # PIL approximates the Gaussian with 3 box blurs per axis, each of
+        # radius below n + 1 (see _dblur_radius in Pillow's BoxBlur.c), so an
+        # output pixel depends on inputs at most 3 * (n + 1) pixels away.
+        n = int(np.floor((np.sqrt(4 * sigma**2 + 1) - 1) / 2))
+        return 3 * (n + 1)
+    if method == "box":
+        return sum(_box_radii(sigma))
+    return int(np.ceil(_TRUNCATE * sigma))
+
+
+def _gaussian_blur(
+    image: NDArray, sigma: float, method: Literal["gaussian", "box"] = "gaussian"
+) -> NDArray:
+    if image.dtype != np.uint8:
+        return _separable_blur(image=image, sigma=sigma, method=method)
+
     if image.ndim == 2:
-        return _gaussian_blur_2d(arr=image, sigma=sigma)
+        return _pillow_blur(arr=image, sigma=sigma)
 
     C = image.shape[2]
+    if C in _PILLOW_MODES:
+        return _pillow_blur(arr=image, sigma=sigma)
     dst = np.empty_like(image)
-    for c in range(C):
-        dst[..., c] = _gaussian_blur_2d(arr=image[..., c], sigma=sigma)
+    for c in range(0, C, 4):
+        dst[..., c : c + 4] = _pillow_blur(arr=image[..., c : c + 4], sigma=sigma)
     return dst
 
 
-def _gaussian_blur_2d(arr: NDArray, sigma: float) -> NDArray:
-    pil = PIL.Image.fromarray(arr)
+def _pillow_blur(arr: NDArray[np.uint8], sigma: float) -> NDArray[np.uint8]:
+    if arr.ndim == 3 and arr.shape[2] == 1:
+        return _pillow_blur(arr=arr[:, :, 0], sigma=sigma)[:, :, None]
+    mode = "L" if arr.ndim == 2 else _PILLOW_MODES[arr.shape[2]]
+    pil = PIL.Image.fromarray(np.ascontiguousarray(arr), mode=mode)
     blurred = pil.filter(PIL.ImageFilter.GaussianBlur(radius=sigma))
     return np.asarray(blurred)
+
+
+def _separable_blur(
+    image: NDArray, sigma: float, method: Literal["gaussian", "box"]
+) -> NDArray:
+    dtype = np.float64 if image.dtype == np.float64 else np.float32
+    dst = image.astype(dtype)
+    if method == "box":
+        dst = _box_blur(dst, sigma=sigma)
+    else:
+        # Both passes filter along the first axis, whose slices are
+        # contiguous, so the second one runs on the transposed image.
+        for _ in range(2):
+            dst = _gaussian_pass(dst, sigma=sigma)
+            dst = np.ascontiguousarray(dst.swapaxes(0, 1))
+
+    if np.issubdtype(image.dtype, np.integer):
+        # Blurred values are weighted means, so they stay in the dtype's range.
+        return np.round(dst).astype(image.dtype)
+    return dst.astype(image.dtype, copy=False)
+
+
+def _gaussian_pass(arr: NDArray, sigma: float) -> NDArray:
+    radius = int(np.ceil(_TRUNCATE * sigma))
+    if radius == 0:
+        return arr
+    offsets = np.arange(-radius, radius + 1)
+    kernel = np.exp(-(offsets**2) / (2.0 * sigma**2))
+    kernel = (kernel / kernel.sum()).astype(arr.dtype)
+
+    padded = _pad_edge(arr, radius=radius)
+    n = len(arr)
+    if radius > _MAX_DIRECT_RADIUS:
+        # Outputs start 2 * radius into the circular convolution, so a length
+        # of n + 2 * radius keeps them clear of the wrap-around.
+        size = _utils.fft_size(n + 2 * radius)
+        spectrum = np.fft.rfft(padded, n=size, axis=0)
+        spectrum *= np.fft.rfft(kernel, n=size).reshape((-1,) + (1,) * (arr.ndim - 1))
+        convolved = np.fft.irfft(spectrum, n=size, axis=0)
+        return convolved[2 * radius : 2 * radius + n].astype(arr.dtype, copy=False)
+
+    dst = np.zeros_like(arr)
+    rows = max(1, _utils.CHUNK_SIZE // max(arr[0].size, 1))
+    weighted = np.empty_like(arr[:rows])
+    for y in range(0, n, rows):
+        band = dst[y : y + rows]
+        band_weighted = weighted[: len(band)]
+        for i, weight in enumerate(kernel):
+            np.multiply(padded[y + i : y + i + len(band)], weight, out=band_weighted)
+            band += band_weighted
+    return dst
+
+
+def _box_radii(sigma: float) -> list[int]:
+    # Radii of three box blurs whose variances, ((2 r + 1) ** 2 - 1) / 12 each,
+    # sum closest to sigma ** 2 with widths differing by at most 2 (Kovesi,
+    # "Fast almost-Gaussian filtering", 2010).
+    width = int(np.floor(np.sqrt(4 * sigma**2 + 1)))
+    if width % 2 == 0:
+        width -= 1
+    n_lower = int(
+        np.round((12 * sigma**2 - 3 * width**2 - 12 * width - 9) / (-4 * width - 4))
+    )
+    n_lower = min(max(n_lower, 0), 3)
+    radius = (width - 1) // 2
+    if radius == 0 and sigma > 0:
+        # Below sigma ~0.6 all three radii round to 0, which would leave the
+        # image unchanged, so one box of radius 1 is kept.
+        n_lower = min(n_lower, 2)
+    return [radius] * n_lower + [radius + 1] * (3 - n_lower)
+
+
+def _box_blur(arr: NDArray, sigma: float) -> NDArray:
+    # Channels are moved first, so both axes are filtered along the last,
+    # contiguous one, where np.cumsum is several times faster than along the
+    # first.
+    radii = _box_radii(sigma)
+    planes = arr if arr.ndim == 2 else np.moveaxis(arr, -1, 0)
+    for _ in range(2):
+        planes = _box_passes(np.ascontiguousarray(planes), radii=radii)
+        planes = planes.swapaxes(-1, -2)
+    if arr.ndim == 3:
+        planes = np.moveaxis(planes, 0, -1)
+    return np.ascontiguousarray(planes)
+
+
+def _box_passes(arr: NDArray, radii: list[int]) -> NDArray:
+    # Box blurs along the last axis, as window sums taken as differences of a
+    # float64 cumulative sum at constant cost per pixel whatever the radius.
+    # All passes run on one band of rows at a time, which stays in cache, and
+    # the sums are divided by the window widths once at the end.
+    n = arr.shape[-1]
+    rows = arr.reshape(-1, n)
+    dst = np.empty_like(rows)
+    max_radius = max(radii)
+    n_row = max(1, _utils.CHUNK_SIZE // (n + 2 * max_radius))
+    padded = np.empty((n_row, n + 2 * max_radius), dtype=np.float64)
+    cumsum = np.zeros((n_row, n + 2 * max_radius + 1), dtype=np.float64)
+    scale = 1 / np.prod([2 * radius + 1 for radius in radii])
+    for y in range(0, len(rows), n_row):
+        m = min(n_row, len(rows) - y)
+        band = padded[:m, max_radius : max_radius + n]
+        band[...] = rows[y : y + m]
+        for radius in radii:
+            if radius == 0:
+                continue
+            width = 2 * radius + 1
+            band_padded = padded[:m, max_radius - radius : max_radius + n + radius]
+            band_padded[:, :radius] = band[:, :1]
+            band_padded[:, radius + n :] = band[:, -1:]
+            band_cumsum = cumsum[:m, : n + width]
+            np.cumsum(band_padded, axis=1, out=band_cumsum[:, 1:])
+            np.subtract(band_cumsum[:, width:], band_cumsum[:, :-width], out=band)
+        np.multiply(band, scale, out=dst[y : y + m], casting="same_kind")
+    return dst.reshape(arr.shape)
+
+
+def _pad_edge(arr: NDArray, radius: int) -> NDArray:
+    pad_width = [(radius, radius)] + [(0, 0)] * (arr.ndim - 1)
+    return np.pad(arr, pad_width, mode="edge")
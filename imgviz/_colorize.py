@@ -1,17 +1,72 @@
 from __future__ import annotations
 
+import functools
 import typing
 from collections.abc import Callable
+from typing import Literal
 
 import cmap as _cmap
 import numpy as np
 from numpy.typing import NDArray
 
+from ._autorange import RangeEstimator
 from ._normalize import normalize
 
+# Integer dtypes colorized through a table over every representable value.
+_INTEGER_DTYPES: tuple[np.dtype, ...] = tuple(
+    np.dtype(t) for t in (np.uint8, np.int8, np.uint16, np.int16)
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _named_cmap(name: str) -> _cmap.Colormap:
+    return _cmap.Colormap(name)
+
+
+def _make_lut(
+    cmap_func: Callable[[NDArray], NDArray], lut_size: int
+) -> NDArray[np.float64]:
+    # Rows: under, lut_size colors, over and NaN, so a clipped and shifted bin
+    # index addresses every case.
+    if isinstance(cmap_func, _cmap.Colormap):
+        rgba = cmap_func.lut(N=lut_size, with_over_under=True)
+        colors, under, over = rgba[:lut_size], rgba[-3], rgba[-2]
+    else:
+        centers = (np.arange(lut_size) + 0.5) / lut_size
+        colors = np.asarray(cmap_func(centers), dtype=np.float64)
+        under, over = colors[0], colors[-1]
+    lut = np.zeros((lut_size + 3, 3), dtype=np.float64)
+    lut[0] = under[:3]
+    lut[1 : lut_size + 1] = colors[:, :3]
+    lut[lut_size + 1] = over[:3]
+    return lut
+
+
+def _window_key(value: float | NDArray) -> tuple[float, ...]:
+    return tuple(np.atleast_1d(value).astype(np.float64).tolist())
+
+
+def _lut_index(normalized: NDArray[np.float32], lut_size: int) -> NDArray:
+    # Same binning as cmap.Colormap: floor(x * N), with x == 1 in the last bin.
+    # Modifies normalized in-place.
+    normalized *= lut_size
+    normalized[normalized == lut_size] = lut_size - 1
+    np.floor(normalized, out=normalized)
+    np.clip(normalized, -1, lut_size, out=normalized)
+    normalized[np.isnan(normalized)] = lut_size + 1
+    normalized += 1
+    dtype = np.uint16 if lut_size + 3 <= 1 << 16 else np.intp
+    return normalized.astype(dtype)
+
 
 class Colorize:
-    """Apply a colormap to a 2D scalar field.
+    """Apply a colormap to a 2D scalar field, or a batch of them.
+
+    Float fields are normalized, then binned into the lookup table. 8/16-bit
+    integer fields (e.g. raw uint16 depth) skip normalization: every value of
+    the dtype is colorized once into a 256- or 65536-entry table, rebuilt only
+    when the window changes, and the image is a single gather into it. The
+    output equals colorizing the field cast to float32.
 
     Args:
         vmin: Minimum value for normalization. If ``None``, it is computed
@@ -21,6 +76,19 @@ class Colorize:
             ``vmin``.
         cmap: Colormap name or callable mapping values in [0, 1] to RGBA.
             A string name is resolved once at construction time.
+        lut_size: Number of colors in the lookup table the normalized values
+            are quantized into (e.g. 256, 1024 or 4096). The table is built
+            once per instance, so each call is a single gather into the
+            output. For :class:`cmap.Colormap` (and colormap names) 256 gives
+            exactly the colors of calling the colormap, which bins into 256
+            colors itself. Other callables are sampled at bin centers. None to
+            call the colormap on every pixel. 'auto' for 256 with a
+            :class:`cmap.Colormap` or colormap name, and None with any other
+            callable, so the default output is always exact.
+        autorange: Estimator updated from a subsample of every frame whose
+            range replaces the frozen vmin and vmax (those given explicitly
+            are kept), for streams whose range drifts. See
+            :class:`~imgviz.EmaRange` and :class:`~imgviz.PercentileRange`.
     """
 
     def __init__(
@@ -28,12 +96,26 @@ class Colorize:
         vmin: float | NDArray | None = None,
         vmax: float | NDArray | None = None,
         cmap: str | Callable[[NDArray], NDArray] = "viridis",
+        lut_size: int | Literal["auto"] | None = "auto",
+        autorange: RangeEstimator | None = None,
     ) -> None:
+        if lut_size != "auto" and lut_size is not None and lut_size < 1:
+            raise ValueError(
+                f"lut_size must be >= 1, 'auto' or None, but got {lut_size!r}"
+            )
         self._vmin = vmin
         self._vmax = vmax
+        self._autorange = autorange
+        self._autorange_vmin = vmin is None
+        self._autorange_vmax = vmax is None
         self._cmap_func: Callable[[NDArray], NDArray] = (
-            _cmap.Colormap(cmap) if isinstance(cmap, str) else cmap
+            _named_cmap(cmap) if isinstance(cmap, str) else cmap
         )
+        if lut_size == "auto":
+            lut_size = 256 if isinstance(self._cmap_func, _cmap.Colormap) else None
+        self._lut_size: int | None = lut_size
+        self._luts: dict[np.dtype, NDArray] = {}
+        self._integer_lut: tuple[typing.Any, NDArray, NDArray, NDArray] | None = None
 
     @property
     def vmin(self) -> float | NDArray | None:
@@ -74,15 +156,38 @@ class Colorize:
     def __call__(
         self, scalar: NDArray, dtype: type[np.uint8] | type[np.floating] = np.uint8
     ) -> NDArray[np.uint8] | NDArray[np.floating]:
-        if scalar.ndim != 2:
-            raise ValueError(f"scalar must be 2 dimensional, but got {scalar.ndim}")
-        if not np.issubdtype(scalar.dtype, np.floating):
-            raise ValueError(f"scalar dtype must be float, but got {scalar.dtype}")
+        if scalar.ndim not in (2, 3):
+            raise ValueError(
+                f"scalar must be 2 dimensional, or 3 dimensional with a batch "
+                f"axis, but got {scalar.ndim}"
+            )
+        is_integer = scalar.dtype in _INTEGER_DTYPES
+        if not (is_integer or np.issubdtype(scalar.dtype, np.floating)):
+            raise ValueError(
+                f"scalar dtype must be float or 8/16-bit integer, "
+                f"but got {scalar.dtype}"
+            )
         if dtype is not np.uint8 and not np.issubdtype(dtype, np.floating):
             raise ValueError(
                 f"dtype must be np.uint8 or a floating type, but got {dtype}"
             )
 
+        if scalar.ndim == 3:
+            # Frames are stacked into one image, so the whole batch shares one
+            # normalization and one lookup table.
+            rgb = self(scalar.reshape(-1, scalar.shape[-1]), dtype=dtype)
+            return rgb.reshape(scalar.shape + (3,))
+
+        if self._autorange is not None:
+            self._autorange.update(self._autorange.subsample(scalar))
+            if self._autorange_vmin and self._autorange.vmin is not None:
+                self._vmin = self._autorange.vmin
+            if self._autorange_vmax and self._autorange.vmax is not None:
+                self._vmax = self._autorange.vmax
+
+        if is_integer:
+            return self._colorize_integer(scalar, dtype=dtype)
+
         normalized, auto_vmin, auto_vmax = normalize(
             scalar,
             min_value=self._vmin,
@@ -94,6 +199,42 @@ class Colorize:
         if self._vmax is None:
             self._vmax = auto_vmax
 
+        return self._colorize_normalized(normalized, dtype=dtype)
+
+    def _colorize_integer(
+        self, scalar: NDArray[np.integer], dtype: type[np.uint8] | type[np.floating]
+    ) -> NDArray[np.uint8] | NDArray[np.floating]:
+        # Every value of an 8/16-bit dtype is colorized once into a 256- or
+        # 65536-entry table, which the image then indexes by its bit pattern.
+        vmin = scalar.min() if self._vmin is None else self._vmin
+        vmax = scalar.max() if self._vmax is None else self._vmax
+        key = (scalar.dtype, np.dtype(dtype), _window_key(vmin), _window_key(vmax))
+        if self._integer_lut is None or self._integer_lut[0] != key:
+            unsigned = np.dtype(f"u{scalar.dtype.itemsize}")
+            values = np.arange(1 << (8 * unsigned.itemsize), dtype=unsigned)
+            normalized, vmin, vmax = normalize(
+                values.view(scalar.dtype)[None],
+                min_value=vmin,
+                max_value=vmax,
+                return_minmax=True,
+            )
+            table = self._colorize_normalized(normalized, dtype=dtype)[0]
+            self._integer_lut = (key, table, vmin, vmax)
+        _, table, vmin, vmax = self._integer_lut
+
+        if self._vmin is None:
+            self._vmin = vmin
+        if self._vmax is None:
+            self._vmax = vmax
+        return table.take(scalar.view(f"u{scalar.dtype.itemsize}"), axis=0)
+
+    def _colorize_normalized(
+        self, normalized: NDArray[np.float32], dtype: type[np.uint8] | type[np.floating]
+    ) -> NDArray[np.uint8] | NDArray[np.floating]:
+        if self._lut_size is not None:
+            lut = self._get_lut(np.dtype(dtype))
+            return lut.take(_lut_index(normalized, lut_size=self._lut_size), axis=0)
+
         isnan = np.isnan(normalized)
         normalized[isnan] = 0
 
@@ -107,6 +248,18 @@ class Colorize:
 
         return rgb
 
+    def _get_lut(self, dtype: np.dtype) -> NDArray:
+        lut = self._luts.get(dtype)
+        if lut is None:
+            assert self._lut_size is not None
+            lut = _make_lut(self._cmap_func, lut_size=self._lut_size)
+            if dtype == np.uint8:
+                lut = (lut * 255).round().astype(np.uint8)
+            else:
+                lut = lut.astype(dtype)
+            self._luts[dtype] = lut
+        return lut
+
 
 @typing.overload
 def colorize(
@@ -115,6 +268,7 @@ def colorize(
     vmax: float | NDArray | None = ...,
     cmap: str | Callable[[NDArray], NDArray] = ...,
     dtype: type[np.uint8] = ...,
+    lut_size: int | Literal["auto"] | None = ...,
 ) -> NDArray[np.uint8]: ...
 
 
@@ -125,6 +279,7 @@ def colorize(
     vmax: float | NDArray | None = ...,
     cmap: str | Callable[[NDArray], NDArray] = ...,
     dtype: type[np.float32] = ...,
+    lut_size: int | Literal["auto"] | None = ...,
 ) -> NDArray[np.float32]: ...
 
 
@@ -135,6 +290,7 @@ def colorize(
     vmax: float | NDArray | None = ...,
     cmap: str | Callable[[NDArray], NDArray] = ...,
     dtype: type[np.float64] = ...,
+    lut_size: int | Literal["auto"] | None = ...,
 ) -> NDArray[np.float64]: ...
 
 
@@ -145,6 +301,7 @@ def colorize(
     vmax: float | NDArray | None = ...,
     cmap: str | Callable[[NDArray], NDArray] = ...,
     dtype: type[np.floating] = ...,
+    lut_size: int | Literal["auto"] | None = ...,
 ) -> NDArray[np.floating]: ...
 
 
@@ -154,6 +311,7 @@ def colorize(
     vmax: float | NDArray | None = None,
     cmap: str | Callable[[NDArray], NDArray] = "viridis",
     dtype: type[np.uint8] | type[np.floating] = np.uint8,
+    lut_size: int | Literal["auto"] | None = "auto",
 ) -> NDArray[np.uint8] | NDArray[np.floating]:
     """Apply a colormap to a 2D scalar field.
 
@@ -161,13 +319,20 @@ def colorize(
     score fields, single-channel model outputs.
 
     Args:
-        scalar: 2D scalar field with shape (H, W).
+        scalar: 2D scalar field with shape (H, W), or a batch with shape
+            (N, H, W) normalized as a whole, either float or 8/16-bit integer.
         vmin: Minimum value for normalization.
         vmax: Maximum value for normalization.
         cmap: Colormap name or callable mapping values in [0, 1] to RGBA.
         dtype: Output dtype.
+        lut_size: Number of colors in the lookup table, see
+            :class:`~imgviz.Colorize`. None to call the colormap per pixel,
+            'auto' for 256 with a :class:`cmap.Colormap` or name and None
+            otherwise.
 
     Returns:
-        Colorized image with shape (H, W, 3).
+        Colorized image with shape (H, W, 3), or (N, H, W, 3) for a batch.
     """
-    return Colorize(vmin=vmin, vmax=vmax, cmap=cmap)(scalar, dtype=dtype)
+    return Colorize(vmin=vmin, vmax=vmax, cmap=cmap, lut_size=lut_size)(
+        scalar, dtype=dtype
+    )
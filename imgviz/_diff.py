@@ -6,6 +6,7 @@ from typing import Literal
 import numpy as np
 from numpy.typing import NDArray
 
+from . import _ssim
 from ._colorize import colorize
 
 
@@ -39,8 +40,9 @@ def diff(
         b: Second image with the same shape as ``a``.
         mode: ``"signed"`` maps ``a - b`` onto a diverging colormap centered at
             zero, ``"abs"`` maps ``|a - b|`` onto a sequential colormap, and
-            ``"ssim"`` colorizes the local SSIM map (requires scikit-image and
-            both image dimensions to be at least 7 pixels).
+            ``"ssim"`` colorizes the local SSIM map over 7x7 windows (requires
+            both image dimensions to be at least 7 pixels); windows with NaN
+            are NaN.
         vmin: Lower bound for the colormap. Mode-specific defaults:
 
             - ``"signed"``: if both ``vmin`` and ``vmax`` are ``None``, the
@@ -98,15 +100,6 @@ def diff(
         return colorize(magnitude, vmin=vmin, vmax=vmax, cmap="magma")
 
     if mode == "ssim":
-        try:
-            import scipy.ndimage
-            import skimage.metrics
-        except ImportError:
-            raise ImportError(
-                "scikit-image is required for mode='ssim'. "
-                "Please install scikit-image or use: pip install imgviz[all]"
-            ) from None
-
         WIN_SIZE: Final = 7
         if min(luminance_a.shape) < WIN_SIZE:
             raise ValueError(
@@ -131,33 +124,11 @@ def diff(
             obs_max = max(float(np.nanmax(luminance_a)), float(np.nanmax(luminance_b)))
             data_range = obs_max - obs_min if obs_max > obs_min else 1.0
 
-        # scipy's uniform filter (used inside structural_similarity) uses a
-        # cumsum implementation that spreads NaN across the whole image, so a
-        # single NaN would collapse the entire SSIM map. Replace NaN with any
-        # finite value before the call; the win_size neighborhood of every
-        # original NaN is re-marked below, so the fill never reaches the
-        # visible output.
-        if nan_mask.any():
-            sanitized_a = np.where(np.isnan(luminance_a), 0.0, luminance_a)
-            sanitized_b = np.where(np.isnan(luminance_b), 0.0, luminance_b)
-        else:
-            sanitized_a = luminance_a
-            sanitized_b = luminance_b
-
-        _, similarity = skimage.metrics.structural_similarity(
-            sanitized_a,
-            sanitized_b,
-            data_range=data_range,
-            win_size=WIN_SIZE,
-            full=True,
+        # Windows that contain NaN in either image come out as NaN.
+        similarity = _ssim.structural_similarity(
+            luminance_a, luminance_b, data_range=data_range, win_size=WIN_SIZE
         )
 
-        if nan_mask.any():
-            affected = scipy.ndimage.maximum_filter(
-                nan_mask.astype(np.uint8), size=WIN_SIZE
-            ).astype(bool)
-            similarity[affected] = np.nan
-
         return colorize(similarity, vmin=vmin, vmax=vmax, cmap="viridis")
 
     raise ValueError(f"mode must be 'signed', 'abs' or 'ssim', but got {mode!r}")
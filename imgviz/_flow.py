@@ -4,11 +4,18 @@
 # https://github.com/tomrunia/OpticalFlow_Visualization/blob/master/flow_vis.py
 from __future__ import annotations
 
+import functools
 import typing
 
 import numpy as np
 from numpy.typing import NDArray
 
+from . import _utils
+from . import draw as draw_module
+from ._autorange import RangeEstimator
+from ._color import asrgb
+from .draw import Ink
+
 
 def _make_colorwheel() -> NDArray[np.floating]:
     RY = 15
@@ -48,44 +55,87 @@ def _make_colorwheel() -> NDArray[np.floating]:
     return colorwheel
 
 
-def _flow_compute_color(flow_u: NDArray, flow_v: NDArray) -> NDArray[np.uint8]:
-    H, W = flow_u.shape[:2]
-    flow_image = np.zeros((H, W, 3), np.uint8)
-
-    colorwheel = _make_colorwheel()  # shape [55x3]
-    ncols = colorwheel.shape[0]
-
-    rad = np.sqrt(np.square(flow_u) + np.square(flow_v))
-    a = np.arctan2(-flow_v, -flow_u) / np.pi
-
-    fk = (a + 1) / 2 * (ncols - 1) + 1
-    k0 = np.floor(fk).astype(np.int32)
-    f = fk - k0
-    k0[k0 == ncols] = 1  # angle +pi wraps to the wheel start, same as -pi
-    k1 = k0 + 1
-    k1[k1 == ncols] = 1
-
-    for i in range(colorwheel.shape[1]):
-        tmp = colorwheel[:, i]
-        col0 = tmp[k0] / 255.0
-        col1 = tmp[k1] / 255.0
-        col = (1 - f) * col0 + f * col1
+@functools.lru_cache(maxsize=1)
+def _colorwheel() -> NDArray[np.float32]:
+    # One contiguous row of the wheel per channel, scaled to [0, 1].
+    colorwheel = np.ascontiguousarray((_make_colorwheel() / 255.0).T, np.float32)
+    colorwheel.setflags(write=False)
+    return colorwheel
 
-        idx = rad <= 1
-        col[idx] = 1 - rad[idx] * (1 - col[idx])
-        col[~idx] = col[~idx] * 0.75  # out of range?
 
-        ch_idx = i
-        flow_image[:, :, ch_idx] = np.floor(255 * col)
+def _flow_compute_color(flow_u: NDArray, flow_v: NDArray) -> NDArray[np.uint8]:
+    # Each channel is floor(255 * color), where color interpolates the wheel
+    # by angle and then fades to white inside the unit radius (darkens to 75%
+    # outside). Evaluated in float32 over bands of rows: the angle and wheel
+    # position match the float64 reference exactly, and the blend differs by
+    # a few float32 ulps, so a channel is off by at most 1.
+    H, W = flow_u.shape[:2]
+    flow_image = np.empty((H, W, 3), np.uint8)
+
+    colorwheel = _colorwheel()  # shape [3x55]
+    ncols = colorwheel.shape[1]
+
+    band = max(1, _utils.CHUNK_SIZE // max(W, 1))
+    for y in range(0, H, band):
+        u = flow_u[y : y + band].astype(np.float32, copy=False)
+        v = flow_v[y : y + band].astype(np.float32, copy=False)
+
+        rad = np.sqrt(np.square(u) + np.square(v))
+        a = np.arctan2(-v, -u) / np.pi
+
+        fk = (a + 1) / 2 * (ncols - 1) + 1
+        k0f = np.floor(fk)
+        f = fk - k0f
+        k0 = k0f.astype(np.intp)
+        k0[k0 == ncols] = 1  # angle +pi wraps to the wheel start, same as -pi
+        k1 = k0 + 1
+        k1[k1 == ncols] = 1
+
+        # 255 * (1 - rad * (1 - col)) inside the unit radius, 255 * 0.75 * col
+        # outside, as one affine map of col shared by the channels.
+        inside = rad <= 1
+        gain = np.where(inside, rad, np.float32(0.75))
+        gain *= 255
+        offset = np.where(inside, 1 - rad, np.float32(0))
+        offset *= 255
+
+        out = flow_image[y : y + band]
+        for i in range(3):
+            col = colorwheel[i].take(k0)
+            delta = colorwheel[i].take(k1)
+            delta -= col
+            delta *= f
+            col += delta
+            col *= gain
+            col += offset
+            np.copyto(out[:, :, i], col, casting="unsafe")
 
     return flow_image
 
 
 class Flow2Rgb:
-    def __init__(self, max_norm: float | np.floating | None = None) -> None:
+    """Visualize optical flow with a color wheel.
+
+    Args:
+        max_norm: Flow norm mapped to full saturation. If None, it is the
+            maximum norm of the first call's input, reused for every
+            subsequent call.
+        autorange: Estimator of the flow norm range, updated from a subsample
+            of every frame; its vmax replaces the frozen max_norm. See
+            :class:`~imgviz.EmaRange` and :class:`~imgviz.PercentileRange`.
+    """
+
+    def __init__(
+        self,
+        max_norm: float | np.floating | None = None,
+        autorange: RangeEstimator | None = None,
+    ) -> None:
+        if max_norm is not None and autorange is not None:
+            raise ValueError("max_norm and autorange are mutually exclusive")
         self._max_norm: np.float32 | None = (
             None if max_norm is None else np.float32(max_norm)
         )
+        self._autorange = autorange
 
     @property
     def max_norm(self) -> np.float32 | None:
@@ -95,11 +145,19 @@ class Flow2Rgb:
         """Visualize optical flow.
 
         Args:
-            flow_uv: Optical flow with shape (H, W, 2).
+            flow_uv: Optical flow with shape (H, W, 2), or a batch with shape
+                (N, H, W, 2).
 
         Returns:
-            RGB image with shape (H, W, 3).
+            RGB image with shape (H, W, 3), or (N, H, W, 3) for a batch.
         """
+        if self._autorange is not None:
+            frames = flow_uv.reshape((-1,) + flow_uv.shape[-2:])
+            samples = self._autorange.subsample(frames).astype(np.float32)
+            self._autorange.update(np.linalg.norm(samples, axis=-1))
+            if self._autorange.vmax is not None:
+                self._max_norm = np.float32(self._autorange.vmax)
+
         flow_viz, max_norm = flow2rgb(flow_uv, max_norm=self._max_norm, return_max=True)
         if self._max_norm is None:
             self._max_norm = max_norm
@@ -129,27 +187,48 @@ def flow2rgb(
 ) -> NDArray[np.uint8] | tuple[NDArray[np.uint8], np.float32]:
     """Visualize optical flow.
 
+    Colors are evaluated in float32 from a cached color wheel and are within 1
+    per channel of the float64 evaluation of the same wheel.
+
     Args:
-        flow_uv: Optical flow with shape (H, W, 2).
+        flow_uv: Optical flow with shape (H, W, 2), or a batch with shape
+            (N, H, W, 2) sharing one max_norm.
         max_norm: Maximum norm for normalization. If None, use the maximum norm
             in the flow_uv.
         return_max: Whether to return the maximum norm used for normalization.
 
     Returns:
-        RGB image with shape (H, W, 3), or tuple of (flow_rgb, max_norm).
+        RGB image with shape (H, W, 3) ((N, H, W, 3) for a batch), or tuple of
+        (flow_rgb, max_norm).
     """
-    if flow_uv.ndim != 3:
-        raise ValueError(f"flow must be 3 dimensional, but got {flow_uv.ndim}")
-    if flow_uv.shape[2] != 2:
+    if flow_uv.ndim not in (3, 4):
+        raise ValueError(
+            f"flow must be 3 dimensional, or 4 dimensional with a batch axis, "
+            f"but got {flow_uv.ndim}"
+        )
+    if flow_uv.shape[-1] != 2:
         raise ValueError(f"flow must have shape (H, W, 2), but got {flow_uv.shape}")
     if not np.issubdtype(flow_uv.dtype, np.floating):
         raise ValueError(f"flow dtype must be float, but got {flow_uv.dtype}")
 
+    if flow_uv.ndim == 4:
+        # Frames are stacked into one flow field sharing the normalization.
+        flow_rgb, max_norm = flow2rgb(
+            flow_uv.reshape(-1, *flow_uv.shape[-2:]),
+            max_norm=max_norm,
+            return_max=True,
+        )
+        flow_rgb = flow_rgb.reshape(flow_uv.shape[:-1] + (3,))
+        if return_max:
+            return flow_rgb, max_norm
+        return flow_rgb
+
     flow_uv = flow_uv.astype(np.float32)
 
     if max_norm is None:
-        norm: NDArray[np.float32] = np.linalg.norm(flow_uv, axis=2)
-        max_norm = norm.max()
+        # sqrt is monotonic, so take it once on the largest squared norm.
+        norm_sq = np.square(flow_uv[:, :, 0]) + np.square(flow_uv[:, :, 1])
+        max_norm = np.sqrt(norm_sq.max())
     else:
         max_norm = np.float32(max_norm)
 
@@ -162,3 +241,109 @@ def flow2rgb(
         return flow_rgb, max_norm
     else:
         return flow_rgb
+
+
+def flow2quiver(
+    flow_uv: NDArray[np.floating],
+    image: NDArray[np.uint8] | None = None,
+    stride: int = 16,
+    scale: float | None = None,
+    color: Ink | None = None,
+    width: int = 1,
+    head_length_ratio: float = 0.3,
+    head_angle: float = 30.0,
+    max_norm: float | np.floating | None = None,
+) -> NDArray[np.uint8]:
+    """Visualize optical flow as arrows sampled on a grid.
+
+    The flow is sampled at the center of every ``stride`` x ``stride`` cell
+    and all arrows are drawn in one pass with :func:`~imgviz.draw.arrows`.
+
+    Args:
+        flow_uv: Optical flow with shape (H, W, 2), or a batch with shape
+            (N, H, W, 2) sharing one scale and max_norm.
+        image: Background image with shape (H, W), (H, W, 3) or (H, W, 4),
+            with a leading (N,) axis for a batch; the alpha of RGBA is
+            dropped. If None, a black background.
+        stride: Spacing in pixels between sampled vectors.
+        scale: Arrow length in pixels per unit of flow. If None, the longest
+            sampled vector spans ``stride`` pixels.
+        color: Color of every arrow. If None, each arrow takes the
+            :func:`~imgviz.flow2rgb` color of its vector.
+        width: Line width.
+        head_length_ratio: Arrowhead length as a fraction of the shaft length.
+        head_angle: Half-angle of the arrowhead in degrees.
+        max_norm: Maximum norm for the arrow colors, see
+            :func:`~imgviz.flow2rgb`. If None, use the maximum norm in the
+            flow_uv.
+
+    Returns:
+        RGB image with shape (H, W, 3), or (N, H, W, 3) for a batch.
+    """
+    if flow_uv.ndim not in (3, 4):
+        raise ValueError(
+            f"flow must be 3 dimensional, or 4 dimensional with a batch axis, "
+            f"but got {flow_uv.ndim}"
+        )
+    if flow_uv.shape[-1] != 2:
+        raise ValueError(f"flow must have shape (H, W, 2), but got {flow_uv.shape}")
+    if not np.issubdtype(flow_uv.dtype, np.floating):
+        raise ValueError(f"flow dtype must be float, but got {flow_uv.dtype}")
+    if stride < 1:
+        raise ValueError(f"stride must be >= 1, but got {stride}")
+
+    height, width_image = flow_uv.shape[-3:-1]
+    frames = flow_uv.reshape((-1,) + flow_uv.shape[-3:])
+    if image is None:
+        canvas = np.zeros(frames.shape[:-1] + (3,), dtype=np.uint8)
+    else:
+        if image.shape[: flow_uv.ndim - 1] != flow_uv.shape[:-1]:
+            raise ValueError(
+                f"image must have shape {flow_uv.shape[:-1]} with optional "
+                f"channels, but got {image.shape}"
+            )
+        image_frames = image.reshape(
+            frames.shape[:-1] + image.shape[flow_uv.ndim - 1 :]
+        )
+        # Grayscale is expanded and RGBA drops its alpha, as with asrgb.
+        canvas = np.stack([asrgb(frame, copy=True) for frame in image_frames])
+
+    ys = np.arange(stride // 2, height, stride)
+    xs = np.arange(stride // 2, width_image, stride)
+    tails = np.stack(np.meshgrid(ys, xs, indexing="ij"), axis=-1).reshape(-1, 2)
+    vectors = frames[:, ys][:, :, xs].reshape(len(frames), -1, 2).astype(np.float32)
+    valid = np.isfinite(vectors).all(axis=-1)
+
+    if scale is None:
+        # In float64, so that vectors near the float32 limit do not overflow.
+        norm = np.linalg.norm(vectors[valid].astype(np.float64), axis=-1)
+        longest = float(norm.max()) if norm.size else 0.0
+        scale = stride / longest if longest > 0 else 1.0
+    if color is None and max_norm is None:
+        # Same maximum as flow2rgb(flow_uv), so arrows match its colors.
+        # NaN or infinite vectors are not drawn, so they are left out of it.
+        flow_u = frames[..., 0].astype(np.float32)
+        flow_v = frames[..., 1].astype(np.float32)
+        norm_sq = np.square(flow_u) + np.square(flow_v)
+        max_norm = np.sqrt(norm_sq.max(initial=0, where=np.isfinite(norm_sq)))
+
+    for frame_canvas, frame_vectors, frame_valid in zip(canvas, vectors, valid):
+        frame_vectors = frame_vectors[frame_valid]
+        frame_tails = tails[frame_valid]
+        # Flow is (u, v) = (dx, dy), arrows are (y, x).
+        # Tips far outside the image are clipped by draw.arrows.
+        frame_tips = frame_tails + scale * frame_vectors[:, ::-1].astype(np.float64)
+        if color is None:
+            fill = flow2rgb(frame_vectors[None], max_norm=max_norm)[0]
+        else:
+            fill = color
+        frame_canvas[...] = draw_module.arrows(
+            frame_canvas,
+            yx1=frame_tails,
+            yx2=frame_tips,
+            fill=fill,
+            width=width,
+            head_length_ratio=head_length_ratio,
+            head_angle=head_angle,
+        )
+    return canvas.reshape(flow_uv.shape[:-1] + (3,))
@@ -1,27 +1,61 @@
 from __future__ import annotations
 
+import collections
+from collections.abc import Callable
+from typing import Literal
+
 import numpy as np
 from numpy.typing import ArrayLike
 from numpy.typing import NDArray
 
+from . import _utils
+from ._colorize import colorize
+
+# FFT round-off relative to a bound on the density, ||grid||_2 * ||kernel||_2,
+# below which splatted densities are zeroed. The round-off is about 1e-16 of
+# the bound and spreads over the whole grid, negative values included.
+_RESIDUE_TOLERANCE: float = 64 * float(np.finfo(np.float64).eps)
+
+# Half-lives between rescalings of a decaying Heatmap's grid, which keeps the
+# weights of new points below 2**16 times those of the oldest ones.
+_REBASE_HALF_LIVES: float = 16.0
+
 
 def heatmap(
     points: ArrayLike,
     shape: tuple[int, int],
     sigma: float = 10.0,
     weights: ArrayLike | None = None,
+    method: Literal["exact", "bilinear", "nearest"] = "exact",
 ) -> NDArray[np.float64]:
     """Render a 2D Gaussian density heatmap from a list of points.
 
     Each point contributes an isotropic Gaussian with peak equal to its weight,
-    and the contributions are summed, so denser clusters appear brighter. The
-    result is a 2D float field that pipes directly into ``imgviz.colorize``.
+    truncated at +-ceil(3 sigma), and the contributions are summed, so denser
+    clusters appear brighter. The result is a 2D float field that pipes
+    directly into ``imgviz.colorize``.
+
+    With ``method='bilinear'`` or ``'nearest'`` the weighted points are
+    instead splatted onto the pixel grid with one ``np.bincount`` and the grid
+    is convolved once with the separable Gaussian via a float64 FFT of the
+    padded frame, so the cost no longer grows with the number of points, at
+    the memory of a complex128 spectrum of the frame (about 130 MB for 4K).
+    Points on integer coordinates give the exact density; sub-pixel positions
+    are spread bilinearly to the 4 nearest pixels, which differs from the
+    exact density by at most ``0.25 / sigma**2 + 0.012`` times each point's
+    weight (the constant comes from the truncation at 3 sigma). The FFT
+    round-off is zeroed, so the density is non-negative and zero outside the
+    truncated Gaussians, and the weights must be non-negative.
 
     Args:
         points: Points (y, x) with shape (N, 2), in pixel coordinates.
         shape: Output shape (H, W).
         sigma: Standard deviation of each Gaussian, in pixels.
         weights: Optional per-point weights with shape (N,). Defaults to ones.
+        method: 'exact' to evaluate every point's Gaussian at its sub-pixel
+            position, which costs O(N sigma**2), 'bilinear' to splat each
+            point to its 4 nearest pixels, or 'nearest' to its nearest pixel
+            (at most ``0.5 / sigma`` times the weight off the exact density).
 
     Returns:
         Density field with shape (H, W); an all-zeros field when no points.
@@ -31,26 +65,22 @@ def heatmap(
         >>> density = imgviz.heatmap([(100, 150), (200, 300)], shape=(400, 600))
         >>> viz = imgviz.colorize(density)
     """
-    points = np.asarray(points, dtype=float)
-    if points.ndim == 1 and points.size == 0:
-        points = points.reshape(0, 2)
     height, width = shape
     if not np.isfinite(sigma) or sigma <= 0:
         raise ValueError(f"sigma must be a finite positive number, got {sigma}")
-    if points.ndim != 2 or points.shape[1] != 2:
-        raise ValueError(f"points must have shape (N, 2), got {points.shape}")
-    if not np.all(np.isfinite(points)):
-        raise ValueError("points must contain only finite values")
-    if weights is None:
-        weights = np.ones(len(points), dtype=float)
-    else:
-        weights = np.asarray(weights, dtype=float)
-        if weights.shape != (len(points),):
-            raise ValueError(
-                f"weights must have shape ({len(points)},), got {weights.shape}"
-            )
-        if not np.all(np.isfinite(weights)):
-            raise ValueError("weights must contain only finite values")
+    points, weights = _check_points(points, weights)
+
+    if method in ("bilinear", "nearest"):
+        _check_non_negative(weights)
+        splatter = _Splatter(shape=(height, width), sigma=sigma, method=method)
+        grid = np.bincount(
+            *splatter.splat(points, weights), minlength=splatter.grid_size
+        )
+        return splatter.convolve(grid)
+    if method != "exact":
+        raise ValueError(
+            f"method must be 'exact', 'bilinear' or 'nearest', but got {method!r}"
+        )
 
     # Evaluate each Gaussian only over its significant +-3 sigma window (clipped
     # to the image) so cost scales with sigma, not with the image size.
@@ -70,3 +100,306 @@ def heatmap(
         window = np.exp(-((ys - py) ** 2 + (xs - px) ** 2) / two_sigma_sq)
         density[y0:y1, x0:x1] += weight * window
     return density
+
+
+class Heatmap:
+    """Gaussian density heatmap accumulated over a stream of points.
+
+    The instance owns a float32 grid the points of each :meth:`add` are
+    splatted into, as in ``heatmap(method='bilinear')``, so adding costs
+    O(batch) and rendering one FFT convolution of the grid, whatever the
+    number of points added so far. Old points can fade out exponentially
+    with ``half_life``, or be removed once older than ``window``; both are
+    measured in the units of the ``time`` given to :meth:`add`.
+
+    Args:
+        shape: Output shape (H, W).
+        sigma: Standard deviation of each Gaussian, in pixels.
+        half_life: Time after which a point's weight is halved. None to never
+            decay.
+        window: Points added at ``time`` or earlier are removed once the
+            current time exceeds ``time + window``. None to keep them forever.
+            Points within the window are kept to be subtracted at expiry.
+        method: 'bilinear' or 'nearest', see :func:`~imgviz.heatmap`.
+
+    Example:
+        >>> heat = imgviz.Heatmap(shape=(480, 640), half_life=30)
+        >>> colorizer = imgviz.Colorize(autorange=imgviz.EmaRange())
+        >>> for gaze_points in stream:
+        ...     heat.add(gaze_points)
+        ...     viz = heat.render(colorizer)
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, int],
+        sigma: float = 10.0,
+        half_life: float | None = None,
+        window: float | None = None,
+        method: Literal["bilinear", "nearest"] = "bilinear",
+    ) -> None:
+        if not np.isfinite(sigma) or sigma <= 0:
+            raise ValueError(f"sigma must be a finite positive number, got {sigma}")
+        if half_life is not None and not (np.isfinite(half_life) and half_life > 0):
+            raise ValueError(
+                f"half_life must be a finite positive number or None, "
+                f"but got {half_life}"
+            )
+        if window is not None and not window > 0:
+            raise ValueError(f"window must be > 0 or None, but got {window}")
+        if method not in ("bilinear", "nearest"):
+            raise ValueError(
+                f"method must be 'bilinear' or 'nearest', but got {method!r}"
+            )
+        self._splatter = _Splatter(shape=shape, sigma=sigma, method=method)
+        self._sigma = sigma
+        self._half_life = half_life
+        self._window = window
+        self._grid = np.zeros(self._splatter.grid_size, dtype=np.float32)
+        self._time = 0.0
+        # With decay the grid holds weights scaled by 2 ** ((t - ref) /
+        # half_life) for points added at t, so a point is added without
+        # touching the rest of the grid; ref is moved forward, rescaling the
+        # grid once, before the scales grow too large for float32.
+        self._reference_time = 0.0
+        self._batches: collections.deque[
+            tuple[float, NDArray[np.intp], NDArray[np.float64]]
+        ] = collections.deque()
+        # Live splats per grid cell, so a cell whose points have all expired
+        # is reset to exactly 0 instead of the float32 residue of subtracting
+        # them.
+        self._counts: NDArray[np.int32] | None = None
+        if window is not None:
+            self._counts = np.zeros(self._splatter.grid_size, dtype=np.int32)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self._splatter.shape
+
+    @property
+    def sigma(self) -> float:
+        return self._sigma
+
+    @property
+    def time(self) -> float:
+        """Time of the latest :meth:`add` or :meth:`density`."""
+        return self._time
+
+    def add(
+        self,
+        points: ArrayLike,
+        weights: ArrayLike | None = None,
+        time: float | None = None,
+    ) -> None:
+        """Add a batch of points.
+
+        Args:
+            points: Points (y, x) with shape (N, 2), in pixel coordinates.
+            weights: Optional non-negative per-point weights with shape
+                (N,). Defaults to ones.
+            time: Time of the batch, not earlier than the current time. None
+                for one time unit after the current time.
+        """
+        points, weights = _check_points(points, weights)
+        _check_non_negative(weights)
+        self._advance(self._time + 1 if time is None else time)
+        index, values = self._splatter.splat(points, weights)
+        if self._counts is not None:
+            self._batches.append((self._time, index, values))
+            np.add.at(self._counts, index, 1)
+        np.add.at(self._grid, index, values * self._scale(self._time))
+
+    def density(self, time: float | None = None) -> NDArray[np.float32]:
+        """Render the density field.
+
+        Args:
+            time: Time to render at, which decays and expires points as
+                :meth:`add` would. None for the current time.
+
+        Returns:
+            Non-negative density field with shape (H, W) and dtype
+            np.float32, zero outside the truncated Gaussians of the points.
+        """
+        if time is not None:
+            self._advance(time)
+        density = self._splatter.convolve(self._grid)
+        if self._half_life is not None:
+            density *= 1 / self._scale(self._time)
+        return density.astype(np.float32, copy=False)
+
+    def render(
+        self,
+        colorizer: Callable[[NDArray], NDArray] | None = None,
+        time: float | None = None,
+    ) -> NDArray[np.uint8]:
+        """Render the density field to an RGB image.
+
+        Args:
+            colorizer: Callable such as :class:`~imgviz.Colorize`, which can
+                keep a fixed or :class:`~imgviz.EmaRange` value range across
+                renders. None for :func:`~imgviz.colorize` with the range of
+                this density.
+            time: Time to render at, see :meth:`density`.
+
+        Returns:
+            RGB image with shape (H, W, 3).
+        """
+        density = self.density(time=time)
+        if colorizer is None:
+            return colorize(density)
+        return colorizer(density)
+
+    def _advance(self, time: float) -> None:
+        if not np.isfinite(time) or time < self._time:
+            raise ValueError(
+                f"time must be finite and >= the current time {self._time}, "
+                f"but got {time}"
+            )
+        self._time = float(time)
+
+        if self._counts is not None:
+            assert self._window is not None
+            while self._batches and self._batches[0][0] + self._window < time:
+                batch_time, index, values = self._batches.popleft()
+                np.subtract.at(self._grid, index, values * self._scale(batch_time))
+                np.subtract.at(self._counts, index, 1)
+                self._grid[index[self._counts[index] == 0]] = 0
+
+        if (
+            self._half_life is not None
+            and time - self._reference_time > _REBASE_HALF_LIVES * self._half_life
+        ):
+            self._grid *= np.float32(1 / self._scale(time))
+            self._reference_time = self._time
+
+    def _scale(self, time: float) -> float:
+        if self._half_life is None:
+            return 1.0
+        return 2.0 ** ((time - self._reference_time) / self._half_life)
+
+
+def _check_points(
+    points: ArrayLike, weights: ArrayLike | None
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    points = np.asarray(points, dtype=float)
+    if points.ndim == 1 and points.size == 0:
+        points = points.reshape(0, 2)
+    if points.ndim != 2 or points.shape[1] != 2:
+        raise ValueError(f"points must have shape (N, 2), got {points.shape}")
+    if not np.all(np.isfinite(points)):
+        raise ValueError("points must contain only finite values")
+    if weights is None:
+        weights = np.ones(len(points), dtype=float)
+    else:
+        weights = np.asarray(weights, dtype=float)
+        if weights.shape != (len(points),):
+            raise ValueError(
+                f"weights must have shape ({len(points)},), got {weights.shape}"
+            )
+        if not np.all(np.isfinite(weights)):
+            raise ValueError("weights must contain only finite values")
+
+    return points, weights
+
+
+def _check_non_negative(weights: NDArray[np.float64]) -> None:
+    if (weights < 0).any():
+        raise ValueError("weights must be non-negative to be splatted")
+
+
+class _Splatter:
+    # Splats points onto a grid with a margin of radius + 1 pixels, so points
+    # just outside the image still reach it, and convolves the grid with the
+    # truncated Gaussian. The margin also keeps the FFT's circular wrap-around
+    # out of the cropped image.
+
+    def __init__(
+        self,
+        shape: tuple[int, int],
+        sigma: float,
+        method: Literal["bilinear", "nearest"],
+    ) -> None:
+        self.shape = shape
+        self.method = method
+        radius = int(np.ceil(3 * sigma))
+        self.margin = radius + 1
+        self.grid_shape = (
+            _utils.fft_size(shape[0] + 2 * self.margin),
+            _utils.fft_size(shape[1] + 2 * self.margin),
+        )
+        self.grid_size = self.grid_shape[0] * self.grid_shape[1]
+        offsets = np.arange(-radius, radius + 1)
+        self._kernel_norm = float(np.sum(np.exp(-(offsets**2) / sigma**2)))
+        # The truncated Gaussian is separable, so its spectrum is the outer
+        # product of two 1D spectra.
+        self._spectrum_y = _gaussian_spectrum(
+            self.grid_shape[0], sigma, radius, real=False
+        )[:, None]
+        self._spectrum_x = _gaussian_spectrum(
+            self.grid_shape[1], sigma, radius, real=True
+        )[None, :]
+
+    def splat(
+        self, points: NDArray[np.float64], weights: NDArray[np.float64]
+    ) -> tuple[NDArray[np.intp], NDArray[np.float64]]:
+        """Flat grid indices and the weights added at them."""
+        if self.method == "nearest":
+            ys = np.round(points[:, 0]).astype(np.intp)[:, None]
+            xs = np.round(points[:, 1]).astype(np.intp)[:, None]
+            corner_weights = weights[:, None]
+        else:
+            y0 = np.floor(points[:, 0])
+            x0 = np.floor(points[:, 1])
+            fy = points[:, 0] - y0
+            fx = points[:, 1] - x0
+            ys = y0.astype(np.intp)[:, None] + [0, 0, 1, 1]
+            xs = x0.astype(np.intp)[:, None] + [0, 1, 0, 1]
+            corner_weights = weights[:, None] * np.stack(
+                [(1 - fy) * (1 - fx), (1 - fy) * fx, fy * (1 - fx), fy * fx], axis=1
+            )
+        height, width = self.shape
+        ys = ys + self.margin
+        xs = xs + self.margin
+        inside = (
+            (ys >= 0)
+            & (ys < height + 2 * self.margin)
+            & (xs >= 0)
+            & (xs < width + 2 * self.margin)
+        )
+        return (
+            (ys * self.grid_shape[1] + xs)[inside],
+            np.broadcast_to(corner_weights, ys.shape)[inside],
+        )
+
+    def convolve(self, grid: NDArray[np.floating]) -> NDArray[np.float64]:
+        """Non-negative float64 density cropped from a flat grid."""
+        height, width = self.shape
+        grid = grid.reshape(self.grid_shape).astype(np.float64, copy=False)
+        if not grid.any():
+            return np.zeros((height, width), dtype=np.float64)
+        spectrum = np.fft.rfft2(grid)
+        spectrum *= self._spectrum_y
+        spectrum *= self._spectrum_x
+        density = np.fft.irfft2(spectrum, s=self.grid_shape)
+        density = np.ascontiguousarray(
+            density[
+                self.margin : self.margin + height, self.margin : self.margin + width
+            ]
+        )
+        # The 2D kernel's L2 norm is the squared L2 norm of the 1D one.
+        threshold = (
+            _RESIDUE_TOLERANCE * np.sqrt(np.vdot(grid, grid)) * self._kernel_norm
+        )
+        density[density < threshold] = 0
+        return density
+
+
+def _gaussian_spectrum(
+    size: int, sigma: float, radius: int, real: bool
+) -> NDArray[np.float64]:
+    # The kernel is symmetric, so its spectrum is real.
+    offsets = np.arange(-radius, radius + 1)
+    kernel = np.zeros(size, dtype=np.float64)
+    kernel[offsets % size] = np.exp(-(offsets**2) / (2.0 * sigma**2))
+    spectrum = np.fft.rfft(kernel) if real else np.fft.fft(kernel)
+    return spectrum.real
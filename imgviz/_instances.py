@@ -6,10 +6,14 @@ from typing import Literal
 import numpy as np
 from numpy.typing import NDArray
 
+from . import _blend
+from . import _boundary
 from . import _color
 from . import _label
+from . import _region_stats
 from . import _utils
 from . import draw as draw_module
+from .draw import TextBackend
 
 
 def masks_to_bboxes(
@@ -24,22 +28,144 @@ def masks_to_bboxes(
         Tight bounding boxes with shape (N, 4). [(ymin, xmin, ymax, xmax), ...]
         where both left-top and right-bottom are inclusive.
     """
-    bboxes = np.zeros((len(masks), 4), dtype=float)
-    for i, mask in enumerate(masks):
-        if mask.sum() == 0:
-            continue
-        where = np.argwhere(mask)
-        (ymin, xmin), (ymax, xmax) = where.min(axis=0), where.max(axis=0)
-        bbox = ymin, xmin, ymax, xmax
-        bboxes[i] = bbox
+    if len(masks) == 0:
+        return np.zeros((0, 4), dtype=float)
+    masks = np.asarray(masks, dtype=bool)
+    if masks.ndim != 3:
+        raise ValueError(f"masks must have shape (N, H, W), but got {masks.shape}")
+
+    # Reduce each mask to its occupied rows and columns, then the first and
+    # last occupied index along each gives the bbox without listing pixels.
+    rows = masks.any(axis=2)
+    cols = masks.any(axis=1)
+    bboxes = np.stack(
+        [
+            rows.argmax(axis=1),
+            cols.argmax(axis=1),
+            rows.shape[1] - 1 - rows[:, ::-1].argmax(axis=1),
+            cols.shape[1] - 1 - cols[:, ::-1].argmax(axis=1),
+        ],
+        axis=1,
+    ).astype(float)
+    bboxes[~rows.any(axis=1)] = 0
     return bboxes
 
 
+def instance_map_to_bboxes(
+    instance_map: NDArray[np.integer],
+    n_instance: int | None = None,
+) -> NDArray[np.floating]:
+    """Convert instance-id map to tight bounding boxes.
+
+    Args:
+        instance_map: Instance-id map with shape (H, W) whose pixels hold the
+            index of their instance (-1 for none).
+        n_instance: Number of instances N. Defaults to the maximum id plus one.
+
+    Returns:
+        Tight bounding boxes with shape (N, 4). [(ymin, xmin, ymax, xmax), ...]
+        where both left-top and right-bottom are inclusive. Instances without
+        pixels are left as zeros.
+    """
+    if instance_map.ndim != 2:
+        raise ValueError(
+            f"instance_map must be 2 dimensional, but got {instance_map.ndim}"
+        )
+    if not np.issubdtype(instance_map.dtype, np.integer):
+        raise ValueError(
+            f"instance_map dtype must be integer, but got {instance_map.dtype}"
+        )
+    if n_instance is None:
+        n_instance = max(int(instance_map.max(initial=-1)) + 1, 0)
+
+    return _region_stats.ids_to_bboxes(instance_map, n_id=n_instance)
+
+
+def _is_instance_map(
+    masks: NDArray[np.bool_] | Sequence[NDArray[np.bool_]] | NDArray[np.integer],
+) -> bool:
+    return isinstance(masks, np.ndarray) and masks.ndim == 2
+
+
+def _paint_order(
+    masks: NDArray[np.bool_] | Sequence[NDArray[np.bool_]] | NDArray[np.integer],
+    boundary_width: int,
+) -> NDArray[np.int32]:
+    # Index of the last paint on each pixel in painter's order: 2 * i for the
+    # mask of instance i, 2 * i + 1 for a boundary over instance i (or over no
+    # instance), and -1 for none.
+    if _is_instance_map(masks):
+        instance_map = masks
+        order = np.where(instance_map >= 0, 2 * instance_map, -1).astype(np.int32)
+        if boundary_width > 0:
+            boundary = _boundary.find_boundaries(instance_map, width=boundary_width)
+            order[boundary] = 2 * np.maximum(instance_map[boundary], 0) + 1
+        return order
+
+    order = np.full(masks[0].shape, -1, dtype=np.int32)
+    height, width = order.shape
+    for instance_id, mask in enumerate(masks):
+        mask = np.asarray(mask, dtype=bool)
+        rows = np.flatnonzero(mask.any(axis=1))
+        if rows.size == 0:
+            continue
+        cols = np.flatnonzero(mask.any(axis=0))
+
+        # Work inside the mask's bbox, padded so its thickened boundary fits.
+        y1 = max(int(rows[0]) - boundary_width, 0)
+        y2 = min(int(rows[-1]) + boundary_width + 1, height)
+        x1 = max(int(cols[0]) - boundary_width, 0)
+        x2 = min(int(cols[-1]) + boundary_width + 1, width)
+        mask = mask[y1:y2, x1:x2]
+        order_crop = order[y1:y2, x1:x2]
+
+        np.copyto(order_crop, 2 * instance_id, where=mask)
+        if boundary_width > 0:
+            boundary = _boundary.find_boundaries(mask, width=boundary_width)
+            np.copyto(order_crop, 2 * instance_id + 1, where=boundary)
+    return order
+
+
+def _blend_masks(
+    image: NDArray[np.uint8],
+    masks: NDArray[np.bool_] | Sequence[NDArray[np.bool_]] | NDArray[np.integer],
+    colormap: NDArray[np.uint8],
+    alpha: float,
+    boundary_width: int,
+) -> NDArray[np.uint8]:
+    if len(masks) == 0:
+        return image
+
+    # Resolve which instance paints each pixel last, then blend the frame
+    # once, instead of copying and blending the whole frame per instance.
+    order = _paint_order(masks=masks, boundary_width=boundary_width)
+    filled = (order >= 0) & (order % 2 == 0)
+    outlined = (order >= 0) & (order % 2 == 1)
+
+    instance_colors = colormap[1:]
+    n_instance = int(order.max()) // 2 + 1
+    colors = instance_colors[np.arange(n_instance) % len(instance_colors)]
+
+    dst = _blend.blend(
+        image,
+        color=colors,
+        alpha=alpha,
+        index=order // 2,
+        mask=filled,
+        rounding="floor",
+    )
+    dst[outlined] = _boundary.BOUNDARY_COLOR
+    return dst
+
+
 def instances2rgb(
     image: NDArray[np.uint8],
     labels: Sequence[int] | NDArray[np.integer],
     bboxes: Sequence[Sequence[float]] | NDArray[np.floating] | None = None,
-    masks: NDArray[np.bool_] | Sequence[NDArray[np.bool_]] | None = None,
+    masks: NDArray[np.bool_]
+    | Sequence[NDArray[np.bool_]]
+    | NDArray[np.integer]
+    | None = None,
     captions: Sequence[str | None] | None = None,
     font_size: int = 25,
     line_width: int = 5,
@@ -47,6 +173,7 @@ def instances2rgb(
     alpha: float = 0.5,
     colormap: NDArray[np.uint8] | None = None,
     font_path: str | None = None,
+    text_backend: TextBackend = "pillow",
 ) -> NDArray[np.uint8]:
     """Convert instances to rgb.
 
@@ -54,14 +181,20 @@ def instances2rgb(
         image: Image with shape (H, W) or (H, W, 3).
         labels: Labels with length N.
         bboxes: Bounding boxes with shape (N, 4).
-        masks: Masks with shape (N, H, W).
+        masks: Masks with shape (N, H, W), or an instance-id map with shape
+            (H, W) whose pixels hold the index of their instance in ``labels``
+            (-1 for none). The instance-id map costs O(H * W) regardless of N;
+            its boundaries are drawn between all distinct ids at once.
         captions: Captions with length N.
         font_size: Font size.
         line_width: Line width.
-        boundary_width: Boundary width.
+        boundary_width: Width in pixels of the boundary drawn around each mask.
+            0 for no boundary.
         alpha: Alpha of RGB.
         colormap: Label id to RGB color.
         font_path: Font path.
+        text_backend: Caption rendering backend ('pillow' or 'atlas'), see
+            :func:`~imgviz.draw.text`.
 
     Returns:
         Visualized image with shape (H, W, 3).
@@ -82,10 +215,28 @@ def instances2rgb(
 
     n_instance = len(labels)
 
+    if masks is not None and _is_instance_map(masks):
+        if not np.issubdtype(masks.dtype, np.integer):
+            raise ValueError(
+                f"instance-id map dtype must be integer, but got {masks.dtype}"
+            )
+        if masks.shape != image.shape[:2]:
+            raise ValueError(
+                f"instance-id map shape must be {image.shape[:2]}, "
+                f"but got {masks.shape}"
+            )
+        if masks.size > 0 and masks.max() >= n_instance:
+            raise ValueError(
+                f"instance-id map values must be < {n_instance=}, but got {masks.max()}"
+            )
+
     if bboxes is None:
         if masks is None:
             raise ValueError("bboxes or masks must be provided")
-        bboxes = masks_to_bboxes(masks=masks)
+        if _is_instance_map(masks):
+            bboxes = instance_map_to_bboxes(masks, n_instance=n_instance)
+        else:
+            bboxes = masks_to_bboxes(masks=masks)
     if captions is None:
         captions = [None] * n_instance
 
@@ -99,35 +250,14 @@ def instances2rgb(
         colormap = _label.label_colormap()
 
     dst = image
-
-    for instance_id in range(n_instance):
-        if masks is None:
-            continue
-
-        mask: NDArray[np.bool_] = masks[instance_id]
-        if mask.sum() == 0:
-            continue
-
-        color_ins = colormap[1:][instance_id % len(colormap[1:])]
-
-        maskviz = mask[:, :, None] * color_ins.astype(float)
-        dst = dst.copy()
-        dst[mask] = (1 - alpha) * image[mask].astype(float) + alpha * maskviz[mask]
-
-        if boundary_width > 0:
-            try:
-                import skimage.morphology
-                import skimage.segmentation
-            except ImportError:
-                raise ImportError(
-                    "skimage is required for boundary_width > 0. "
-                    "Please install scikit-image or use: pip install imgviz[all]"
-                ) from None
-
-            boundary = skimage.segmentation.find_boundaries(mask, connectivity=2)
-            for _ in range(boundary_width - 1):
-                boundary = skimage.morphology.binary_dilation(boundary)
-            dst[boundary] = (200, 200, 200)
+    if masks is not None:
+        dst = _blend_masks(
+            image=image,
+            masks=masks,
+            colormap=colormap,
+            alpha=alpha,
+            boundary_width=boundary_width,
+        )
 
     dst = _utils.numpy_to_pillow(dst)
     for instance_id in range(n_instance):
@@ -173,5 +303,6 @@ def instances2rgb(
                 yx1=yx1,
                 yx2=yx2,
                 font_path=font_path,
+                backend=text_backend,
             )
     return _utils.pillow_to_numpy(dst)
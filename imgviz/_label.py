@@ -6,37 +6,74 @@ from typing import Literal
 import numpy as np
 from numpy.typing import NDArray
 
+from . import _blend
+from . import _boundary
 from . import _color
+from . import _region_stats
 from . import _utils
 from . import components
 from . import draw as draw_module
+from .draw import TextBackend
 
 
-def _bitget(byte_value: NDArray[np.uint8], idx: int) -> NDArray[np.uint8]:
-    shape: tuple[int, ...] = byte_value.shape + (8,)
-    return np.unpackbits(byte_value).reshape(shape)[..., -1 - idx]
+def _label_colors(label_ids: NDArray[np.integer]) -> NDArray[np.uint8]:
+    # PASCAL VOC colormap: bits 0, 1 and 2 of each 3-bit group of the id go,
+    # from the most significant color bit down, to red, green and blue. Ids
+    # wrap around after 2 ** 24 distinct colors.
+    ids = np.asarray(label_ids).astype(np.uint32)
+    groups = ids[..., None] >> np.arange(0, 24, 3, dtype=np.uint32)
+    j = np.arange(8)[::-1].astype(np.uint32)
+    r = np.bitwise_or.reduce(((groups >> 0) & 1) << j, axis=-1)
+    g = np.bitwise_or.reduce(((groups >> 1) & 1) << j, axis=-1)
+    b = np.bitwise_or.reduce(((groups >> 2) & 1) << j, axis=-1)
+    return np.stack((r, g, b), axis=-1).astype(np.uint8)
 
 
-@functools.lru_cache(maxsize=1)
-def label_colormap() -> NDArray[np.uint8]:
-    """Label colormap for maximum 256 labels.
+def label_colormap(n_label: int = 256) -> NDArray[np.uint8]:
+    """Label colormap.
+
+    Args:
+        n_label: Number of labels. Tables are cached per size.
 
     Returns:
-        Label id to colormap with shape (256, 3).
+        Label id to colormap with shape (n_label, 3).
     """
-    i = np.arange(256, dtype=np.uint8)
-    i = np.repeat(i[:, None], 8, axis=1)
-    i = np.right_shift(i, np.arange(0, 24, 3)).astype(np.uint8)
-    j = np.arange(8)[::-1]
-    r = np.bitwise_or.reduce(np.left_shift(_bitget(i, 0), j), axis=1)
-    g = np.bitwise_or.reduce(np.left_shift(_bitget(i, 1), j), axis=1)
-    b = np.bitwise_or.reduce(np.left_shift(_bitget(i, 2), j), axis=1)
-
-    cmap: NDArray[np.uint8] = np.stack((r, g, b), axis=1).astype(np.uint8)
+    if n_label < 0:
+        raise ValueError(f"n_label must be >= 0, but got {n_label}")
+    return _cached_label_colormap(n_label)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_label_colormap(n_label: int) -> NDArray[np.uint8]:
+    cmap = _label_colors(np.arange(n_label))
     cmap.setflags(write=False)
     return cmap
 
 
+def _label_alphas(
+    alpha: float | list[float] | dict[int, float],
+    labels: NDArray[np.integer],
+) -> NDArray[np.floating]:
+    # Alpha of each present label. Negative (unlabeled) ids wrap around like
+    # indexing a table with one entry per id up to the maximum one.
+    max_label_id = max(int(labels[-1]), 0) if len(labels) else 0
+    if isinstance(alpha, (int, float)):
+        alpha_arr = np.full(len(labels), alpha, dtype=float)
+    elif isinstance(alpha, dict):
+        keys = np.where(labels < 0, labels + max_label_id + 1, labels)
+        alpha_arr = np.array([alpha.get(key, 0.5) for key in keys.tolist()], float)
+    else:
+        alpha_table = np.asarray(alpha)
+        if alpha_table.ndim != 1:
+            raise ValueError(f"alpha must be 1D array, but got {alpha_table.ndim}D")
+        if not ((0 <= alpha_table) & (alpha_table <= 1)).all():
+            raise ValueError("alpha values must be in [0, 1]")
+        alpha_arr = alpha_table[labels]
+    if not ((0 <= alpha_arr) & (alpha_arr <= 1)).all():
+        raise ValueError("alpha values must be in [0, 1]")
+    return alpha_arr
+
+
 def label2rgb(
     label: NDArray[np.integer],
     image: NDArray[np.uint8] | None = None,
@@ -47,12 +84,16 @@ def label2rgb(
     colormap: NDArray[np.uint8] | None = None,
     loc: Literal["centroid", "lt", "rt", "lb", "rb"] = "rb",
     font_path: str | None = None,
+    text_backend: TextBackend = "pillow",
+    boundary_width: int = 0,
 ) -> NDArray[np.uint8]:
     """Convert label to rgb.
 
     Args:
-        label: Label image with shape (H, W).
-        image: Image with shape (H, W) or (H, W, 3).
+        label: Label image with shape (H, W), or a batch with shape (N, H, W)
+            whose frames share one color and alpha lookup.
+        image: Image with shape (H, W), (H, W, 1) or (H, W, 3), with a leading
+            (N,) axis for a batch.
         alpha: Alpha of RGB. If given as a list or dict, it is treated as alpha
             for each class according to the index or key.
         label_names: Label id to label name.
@@ -62,50 +103,123 @@ def label2rgb(
             is used.
         loc: Location of legend ('centroid', 'lt', 'rt', 'lb', 'rb').
         font_path: Font path.
+        text_backend: Text rendering backend ('pillow' or 'atlas'), see
+            :func:`~imgviz.draw.text`.
+        boundary_width: Width in pixels of the outline drawn between regions
+            of different labels. 0 for no outline.
 
     Returns:
-        Visualized image with shape (H, W, 3).
+        Visualized image with shape (H, W, 3), or (N, H, W, 3) for a batch.
     """
-    if colormap is None:
-        colormap = label_colormap()
-
+    if label.ndim not in (2, 3):
+        raise ValueError(
+            f"label must be 2 dimensional, or 3 dimensional with a batch axis, "
+            f"but got {label.ndim}"
+        )
+    if image is not None and (
+        image.shape[: label.ndim] != label.shape
+        or image.shape[label.ndim :] not in ((), (1,), (3,))
+    ):
+        raise ValueError(
+            f"image must have shape {label.shape}, {label.shape + (1,)} or "
+            f"{label.shape + (3,)} to match label, but got {image.shape}"
+        )
     if label.dtype == bool:
         label = label.astype(np.int32)
+    width = label.shape[-1]
 
-    res = colormap[label]
+    # Look up colors and alphas once per distinct label, so sparse or large
+    # ids (e.g. instance ids) cost O(K) instead of O(max id). A batch is
+    # processed as one image of stacked frames.
+    present_labels, label_index = _region_stats.compact_labels(label)
 
-    random_state = np.random.RandomState(seed=1234)
+    if colormap is None:
+        colors = _label_colors(present_labels)
+    else:
+        if len(present_labels) and present_labels[-1] >= len(colormap):
+            raise ValueError(
+                f"colormap has {len(colormap)} colors, "
+                f"but label has id {present_labels[-1]}"
+            )
+        colors = colormap[present_labels]
+    res = colors[label_index]
 
     mask_unlabeled = label < 0
-    res[mask_unlabeled] = random_state.rand(*(mask_unlabeled.sum(), 3)) * 255
-
-    unique_labels = np.unique(label)
-    max_label_id = max(int(unique_labels[-1]), 0)
-
-    if isinstance(alpha, (int, float)):
-        alpha_arr = np.array([alpha for _ in range(max_label_id + 1)])
-    elif isinstance(alpha, dict):
-        alpha_arr = np.array(
-            [alpha.get(label_id, 0.5) for label_id in range(max_label_id + 1)]
+    for frame_res, frame_unlabeled in zip(
+        res.reshape((-1,) + res.shape[-3:]),
+        mask_unlabeled.reshape((-1,) + mask_unlabeled.shape[-2:]),
+    ):
+        random_state = np.random.RandomState(seed=1234)
+        frame_res[frame_unlabeled] = (
+            random_state.rand(*(frame_unlabeled.sum(), 3)) * 255
         )
-    else:
-        alpha_arr = np.asarray(alpha)
-        if alpha_arr.ndim != 1:
-            raise ValueError(f"alpha must be 1D array, but got {alpha_arr.ndim}D")
-    if not ((0 <= alpha_arr) & (alpha_arr <= 1)).all():
-        raise ValueError("alpha values must be in [0, 1]")
-    alpha_map = alpha_arr[label][:, :, None]
+
+    alphas = _label_alphas(alpha, present_labels)
 
     if image is not None:
+        if image.shape[label.ndim :] == (1,):
+            image = image[..., 0]
+        image = image.reshape((-1, width) + image.shape[label.ndim :])
         if image.ndim == 2:
             image = _color.gray2rgb(image)
-        res = (1 - alpha_map) * image.astype(float) + alpha_map * res.astype(float)
-        res = np.clip(res.round(), 0, 255).astype(np.uint8)
+        _blend.blend(
+            image,
+            color=res.reshape(-1, width, 3),
+            alpha=alphas,
+            index=label_index.reshape(-1, width),
+            out=res.reshape(-1, width, 3),
+        )
+
+    if boundary_width > 0:
+        boundary = _boundary.find_boundaries(label, width=boundary_width)
+        res[boundary] = _boundary.BOUNDARY_COLOR
 
     if label_names is None:
         return res
 
-    unique_labels = unique_labels[unique_labels != -1]
+    # Legends and text are drawn per frame.
+    if label.ndim == 3:
+        for frame_res, frame_label in zip(res, label):
+            frame_res[...] = _draw_label_names(
+                frame_res,
+                label=frame_label,
+                frame_labels=np.unique(frame_label),
+                label_colors=(present_labels, colors),
+                label_names=label_names,
+                font_size=font_size,
+                thresh_suppress=thresh_suppress,
+                loc=loc,
+                font_path=font_path,
+                text_backend=text_backend,
+            )
+        return res
+    return _draw_label_names(
+        res,
+        label=label,
+        frame_labels=present_labels,
+        label_colors=(present_labels, colors),
+        label_names=label_names,
+        font_size=font_size,
+        thresh_suppress=thresh_suppress,
+        loc=loc,
+        font_path=font_path,
+        text_backend=text_backend,
+    )
+
+
+def _draw_label_names(
+    res: NDArray[np.uint8],
+    label: NDArray[np.integer],
+    frame_labels: NDArray[np.integer],
+    label_colors: tuple[NDArray[np.integer], NDArray[np.uint8]],
+    label_names: list[str] | dict[int, str],
+    font_size: int,
+    thresh_suppress: float,
+    loc: Literal["centroid", "lt", "rt", "lb", "rb"],
+    font_path: str | None,
+    text_backend: TextBackend,
+) -> NDArray[np.uint8]:
+    unique_labels = frame_labels[frame_labels != -1]
     if isinstance(label_names, dict):
         unique_labels = [
             label_id for label_id in unique_labels if label_names.get(label_id)
@@ -120,19 +234,24 @@ def label2rgb(
     if loc == "centroid":
         random_state: np.random.RandomState = np.random.RandomState(0)
 
+        # One pass over the image for every label's area, centroid and bbox,
+        # instead of a full-frame mask per label.
+        stats = _region_stats.region_stats(label)
+
         res = _utils.numpy_to_pillow(res)
         for label_i in unique_labels:
-            mask = label == label_i
-            if 1.0 * mask.sum() / mask.size < thresh_suppress:
+            k = int(np.searchsorted(stats.labels, label_i))
+            if 1.0 * stats.areas[k] / label.size < thresh_suppress:
                 continue
             y: int
             x: int
-            y, x = np.array(_center_of_mass(mask)).round().astype(int).tolist()
+            y, x = stats.centroids[k].round().astype(int).tolist()
 
             if label[y, x] != label_i:
-                Y, X = np.where(mask)
+                ymin, xmin, ymax, xmax = stats.bboxes[k].astype(int).tolist()
+                Y, X = np.where(label[ymin : ymax + 1, xmin : xmax + 1] == label_i)
                 point_index = random_state.randint(0, len(Y))
-                y, x = Y[point_index].item(), X[point_index].item()
+                y, x = ymin + Y[point_index].item(), xmin + X[point_index].item()
 
             text = label_names[label_i]
             height, width = draw_module.text_size(
@@ -146,23 +265,20 @@ def label2rgb(
                 color=color,
                 size=font_size,
                 font_path=font_path,
+                backend=text_backend,
             )
         return _utils.pillow_to_numpy(res)
 
-    items = [(label_names[label_id], colormap[label_id]) for label_id in unique_labels]
+    present_labels, colors = label_colors
+    items = [
+        (label_names[label_id], colors[np.searchsorted(present_labels, label_id)])
+        for label_id in unique_labels
+    ]
     return components.legend(
-        res, items=items, font_size=font_size, font_path=font_path, loc=loc
+        res,
+        items=items,
+        font_size=font_size,
+        font_path=font_path,
+        loc=loc,
+        text_backend=text_backend,
     )
-
-
-def _center_of_mass(mask: NDArray[np.bool_]) -> tuple[float, float]:
-    if mask.ndim != 2 or mask.dtype != bool:
-        raise ValueError(
-            f"mask must be 2D bool array, but got {mask.ndim}D {mask.dtype}"
-        )
-    mask_float: NDArray[np.float32] = mask.astype(np.float32) / mask.sum()
-    dx = np.sum(mask_float, 0)
-    dy = np.sum(mask_float, 1)
-    cx = np.sum(dx * np.arange(mask.shape[1]))
-    cy = np.sum(dy * np.arange(mask.shape[0]))
-    return cy.item(), cx.item()
@@ -6,7 +6,13 @@ from typing import TYPE_CHECKING
 import numpy as np
 from numpy.typing import NDArray
 
+from . import _utils
 from ._normalize import normalize
+from ._pca import PCA
+
+# Largest projection, in values, kept between the range pass and the output
+# pass instead of being projected twice.
+_MAX_KEPT_SIZE: int = 1 << 22
 
 if TYPE_CHECKING:
     import sklearn.decomposition
@@ -15,19 +21,31 @@ if TYPE_CHECKING:
 class Nchannel2Rgb:
     """Convert nchannel array to rgb by PCA.
 
+    Without a given PCA, a built-in float32 PCA is fitted on the first call
+    from a random subsample of the pixels, kept on the instance and reused
+    for subsequent frames, so scikit-learn is not needed.
+
     Args:
-        pca: PCA object from sklearn.
+        pca: Fitted PCA object, either from sklearn or :attr:`pca` of another
+            instance. If None, it is fitted on the first call.
+        n_samples: Number of random pixels the PCA is fitted on. None to fit
+            on all pixels.
     """
 
-    def __init__(self, pca: sklearn.decomposition.PCA | None = None) -> None:
+    def __init__(
+        self,
+        pca: PCA | sklearn.decomposition.PCA | None = None,
+        n_samples: int | None = 65536,
+    ) -> None:
         self._pca = pca
+        self._n_samples = n_samples
         # for uint8
         self._min_max_value: tuple[
             NDArray[np.floating] | None, NDArray[np.floating] | None
         ] = (None, None)
 
     @property
-    def pca(self) -> sklearn.decomposition.PCA | None:
+    def pca(self) -> PCA | sklearn.decomposition.PCA | None:
         """PCA for N channel to 3."""
         return self._pca
 
@@ -35,86 +53,155 @@ class Nchannel2Rgb:
         self,
         nchannel: NDArray,
         dtype: type[np.uint8] | type[np.floating] = np.uint8,
+        out: NDArray | None = None,
     ) -> NDArray[np.uint8] | NDArray[np.floating]:
         """Convert nchannel array to rgb by PCA.
 
+        The input is read and projected in strips of rows, so the working set
+        stays at a few MB plus the output, and only the sampled pixels are
+        read to fit the PCA. With ``out`` (e.g. a :class:`numpy.memmap`)
+        arbitrarily large volumes can be visualized.
+
         Args:
-            nchannel: N channel image with shape (H, W, C).
+            nchannel: N channel image with shape (H, W, C): an ndarray, a
+                :class:`numpy.memmap`, or any array-like whose row slices
+                convert with ``np.asarray`` (e.g. h5py or zarr arrays).
             dtype: Output dtype.
+            out: Preallocated output with shape (H, W, 3) and dtype ``dtype``.
 
         Returns:
-            Visualized image with shape (H, W, 3).
+            Visualized image with shape (H, W, 3), which is ``out`` if given.
         """
-        try:
-            import sklearn.decomposition
-        except ImportError:
-            raise ImportError(
-                "sklearn is required for Nchannel2Rgb. "
-                "Please install scikit-learn or use: pip install imgviz[all]"
-            ) from None
-
-        if nchannel.ndim != 3:
-            raise ValueError(f"nchannel.ndim must be 3, but got {nchannel.ndim}")
+        if len(nchannel.shape) != 3:
+            raise ValueError(f"nchannel.ndim must be 3, but got {len(nchannel.shape)}")
         if not np.issubdtype(nchannel.dtype, np.floating):
             raise ValueError(
                 f"nchannel.dtype must be floating, but got {nchannel.dtype}"
             )
+        if dtype != np.uint8 and not np.issubdtype(dtype, np.floating):
+            raise ValueError(f"dtype must be floating, but got {dtype}")
         H, W, D = nchannel.shape
+        if out is None:
+            out = np.empty((H, W, 3), dtype=dtype)
+        elif out.shape != (H, W, 3) or out.dtype != dtype:
+            raise ValueError(
+                f"out must have shape {(H, W, 3)} and dtype {np.dtype(dtype)}, "
+                f"but got {out.shape} and {out.dtype}"
+            )
 
-        dst = nchannel.reshape(-1, D)
         if self._pca is None:
-            self._pca = sklearn.decomposition.PCA(n_components=3, random_state=1234)
-            dst = self._pca.fit_transform(dst)
-        else:
-            dst = self._pca.transform(dst)
-        dst = dst.reshape(H, W, 3)
-
-        if dtype == np.uint8:
-            if self._min_max_value[0] is None:
-                self._min_max_value = (
-                    np.nanmin(dst, axis=(0, 1)),
-                    np.nanmax(dst, axis=(0, 1)),
-                )
-            min_value, max_value = self._min_max_value
+            self._pca = PCA(n_components=3, n_samples=self._n_samples)
+            self._pca.fit(self._sample_pixels(nchannel))
+        rows = max(1, _utils.CHUNK_SIZE // max(W * D, 1))
+        strips = [slice(y, min(y + rows, H)) for y in range(0, H, rows)]
+
+        if dtype != np.uint8:
+            for strip in strips:
+                out[strip] = self._project(nchannel[strip])
+            return out
+
+        # The uint8 range is the min and max of the whole projection, so
+        # unless it is known, a first pass finds it; projections small enough
+        # are kept for the second pass instead of being recomputed.
+        projected: list[NDArray] | None = None
+        if self._min_max_value[0] is None:
+            keep = H * W * 3 <= _MAX_KEPT_SIZE
+            projected = []
+            min_value = np.full(3, np.nan)
+            max_value = np.full(3, np.nan)
+            for strip in strips:
+                dst = self._project(nchannel[strip])
+                min_value = np.fmin(min_value, np.nanmin(dst, axis=(0, 1)))
+                max_value = np.fmax(max_value, np.nanmax(dst, axis=(0, 1)))
+                if keep:
+                    projected.append(dst)
+            self._min_max_value = (min_value, max_value)
+            if not keep:
+                projected = None
+
+        min_value, max_value = self._min_max_value
+        for i, strip in enumerate(strips):
+            dst = self._project(nchannel[strip]) if projected is None else projected[i]
             dst = normalize(dst, min_value, max_value)
-            dst = (dst * 255).round().astype(np.uint8)
-        else:
-            if not np.issubdtype(dtype, np.floating):
-                raise ValueError(f"dtype must be floating, but got {dtype}")
-            dst = dst.astype(dtype)
+            out[strip] = (dst * 255).round().astype(np.uint8)
+        return out
+
+    def _project(self, nchannel: NDArray) -> NDArray:
+        assert self._pca is not None
+        nchannel = np.asarray(nchannel)
+        H, W, D = nchannel.shape
+        return self._pca.transform(nchannel.reshape(-1, D)).reshape(H, W, 3)
+
+    def _sample_pixels(self, nchannel: NDArray) -> NDArray:
+        # Same subsample as PCA.fit on the flattened pixels, gathered without
+        # reading the other pixels of an ndarray or memmap.
+        assert isinstance(self._pca, PCA)
+        H, W, D = nchannel.shape
+        rows = max(1, _utils.CHUNK_SIZE // max(W * D, 1))
+        if self._n_samples is None or H * W <= self._n_samples:
+            if isinstance(nchannel, np.ndarray):
+                return nchannel.reshape(-1, D)
+            return np.concatenate(
+                [
+                    np.asarray(nchannel[y : y + rows]).reshape(-1, D)
+                    for y in range(0, H, rows)
+                ]
+            )
 
-        return dst
+        rng = np.random.default_rng(seed=self._pca.random_state)
+        index = np.sort(rng.choice(H * W, size=self._n_samples, replace=False))
+        ys, xs = np.divmod(index, W)
+        if isinstance(nchannel, np.ndarray):
+            return nchannel[ys, xs]
+        samples = []
+        for y in range(0, H, rows):
+            lo, hi = np.searchsorted(ys, [y, y + rows])
+            if lo < hi:
+                strip = np.asarray(nchannel[y : y + rows])
+                samples.append(strip[ys[lo:hi] - y, xs[lo:hi]])
+        return np.concatenate(samples)
 
 
 @typing.overload
 def nchannel2rgb(
     nchannel: NDArray,
-    pca: sklearn.decomposition.PCA | None = ...,
+    pca: PCA | sklearn.decomposition.PCA | None = ...,
     dtype: type[np.uint8] = ...,
+    n_samples: int | None = ...,
+    out: NDArray | None = ...,
 ) -> NDArray[np.uint8]: ...
 
 
 @typing.overload
 def nchannel2rgb(
     nchannel: NDArray,
-    pca: sklearn.decomposition.PCA | None = ...,
+    pca: PCA | sklearn.decomposition.PCA | None = ...,
     dtype: type[np.floating] = ...,
+    n_samples: int | None = ...,
+    out: NDArray | None = ...,
 ) -> NDArray[np.floating]: ...
 
 
 def nchannel2rgb(
     nchannel: NDArray,
-    pca: sklearn.decomposition.PCA | None = None,
+    pca: PCA | sklearn.decomposition.PCA | None = None,
     dtype: type[np.uint8] | type[np.floating] = np.uint8,
+    n_samples: int | None = 65536,
+    out: NDArray | None = None,
 ) -> NDArray[np.uint8] | NDArray[np.floating]:
     """Convert nchannel array to rgb by PCA.
 
     Args:
-        nchannel: N channel image with shape (H, W, C).
-        pca: PCA object from sklearn.
+        nchannel: N channel image with shape (H, W, C), e.g. an ndarray or a
+            :class:`numpy.memmap`, see :class:`~imgviz.Nchannel2Rgb`.
+        pca: Fitted PCA object, see :class:`~imgviz.Nchannel2Rgb`.
         dtype: Output dtype.
+        n_samples: Number of random pixels the PCA is fitted on.
+        out: Preallocated output with shape (H, W, 3) and dtype ``dtype``.
 
     Returns:
-        Visualized image with shape (H, W, 3).
+        Visualized image with shape (H, W, 3), which is ``out`` if given.
     """
-    return Nchannel2Rgb(pca=pca)(nchannel=nchannel, dtype=dtype)
+    return Nchannel2Rgb(pca=pca, n_samples=n_samples)(
+        nchannel=nchannel, dtype=dtype, out=out
+    )
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+from . import _utils
+
+
+class PCA:
+    """Principal component analysis in float32 with NumPy.
+
+    The basis is fitted from the covariance of a random subsample of the
+    feature vectors, which for a few thousand vectors or more is as good as
+    fitting on all of them, and features are projected in bounded chunks.
+    Component signs follow scikit-learn: the largest coefficient of each
+    component is positive.
+
+    Args:
+        n_components: Number of components.
+        n_samples: Number of randomly chosen feature vectors to fit on. None
+            to fit on all of them.
+        random_state: Seed of the subsampling.
+    """
+
+    def __init__(
+        self,
+        n_components: int = 3,
+        n_samples: int | None = 65536,
+        random_state: int = 1234,
+    ) -> None:
+        if n_components < 1:
+            raise ValueError(f"n_components must be >= 1, but got {n_components}")
+        if n_samples is not None and n_samples < 1:
+            raise ValueError(f"n_samples must be >= 1 or None, but got {n_samples}")
+        self.n_components = n_components
+        self.n_samples = n_samples
+        self.random_state = random_state
+        self.mean_: NDArray[np.float32] | None = None
+        self.components_: NDArray[np.float32] | None = None
+        self.explained_variance_: NDArray[np.float32] | None = None
+
+    def fit(self, features: NDArray) -> PCA:
+        """Fit the basis.
+
+        Args:
+            features: Feature vectors with shape (N, C). Vectors with NaN or
+                inf are ignored.
+
+        Returns:
+            self.
+        """
+        if features.ndim != 2:
+            raise ValueError(f"features must be 2D array, but got {features.ndim}D")
+        n_channel = features.shape[1]
+        if self.n_components > n_channel:
+            raise ValueError(
+                f"n_components must be <= number of channels {n_channel}, "
+                f"but got {self.n_components}"
+            )
+
+        if self.n_samples is not None and len(features) > self.n_samples:
+            rng = np.random.default_rng(seed=self.random_state)
+            index = np.sort(
+                rng.choice(len(features), size=self.n_samples, replace=False)
+            )
+            samples = features[index].astype(np.float32)
+        else:
+            samples = features.astype(np.float32)
+        samples = samples[np.isfinite(samples).all(axis=1)]
+        if len(samples) == 0:
+            raise ValueError("features must have at least one finite vector")
+
+        mean = samples.mean(axis=0)
+        samples -= mean
+        covariance = samples.T @ samples / max(len(samples) - 1, 1)
+
+        # The C x C eigenproblem is cheap, so solve it in float64.
+        eigenvalues, eigenvectors = np.linalg.eigh(covariance.astype(np.float64))
+        order = np.argsort(eigenvalues)[::-1][: self.n_components]
+        components = eigenvectors[:, order].T
+        signs = np.sign(
+            components[np.arange(len(components)), np.abs(components).argmax(axis=1)]
+        )
+        components *= signs[:, None]
+
+        self.mean_ = mean
+        self.components_ = components.astype(np.float32)
+        self.explained_variance_ = eigenvalues[order].astype(np.float32)
+        return self
+
+    def transform(self, features: NDArray) -> NDArray[np.float32]:
+        """Project feature vectors onto the fitted basis.
+
+        Args:
+            features: Feature vectors with shape (N, C).
+
+        Returns:
+            Projected features with shape (N, n_components).
+        """
+        if self.mean_ is None or self.components_ is None:
+            raise ValueError("PCA must be fitted before transform")
+        if features.ndim != 2 or features.shape[1] != len(self.mean_):
+            raise ValueError(
+                f"features must have shape (N, {len(self.mean_)}), "
+                f"but got {features.shape}"
+            )
+        basis = self.components_.T
+        projected = np.empty((len(features), self.n_components), dtype=np.float32)
+        step = max(1, _utils.CHUNK_SIZE // features.shape[1])
+        for start in range(0, len(features), step):
+            chunk = features[start : start + step].astype(np.float32)
+            chunk -= self.mean_
+            np.matmul(chunk, basis, out=projected[start : start + step])
+        return projected
+
+    def fit_transform(self, features: NDArray) -> NDArray[np.float32]:
+        """Fit the basis and project feature vectors onto it.
+
+        Args:
+            features: Feature vectors with shape (N, C).
+
+        Returns:
+            Projected features with shape (N, n_components).
+        """
+        return self.fit(features).transform(features)
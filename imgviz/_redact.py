@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Literal
+
+import numpy as np
+import PIL.Image
+import PIL.ImageDraw
+from numpy.typing import ArrayLike
+from numpy.typing import NDArray
+
+from ._blur import _blur_within_mask
+from ._pixelate import _pixelate_within_mask
+
+
+def redact(
+    image: NDArray,
+    boxes: ArrayLike | Sequence[ArrayLike] | None = None,
+    polygons: Sequence[ArrayLike] | Sequence[Sequence[ArrayLike]] | None = None,
+    effect: Literal["blur", "pixelate"] = "blur",
+    sigma: float = 8.0,
+    block: int = 8,
+    out: NDArray | None = None,
+) -> NDArray:
+    """Blur or pixelate boxes and polygons of a frame or a stack of frames.
+
+    The regions of each frame are rasterized into one mask, so overlapping
+    regions are merged and no pixel is processed twice, and only the
+    bounding boxes of its groups of pixels are transformed, as
+    ``blur(mask=...)`` and ``pixelate(mask=...)`` do. Pixels outside the
+    regions are not written.
+
+    Args:
+        image: Frame with shape (H, W) or (H, W, C), or stack of frames with
+            shape (N, H, W, C).
+        boxes: Boxes (ymin, xmin, ymax, xmax) with shape (M, 4), inclusive
+            like :func:`~imgviz.masks_to_bboxes`; for a stack, a sequence of N
+            such arrays, one per frame.
+        polygons: Polygons, each with vertices (y, x) of shape (K, 2); for a
+            stack, a sequence of N such lists, one per frame.
+        effect: 'blur' as :func:`~imgviz.blur` with ``sigma``, or 'pixelate'
+            as :func:`~imgviz.pixelate` with ``block``.
+        sigma: Gaussian blur radius in pixels.
+        block: Pixelation block size in pixels.
+        out: Output with the shape and dtype of ``image``, into which the
+            frames are copied before redaction; ``image`` itself to redact in
+            place. None for a new copy.
+
+    Returns:
+        Redacted frames, which are ``out`` if given.
+
+    Example:
+        >>> boxes = [(50, 100, 149, 249)]
+        >>> redacted = imgviz.redact(image, boxes=boxes, effect="pixelate")
+        >>> imgviz.redact(frames, boxes=boxes_per_frame, out=frames)
+    """
+    if image.ndim not in (2, 3, 4):
+        raise ValueError(f"image.ndim must be 2, 3 or 4, got {image.ndim}")
+    if effect == "blur":
+        if sigma < 0:
+            raise ValueError(f"sigma must be >= 0, got {sigma}")
+        if not (
+            np.issubdtype(image.dtype, np.integer)
+            or np.issubdtype(image.dtype, np.floating)
+        ):
+            raise ValueError(
+                f"image.dtype must be integer or floating, got {image.dtype}"
+            )
+    elif effect == "pixelate":
+        if block < 1:
+            raise ValueError(f"block must be >= 1, got {block}")
+    else:
+        raise ValueError(f"effect must be 'blur' or 'pixelate', got {effect!r}")
+
+    if out is None:
+        out = image.copy()
+    elif out.shape != image.shape or out.dtype != image.dtype:
+        raise ValueError(
+            f"out must have shape {image.shape} and dtype {image.dtype}, "
+            f"but got {out.shape} and {out.dtype}"
+        )
+    elif out is not image:
+        out[...] = image
+
+    if image.ndim == 4:
+        frames, frames_out = image, out
+        boxes_per_frame = _per_frame(boxes, n_frame=len(image), name="boxes")
+        polygons_per_frame = _per_frame(polygons, n_frame=len(image), name="polygons")
+    else:
+        frames, frames_out = image[None], out[None]
+        boxes_per_frame = [boxes]
+        polygons_per_frame = [polygons]
+
+    # One mask is reused across frames; only the spans set for a frame are
+    # cleared after it.
+    mask = np.zeros(frames.shape[1:3], dtype=bool)
+    for frame, frame_out, frame_boxes, frame_polygons in zip(
+        frames, frames_out, boxes_per_frame, polygons_per_frame
+    ):
+        spans = _rasterize_boxes(mask, boxes=frame_boxes)
+        spans += _rasterize_polygons(mask, polygons=frame_polygons)
+        if not spans:
+            continue
+        if effect == "blur":
+            _blur_within_mask(
+                image=frame, mask=mask, sigma=sigma, method="gaussian", out=frame_out
+            )
+        else:
+            _pixelate_within_mask(
+                image=frame, mask=mask, block=block, method="resize", out=frame_out
+            )
+        for ys, xs in spans:
+            mask[ys, xs] = False
+    return out
+
+
+def _per_frame(regions: Sequence | None, n_frame: int, name: str) -> list:
+    if regions is None:
+        return [None] * n_frame
+    if len(regions) != n_frame:
+        raise ValueError(
+            f"{name} must have one entry per frame ({n_frame}), but got {len(regions)}"
+        )
+    return list(regions)
+
+
+def _rasterize_boxes(
+    mask: NDArray[np.bool_], boxes: ArrayLike | None
+) -> list[tuple[slice, slice]]:
+    if boxes is None:
+        return []
+    boxes = np.asarray(boxes, dtype=float)
+    if boxes.size == 0:
+        return []
+    if boxes.ndim != 2 or boxes.shape[1] != 4:
+        raise ValueError(f"boxes must have shape (M, 4), but got {boxes.shape}")
+    if not np.isfinite(boxes).all():
+        raise ValueError("boxes must contain only finite values")
+
+    H, W = mask.shape
+    # Inclusive corners: the pixels containing them are covered.
+    corners = np.floor(boxes).astype(np.int64)
+    y1 = np.clip(corners[:, 0], 0, H)
+    x1 = np.clip(corners[:, 1], 0, W)
+    y2 = np.clip(corners[:, 2] + 1, 0, H)
+    x2 = np.clip(corners[:, 3] + 1, 0, W)
+    spans = []
+    for box in zip(y1, x1, y2, x2):
+        ys, xs = slice(box[0], box[2]), slice(box[1], box[3])
+        if ys.start < ys.stop and xs.start < xs.stop:
+            mask[ys, xs] = True
+            spans.append((ys, xs))
+    return spans
+
+
+def _rasterize_polygons(
+    mask: NDArray[np.bool_], polygons: Sequence[ArrayLike] | None
+) -> list[tuple[slice, slice]]:
+    if polygons is None:
+        return []
+    H, W = mask.shape
+    spans = []
+    for polygon in polygons:
+        yx = np.asarray(polygon, dtype=float)
+        if yx.ndim != 2 or yx.shape[1] != 2 or len(yx) < 3:
+            raise ValueError(
+                f"polygons must have vertices of shape (K, 2) with K >= 3, "
+                f"but got {yx.shape}"
+            )
+        # Drawn into a canvas the size of the polygon's bounding box.
+        y1 = max(int(np.floor(yx[:, 0].min())), 0)
+        x1 = max(int(np.floor(yx[:, 1].min())), 0)
+        y2 = min(int(np.floor(yx[:, 0].max())) + 1, H)
+        x2 = min(int(np.floor(yx[:, 1].max())) + 1, W)
+        if y1 >= y2 or x1 >= x2:
+            continue
+        canvas = PIL.Image.new("1", (x2 - x1, y2 - y1))
+        PIL.ImageDraw.Draw(canvas).polygon(
+            [(x - x1, y - y1) for y, x in yx], fill=1, outline=1
+        )
+        ys, xs = slice(y1, y2), slice(x1, x2)
+        mask[ys, xs] |= np.asarray(canvas)
+        spans.append((ys, xs))
+    return spans
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class RegionStats(NamedTuple):
+    """Per-label statistics of a label image.
+
+    Attributes:
+        labels: Sorted label ids present in the image with shape (K,).
+        areas: Pixel count of each label with shape (K,).
+        centroids: Center of mass (y, x) of each label with shape (K, 2).
+        bboxes: Tight bounding boxes with shape (K, 4). [(ymin, xmin, ymax,
+            xmax), ...] where both left-top and right-bottom are inclusive.
+    """
+
+    labels: NDArray[np.integer]
+    areas: NDArray[np.int64]
+    centroids: NDArray[np.float64]
+    bboxes: NDArray[np.float64]
+
+
+def region_stats(label: NDArray[np.integer] | NDArray[np.bool_]) -> RegionStats:
+    """Compute area, centroid and bbox of every label in one pass.
+
+    Args:
+        label: Label image with shape (H, W).
+
+    Returns:
+        RegionStats with one row per label present in the image.
+
+    Example:
+        >>> import imgviz
+        >>> label = imgviz.data.arc2017()["class_label"]
+        >>> stats = imgviz.region_stats(label)
+        >>> largest = stats.labels[stats.areas.argmax()]
+    """
+    if label.ndim != 2:
+        raise ValueError(f"label must be 2 dimensional, but got {label.ndim}")
+    if label.dtype == bool:
+        label = label.astype(np.int32)
+    if not np.issubdtype(label.dtype, np.integer):
+        raise ValueError(f"label dtype must be integer, but got {label.dtype}")
+
+    labels, ids = compact_labels(label)
+    n_label = len(labels)
+
+    runs = _row_runs(ids)
+    lengths = runs.ends - runs.starts + 1
+    areas = np.bincount(runs.ids, weights=lengths, minlength=n_label).astype(np.int64)
+    sum_y = np.bincount(runs.ids, weights=runs.rows * lengths, minlength=n_label)
+    sum_x = np.bincount(
+        runs.ids, weights=(runs.starts + runs.ends) * lengths / 2, minlength=n_label
+    )
+    with np.errstate(invalid="ignore", divide="ignore"):
+        centroids = np.stack([sum_y / areas, sum_x / areas], axis=1)
+
+    bboxes = _runs_to_bboxes(runs, n_id=n_label)
+    return RegionStats(labels=labels, areas=areas, centroids=centroids, bboxes=bboxes)
+
+
+class _Runs(NamedTuple):
+    rows: NDArray[np.intp]
+    starts: NDArray[np.intp]
+    ends: NDArray[np.intp]
+    ids: NDArray[np.intp]
+
+
+def _row_runs(ids: NDArray[np.integer]) -> _Runs:
+    # Horizontal runs of equal ids. Label images are piecewise constant, so
+    # reducing over runs instead of pixels cuts the work by the run length.
+    H, W = ids.shape
+    is_start = np.ones((H, W), dtype=bool)
+    np.not_equal(ids[:, 1:], ids[:, :-1], out=is_start[:, 1:])
+    (starts_flat,) = np.nonzero(is_start.ravel())
+    # Every row begins a run, so a run always ends on its own row.
+    ends_flat = np.append(starts_flat[1:], H * W) - 1
+    rows, starts = np.divmod(starts_flat, W)
+    return _Runs(
+        rows=rows,
+        starts=starts,
+        ends=ends_flat - rows * W,
+        ids=ids.ravel()[starts_flat].astype(np.intp),
+    )
+
+
+def _runs_to_bboxes(runs: _Runs, n_id: int) -> NDArray[np.float64]:
+    valid = (runs.ids >= 0) & (runs.ids < n_id)
+    if not valid.all():
+        runs = _Runs(*(field[valid] for field in runs))
+
+    ymin = np.full(n_id, np.iinfo(np.intp).max, dtype=np.intp)
+    xmin = np.full(n_id, np.iinfo(np.intp).max, dtype=np.intp)
+    ymax = np.full(n_id, -1, dtype=np.intp)
+    xmax = np.full(n_id, -1, dtype=np.intp)
+    np.minimum.at(ymin, runs.ids, runs.rows)
+    np.maximum.at(ymax, runs.ids, runs.rows)
+    np.minimum.at(xmin, runs.ids, runs.starts)
+    np.maximum.at(xmax, runs.ids, runs.ends)
+
+    bboxes = np.stack([ymin, xmin, ymax, xmax], axis=1).astype(np.float64)
+    bboxes[ymax < 0] = 0
+    return bboxes
+
+
+def compact_labels(
+    label: NDArray[np.integer],
+) -> tuple[NDArray[np.integer], NDArray[np.intp]]:
+    """Map the label ids present in an image to 0..K-1.
+
+    Returns:
+        Tuple of (labels, ids): the sorted present label ids with shape (K,),
+        and the image of indices into them with the shape of label.
+    """
+    if label.size == 0:
+        return np.zeros(0, dtype=label.dtype), np.zeros(label.shape, dtype=np.intp)
+
+    min_label = int(label.min())
+    max_label = int(label.max())
+    if max_label - min_label <= label.size:
+        # Dense enough to count directly, which is O(H * W) instead of a sort.
+        offset = label.astype(np.intp) - min_label
+        present = np.flatnonzero(np.bincount(offset.ravel()))
+        compact = np.zeros(max_label - min_label + 1, dtype=np.intp)
+        compact[present] = np.arange(len(present))
+        labels = (present + min_label).astype(label.dtype)
+        return labels, compact[offset]
+
+    labels, ids = np.unique(label, return_inverse=True)
+    return labels, ids.reshape(label.shape).astype(np.intp)
+
+
+def ids_to_bboxes(ids: NDArray[np.integer], n_id: int) -> NDArray[np.float64]:
+    """Compute tight bboxes of the regions of a compact id image.
+
+    Pixels whose id is outside [0, n_id) are ignored, and ids without pixels
+    get a zero bbox.
+    """
+    return _runs_to_bboxes(_row_runs(ids), n_id=n_id)
@@ -4,6 +4,10 @@ import numpy as np
 import PIL.Image
 from numpy.typing import NDArray
 
+# Values processed per pass by the loops that chunk a frame, which keeps their
+# temporaries in cache whatever the frame size.
+CHUNK_SIZE: int = 1 << 16
+
 
 def pillow_to_numpy(image: PIL.Image.Image) -> NDArray[np.uint8]:
     """Convert Pillow image to numpy array."""
@@ -32,11 +36,74 @@ def apply_mask(
     """
     if mask is None:
         return transformed
+    check_mask(image=image, mask=mask)
+
+    dst = image.copy()
+    dst[mask] = transformed[mask]
+    return dst
+
+
+def check_mask(image: NDArray, mask: NDArray[np.bool_]) -> None:
+    """Validate a boolean mask (H, W) for an image (H, W) or (H, W, C)."""
     if mask.dtype != np.bool_:
         raise ValueError(f"mask.dtype must be bool, got {mask.dtype}")
     if mask.shape != image.shape[:2]:
         raise ValueError(f"mask.shape must be {image.shape[:2]}, got {mask.shape}")
 
-    dst = image.copy()
-    dst[mask] = transformed[mask]
-    return dst
+
+def mask_regions(
+    mask: NDArray[np.bool_], gap: tuple[int, int]
+) -> list[tuple[slice, slice]]:
+    """Bounding boxes of the groups of mask pixels.
+
+    Rows and then columns of the mask are cut wherever more than ``gap``
+    consecutive ones are empty, so boxes padded by half the gap are disjoint
+    and every mask pixel lies in exactly one box.
+
+    Returns:
+        Box slices (rows, columns) into the mask.
+    """
+    regions: list[tuple[slice, slice]] = []
+    for ys in _runs(mask.any(axis=1), gap=gap[0]):
+        for xs in _runs(mask[ys].any(axis=0), gap=gap[1]):
+            rows = np.flatnonzero(mask[ys, xs].any(axis=1))
+            regions.append((slice(ys.start + rows[0], ys.start + rows[-1] + 1), xs))
+    return regions
+
+
+def paste_within_mask(
+    out: NDArray,
+    mask: NDArray[np.bool_],
+    patches: list[tuple[slice, slice, NDArray]],
+) -> None:
+    """Write patches (rows, columns, pixels) into out within the mask.
+
+    Patches are pasted after all of them are computed, so out may be the
+    image they were computed from.
+    """
+    for ys, xs, patch in patches:
+        region_mask = mask[ys, xs]
+        out[ys, xs][region_mask] = patch[region_mask]
+
+
+def _runs(flags: NDArray[np.bool_], gap: int) -> list[slice]:
+    # Spans of set flags, merged across at most gap unset ones.
+    index = np.flatnonzero(flags)
+    if index.size == 0:
+        return []
+    breaks = np.flatnonzero(np.diff(index) > gap + 1)
+    starts = index[np.r_[0, breaks + 1]]
+    stops = index[np.r_[breaks, index.size - 1]] + 1
+    return [slice(int(start), int(stop)) for start, stop in zip(starts, stops)]
+
+
+def fft_size(n: int) -> int:
+    """Smallest 5-smooth size >= n, for which FFTs are fast."""
+    while True:
+        m = n
+        for p in (2, 3, 5):
+            while m % p == 0:
+                m //= p
+        if m == 1:
+            return n
+        n += 1
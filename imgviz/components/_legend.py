@@ -8,9 +8,11 @@ import numpy as np
 import PIL.Image
 from numpy.typing import NDArray
 
+from .. import _blend
 from .. import _utils
 from .. import draw as draw_module
 from ..draw import Ink
+from ..draw import TextBackend
 
 LegendItem: TypeAlias = tuple[str, Ink]
 
@@ -21,6 +23,7 @@ def legend(
     font_size: int = 25,
     font_path: str | None = None,
     loc: Literal["lt", "rt", "lb", "rb"] = "rb",
+    text_backend: TextBackend = "pillow",
 ) -> NDArray[np.uint8]:
     """Draw a corner legend of colored boxes with text labels.
 
@@ -31,6 +34,8 @@ def legend(
         font_size: Font size.
         font_path: Font path.
         loc: Corner to place the legend ('lt', 'rt', 'lb', 'rb').
+        text_backend: Text rendering backend ('pillow' or 'atlas'), see
+            :func:`~imgviz.draw.text`.
 
     Returns:
         Output image.
@@ -42,6 +47,7 @@ def legend(
         font_size=font_size,
         font_path=font_path,
         loc=loc,
+        text_backend=text_backend,
     )
     return _utils.pillow_to_numpy(dst)
 
@@ -52,6 +58,7 @@ def legend_(
     font_size: int = 25,
     font_path: str | None = None,
     loc: Literal["lt", "rt", "lb", "rb"] = "rb",
+    text_backend: TextBackend = "pillow",
 ) -> None:
     """Draw a corner legend on a PIL image in-place.
 
@@ -62,6 +69,8 @@ def legend_(
         font_size: Font size.
         font_path: Font path.
         loc: Corner to place the legend ('lt', 'rt', 'lb', 'rb').
+        text_backend: Text rendering backend ('pillow' or 'atlas'), see
+            :func:`~imgviz.draw.text`.
     """
     if len(items) == 0:
         return
@@ -97,7 +106,7 @@ def legend_(
     y1, x1 = yx1.round().astype(int)
     y2, x2 = yx2.round().astype(int)
     region = np.asarray(image)[y1:y2, x1:x2]
-    washed = (alpha * region + alpha * 255).round().astype(np.uint8)
+    washed = _blend.blend(region, color=255, alpha=alpha)
     image.paste(_utils.numpy_to_pillow(washed), (int(x1), int(y1)))
 
     box_size = text_height - 2 * pad
@@ -111,4 +120,5 @@ def legend_(
             text=text,
             size=font_size,
             font_path=font_path,
+            backend=text_backend,
         )
@@ -1,5 +1,7 @@
 from ._arrow import arrow
 from ._arrow import arrow_
+from ._arrow import arrows
+from ._arrow import arrows_
 from ._box_corners import box_corners
 from ._box_corners import box_corners_
 from ._circle import circle
@@ -23,8 +25,12 @@ from ._rounded_rectangle import rounded_rectangle
 from ._rounded_rectangle import rounded_rectangle_
 from ._star import star
 from ._star import star_
+from ._text import TextBackend
+from ._text import set_text_cache_size
 from ._text import text
 from ._text import text_
+from ._text import text_cache_clear
+from ._text import text_cache_info
 from ._text import text_size
 from ._text_in_rectangle import text_in_rectangle
 from ._text_in_rectangle import text_in_rectangle_
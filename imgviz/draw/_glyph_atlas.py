@@ -0,0 +1,159 @@
+import threading
+from typing import NamedTuple
+
+import numpy as np
+import PIL.Image
+import PIL.ImageDraw
+import PIL.ImageFont
+from numpy.typing import NDArray
+
+# Same spacing ImageDraw.text puts between the lines of a multiline string.
+_LINE_SPACING: int = 4
+
+
+class _Glyph(NamedTuple):
+    coverage: NDArray[np.uint8]
+    offset: tuple[int, int]
+    advance: float
+
+
+class RenderedText(NamedTuple):
+    """Coverage mask of a laid-out string.
+
+    Attributes:
+        coverage: Read-only uint8 coverage (alpha) mask with shape (h, w).
+        offset: Offset (y, x) of the mask's left top from the text origin.
+    """
+
+    coverage: NDArray[np.uint8]
+    offset: tuple[int, int]
+
+
+class GlyphAtlas:
+    """Glyphs of one font rasterized once and laid out from cached advances.
+
+    An atlas is shared by every thread drawing with its font, so glyphs are
+    rasterized and inserted under a lock.
+
+    Args:
+        font: FreeType font at the pixel size to rasterize.
+    """
+
+    def __init__(self, font: PIL.ImageFont.FreeTypeFont) -> None:
+        self._font = font
+        self._glyphs: dict[str, _Glyph] = {}
+        self._lock = threading.Lock()
+        self._line_spacing: int = int(font.getbbox("A")[3]) + _LINE_SPACING
+
+    def __len__(self) -> int:
+        return len(self._glyphs)
+
+    def _glyph(self, char: str) -> _Glyph:
+        glyph = self._glyphs.get(char)
+        if glyph is not None:
+            return glyph
+        with self._lock:
+            glyph = self._glyphs.get(char)
+            if glyph is None:
+                glyph = self._rasterize(char)
+                self._glyphs[char] = glyph
+        return glyph
+
+    def _rasterize(self, char: str) -> _Glyph:
+        left, top, right, bottom = (int(v) for v in self._font.getbbox(char))
+        coverage = PIL.Image.new("L", (max(right - left, 0), max(bottom - top, 0)))
+        if coverage.width > 0 and coverage.height > 0:
+            PIL.ImageDraw.Draw(coverage).text(
+                (-left, -top), char, fill=255, font=self._font
+            )
+        coverage_arr = np.asarray(coverage)
+        coverage_arr.setflags(write=False)
+
+        return _Glyph(
+            coverage=coverage_arr,
+            offset=(top, left),
+            advance=float(self._font.getlength(char)),
+        )
+
+    def render(self, text: str) -> RenderedText:
+        """Lay out text and merge its glyph coverages into one mask.
+
+        Glyphs are placed at integer pixels from their advances, without
+        kerning, so the result can differ from ``PIL.ImageDraw.text`` by a
+        pixel of horizontal placement.
+
+        Args:
+            text: Text to render. Lines are split at "\\n".
+
+        Returns:
+            RenderedText with the coverage mask and its offset from the origin.
+        """
+        placements: list[tuple[_Glyph, int, int]] = []
+        for i_line, line in enumerate(text.split("\n")):
+            pen_x = 0.0
+            pen_y = i_line * self._line_spacing
+            for char in line:
+                glyph = self._glyph(char)
+                if glyph.coverage.size > 0:
+                    placements.append(
+                        (
+                            glyph,
+                            pen_y + glyph.offset[0],
+                            int(round(pen_x)) + glyph.offset[1],
+                        )
+                    )
+                pen_x += glyph.advance
+
+        if not placements:
+            coverage = np.zeros((0, 0), dtype=np.uint8)
+            coverage.setflags(write=False)
+            return RenderedText(coverage=coverage, offset=(0, 0))
+
+        ys = np.array([y for _, y, _ in placements])
+        xs = np.array([x for _, _, x in placements])
+        hs = np.array([glyph.coverage.shape[0] for glyph, _, _ in placements])
+        ws = np.array([glyph.coverage.shape[1] for glyph, _, _ in placements])
+        y_min, x_min = int(ys.min()), int(xs.min())
+        height = int((ys + hs).max()) - y_min
+        width = int((xs + ws).max()) - x_min
+
+        coverage = np.zeros((height, width), dtype=np.uint8)
+        for glyph, y, x in placements:
+            h, w = glyph.coverage.shape
+            region = coverage[y - y_min : y - y_min + h, x - x_min : x - x_min + w]
+            np.maximum(region, glyph.coverage, out=region)
+        coverage.setflags(write=False)
+        return RenderedText(coverage=coverage, offset=(y_min, x_min))
+
+
+def blit_coverage_(
+    image: NDArray[np.uint8],
+    coverage: NDArray[np.uint8],
+    yx: tuple[int, int],
+    color: NDArray[np.uint16],
+) -> None:
+    """Alpha-blend a solid color through a coverage mask in-place.
+
+    Args:
+        image: Image with shape (H, W) or (H, W, C) (modified in-place).
+        coverage: Coverage mask with shape (h, w). Parts outside the image are
+            clipped.
+        yx: Left top (y, x) of the mask in the image.
+        color: Color with shape (C,) or () matching the image channels.
+    """
+    height, width = image.shape[:2]
+    y, x = yx
+    h, w = coverage.shape
+    y1, x1 = max(y, 0), max(x, 0)
+    y2, x2 = min(y + h, height), min(x + w, width)
+    if y1 >= y2 or x1 >= x2:
+        return
+
+    alpha = coverage[y1 - y : y2 - y, x1 - x : x2 - x].astype(np.uint16)
+    if image.ndim == 3:
+        alpha = alpha[:, :, None]
+    region = image[y1:y2, x1:x2]
+    blended = region * (255 - alpha) + color * alpha
+    blended += 127
+    blended //= 255
+    region[...] = blended
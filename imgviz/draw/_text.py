@@ -1,4 +1,9 @@
+import functools
 import pathlib
+import threading
+from typing import Literal
+from typing import NamedTuple
+from typing import TypeAlias
 
 import numpy as np
 import PIL.Image
@@ -7,20 +12,135 @@ import PIL.ImageFont
 from numpy.typing import NDArray
 
 from .. import _utils
+from ._glyph_atlas import GlyphAtlas
+from ._glyph_atlas import RenderedText
+from ._glyph_atlas import blit_coverage_
 from ._ink import Ink
 from ._ink import get_pil_ink
 
 _here: pathlib.Path = pathlib.Path(__file__).parent
 _default_font_path: pathlib.Path = _here / "fonts" / "DejaVuSansMono.ttf"
 
+TextBackend: TypeAlias = Literal["pillow", "atlas"]
+
+_DEFAULT_FONT_CACHE_SIZE: int = 32
+_DEFAULT_TEXT_CACHE_SIZE: int = 4096
+
+
+def _load_font(font_path: str, size: int) -> PIL.ImageFont.FreeTypeFont:
+    return PIL.ImageFont.truetype(font=font_path, size=size)
+
+
+def _measure_text(text: str, size: int, font_path: str) -> tuple[int, int]:
+    font = _cached_load_font(font_path, size)
+
+    text_width = 0
+    text_height = 0
+    for line in text.splitlines():
+        if line == "":
+            line = "\n"
+
+        line_width, line_height = font.getbbox(line)[2:]
+        text_width = max(text_width, line_width)
+        text_height += line_height
+
+    return text_height, text_width
+
+
+def _load_glyph_atlas(font_path: str, size: int) -> GlyphAtlas:
+    return GlyphAtlas(font=_cached_load_font(font_path, size))
+
+
+def _render_text(text: str, size: int, font_path: str) -> RenderedText:
+    return _cached_load_glyph_atlas(font_path, size).render(text)
+
+
+# functools.lru_cache is bounded and safe to call from multiple threads; the
+# lock only guards swapping in resized caches.
+_cache_lock: threading.Lock = threading.Lock()
+_cached_load_font = functools.lru_cache(maxsize=_DEFAULT_FONT_CACHE_SIZE)(_load_font)
+_cached_load_glyph_atlas = functools.lru_cache(maxsize=_DEFAULT_FONT_CACHE_SIZE)(
+    _load_glyph_atlas
+)
+_cached_measure_text = functools.lru_cache(maxsize=_DEFAULT_TEXT_CACHE_SIZE)(
+    _measure_text
+)
+_cached_render_text = functools.lru_cache(maxsize=_DEFAULT_TEXT_CACHE_SIZE)(
+    _render_text
+)
+
+
+class TextCacheInfo(NamedTuple):
+    """Hit/miss statistics of the text caches."""
+
+    font: functools._CacheInfo
+    glyph_atlas: functools._CacheInfo
+    text_size: functools._CacheInfo
+    rendered_text: functools._CacheInfo
+
+
+def text_cache_info() -> TextCacheInfo:
+    """Get statistics of the text caches.
+
+    Returns:
+        TextCacheInfo with the hits, misses, maxsize and currsize of the font
+        and glyph atlas caches keyed by (font_path, size), and of the
+        text-size and rendered-text caches keyed by (text, size, font_path).
+    """
+    return TextCacheInfo(
+        font=_cached_load_font.cache_info(),
+        glyph_atlas=_cached_load_glyph_atlas.cache_info(),
+        text_size=_cached_measure_text.cache_info(),
+        rendered_text=_cached_render_text.cache_info(),
+    )
+
+
+def text_cache_clear() -> None:
+    """Clear the text caches and reset their statistics."""
+    with _cache_lock:
+        _cached_render_text.cache_clear()
+        _cached_measure_text.cache_clear()
+        _cached_load_glyph_atlas.cache_clear()
+        _cached_load_font.cache_clear()
+
+
+def set_text_cache_size(
+    font: int | None = _DEFAULT_FONT_CACHE_SIZE,
+    text_size: int | None = _DEFAULT_TEXT_CACHE_SIZE,
+) -> None:
+    """Resize the text caches.
+
+    Resizing drops the cached entries and resets the statistics.
+
+    Args:
+        font: Maximum number of (font_path, size) fonts and glyph atlases to
+            keep. None for unbounded.
+        text_size: Maximum number of (text, size, font_path) measurements
+            and rendered texts to keep. None for unbounded.
+    """
+    for name, maxsize in (("font", font), ("text_size", text_size)):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"{name} must be >= 0 or None, but got {maxsize}")
+
+    global _cached_load_font, _cached_load_glyph_atlas
+    global _cached_measure_text, _cached_render_text
+    with _cache_lock:
+        _cached_load_font = functools.lru_cache(maxsize=font)(_load_font)
+        _cached_load_glyph_atlas = functools.lru_cache(maxsize=font)(_load_glyph_atlas)
+        _cached_measure_text = functools.lru_cache(maxsize=text_size)(_measure_text)
+        _cached_render_text = functools.lru_cache(maxsize=text_size)(_render_text)
+
+
+def _resolve_font_path(font_path: str | pathlib.Path | None) -> str:
+    if font_path is None:
+        font_path = _default_font_path
+    return str(font_path)
+
 
 def _get_font(
     size: int, font_path: str | pathlib.Path | None = None
 ) -> PIL.ImageFont.FreeTypeFont:
-    if font_path is None:
-        font_path = _default_font_path
-    font = PIL.ImageFont.truetype(font=str(font_path), size=size)
-    return font
+    return _cached_load_font(_resolve_font_path(font_path), size)
 
 
 def text_size(
@@ -30,6 +150,9 @@ def text_size(
 ) -> tuple[int, int]:
     """Get text size (height and width).
 
+    Measurements are cached per (text, size, font_path), see
+    :func:`text_cache_info`.
+
     Args:
         text: Text.
         size: Pixel font size.
@@ -38,19 +161,38 @@ def text_size(
     Returns:
         Tuple of (height, width).
     """
-    font = _get_font(size, font_path=font_path)
+    return _cached_measure_text(text, size, _resolve_font_path(font_path))
 
-    text_width = 0
-    text_height = 0
-    for line in text.splitlines():
-        if line == "":
-            line = "\n"
 
-        line_width, line_height = font.getbbox(line)[2:]
-        text_width = max(text_width, line_width)
-        text_height += line_height
+def _resolve_ink(ink: Ink, n_channel: int) -> NDArray[np.uint16]:
+    color = np.atleast_1d(np.asarray(get_pil_ink(ink), dtype=np.uint16))
+    if color.size == 1:
+        return np.repeat(color, n_channel)
+    if color.size == 3 and n_channel == 4:
+        return np.append(color, 255).astype(np.uint16)
+    if color.size < n_channel:
+        raise ValueError(
+            f"color must have 1 or at least {n_channel} values, but got {color.size}"
+        )
+    return color[:n_channel]
 
-    return text_height, text_width
+
+def _text_atlas_(
+    image: NDArray[np.uint8],
+    yx: tuple[float, float],
+    rendered: RenderedText,
+    color: Ink,
+) -> None:
+    n_channel = 1 if image.ndim == 2 else image.shape[2]
+    blit_coverage_(
+        image,
+        coverage=rendered.coverage,
+        yx=(
+            int(yx[0]) + rendered.offset[0],
+            int(yx[1]) + rendered.offset[1],
+        ),
+        color=_resolve_ink(color, n_channel=n_channel),
+    )
 
 
 def text(
@@ -60,8 +202,9 @@ def text(
     size: int,
     color: Ink = (0, 0, 0),
     font_path: str | pathlib.Path | None = None,
+    backend: TextBackend = "pillow",
 ) -> NDArray[np.uint8]:
-    """Draw text on numpy array with Pillow.
+    """Draw text on numpy array.
 
     Args:
         image: Input image.
@@ -70,10 +213,23 @@ def text(
         size: Text size in pixel.
         color: Text RGB color in uint8. Default is (0, 0, 0), which is black.
         font_path: Font path. Default font is DejaVuSansMono.
+        backend: Text rendering backend. 'pillow' rasterizes the text with
+            ``PIL.ImageDraw.text`` on every call. 'atlas' rasterizes each glyph
+            once per (font_path, size), caches the laid-out text, and
+            alpha-blends it into the array with NumPy, which is much faster for
+            repeated labels; glyphs are placed without kerning.
 
     Returns:
         Output image.
     """
+    if backend == "atlas":
+        dst = image.copy()
+        rendered = _cached_render_text(text, size, _resolve_font_path(font_path))
+        _text_atlas_(dst, yx=yx, rendered=rendered, color=color)
+        return dst
+    if backend != "pillow":
+        raise ValueError(f"unsupported backend: {backend}")
+
     dst = _utils.numpy_to_pillow(image)
     text_(image=dst, yx=yx, text=text, size=size, color=color, font_path=font_path)
     return _utils.pillow_to_numpy(dst)
@@ -86,6 +242,7 @@ def text_(
     size: int,
     color: Ink = (0, 0, 0),
     font_path: str | pathlib.Path | None = None,
+    backend: TextBackend = "pillow",
 ) -> None:
     """Draw text on PIL image in-place.
 
@@ -96,9 +253,33 @@ def text_(
         size: Text size in pixel.
         color: Text RGB color in uint8. Default is (0, 0, 0), which is black.
         font_path: Font path. Default font is DejaVuSansMono.
+        backend: Text rendering backend ('pillow' or 'atlas'), see
+            :func:`text`.
     """
+    y1, x1 = yx
+
+    if backend == "atlas":
+        # only the text's own box goes through NumPy, not the whole image
+        rendered = _cached_render_text(text, size, _resolve_font_path(font_path))
+        h, w = rendered.coverage.shape
+        y1, x1 = int(y1), int(x1)
+        box_y1 = max(y1 + rendered.offset[0], 0)
+        box_x1 = max(x1 + rendered.offset[1], 0)
+        box_y2 = min(y1 + rendered.offset[0] + h, image.height)
+        box_x2 = min(x1 + rendered.offset[1] + w, image.width)
+        if box_y1 >= box_y2 or box_x1 >= box_x2:
+            return
+        box = (box_x1, box_y1, box_x2, box_y2)
+        region = np.array(image.crop(box))
+        _text_atlas_(
+            region, yx=(y1 - box_y1, x1 - box_x1), rendered=rendered, color=color
+        )
+        image.paste(_utils.numpy_to_pillow(region), box)
+        return
+    if backend != "pillow":
+        raise ValueError(f"unsupported backend: {backend}")
+
     draw = PIL.ImageDraw.Draw(image)
 
-    y1, x1 = yx
     font = _get_font(size=size, font_path=font_path)
     draw.text(xy=(x1, y1), text=text, fill=get_pil_ink(color), font=font)
@@ -11,6 +11,7 @@ from .. import _color
 from .. import _pad
 from .. import _utils
 from ._rectangle import rectangle_
+from ._text import TextBackend
 from ._text import text_
 from ._text import text_size
 
@@ -91,6 +92,7 @@ def text_in_rectangle(
     yx2: tuple[float, float] | NDArray[np.floating] | None = None,
     font_path: str | pathlib.Path | None = None,
     keep_size: bool = False,
+    backend: TextBackend = "pillow",
 ) -> NDArray[np.uint8]:
     """Draw text in a rectangle.
 
@@ -109,6 +111,8 @@ def text_in_rectangle(
         font_path: Font path.
         keep_size: Force to keep original size (size change happens with
             loc=xx+, xx-).
+        backend: Text rendering backend ('pillow' or 'atlas'), see
+            :func:`~imgviz.draw.text`.
 
     Returns:
         Output image.
@@ -152,6 +156,7 @@ def text_in_rectangle(
         color=color,
         size=size,
         font_path=font_path,
+        backend=backend,
     )
     return _utils.pillow_to_numpy(dst)
 
@@ -166,6 +171,7 @@ def text_in_rectangle_(
     yx1: tuple[float, float] | NDArray[np.floating] | None = None,
     yx2: tuple[float, float] | NDArray[np.floating] | None = None,
     font_path: str | pathlib.Path | None = None,
+    backend: TextBackend = "pillow",
 ) -> None:
     """Draw text in a rectangle on PIL image in-place.
 
@@ -182,6 +188,8 @@ def text_in_rectangle_(
         yx2: Coordinate of the rectangle maximum (y_max, x_max). None for
             (height-1, width-1).
         font_path: Font path.
+        backend: Text rendering backend ('pillow' or 'atlas'), see
+            :func:`~imgviz.draw.text`.
     """
     if color is None:
         color = _color.get_fg_color(background)
@@ -207,4 +215,5 @@ def text_in_rectangle_(
         color=color,
         size=size,
         font_path=font_path,
+        backend=backend,
     )
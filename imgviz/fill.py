@@ -6,6 +6,8 @@ import dataclasses
 import numpy as np
 from numpy.typing import NDArray
 
+from . import _blend as _blend_module
+
 
 @dataclasses.dataclass
 class Fill(abc.ABC):
@@ -128,14 +130,11 @@ def _blend(
 ) -> NDArray[np.uint8]:
     if not 0.0 <= alpha <= 1.0:
         raise ValueError(f"alpha must be in range [0.0, 1.0], got {alpha}")
-    if copy:
-        image = image.copy()
-    image[mask] = np.clip(
-        (
-            (1 - alpha) * image[mask].astype(np.float32)
-            + alpha * np.array(color, dtype=np.float32)
-        ).round(),
-        0,
-        255,
-    ).astype(np.uint8)
-    return image
+    return _blend_module.blend(
+        image,
+        color=np.asarray(color),
+        alpha=alpha,
+        mask=mask,
+        out=None if copy else image,
+        dtype=np.float32,
+    )
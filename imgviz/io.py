@@ -1,4 +1,6 @@
 import pathlib
+from collections.abc import Iterator
+from typing import Literal
 
 import numpy as np
 import PIL.Image
@@ -7,6 +9,20 @@ from numpy.typing import NDArray
 from . import _utils
 from ._label import label_colormap
 
+try:
+    import cv2
+except ImportError:
+    cv2 = None  # type: ignore[assignment]
+
+# Middlebury .flo: float32 magic, int32 width and height, then row-major
+# little-endian float32 (u, v) pairs.
+_FLO_MAGIC: float = 202021.25
+_FLO_HEADER_SIZE: int = 12
+
+# KITTI flow PNG: 16-bit (u, v, valid) with flow = (value - 2 ** 15) / 64.
+_KITTI_SCALE: float = 64.0
+_KITTI_OFFSET: float = 2.0**15
+
 
 def imread(filename: str | pathlib.Path) -> NDArray[np.uint8]:
     """Read image from file.
@@ -53,3 +69,149 @@ def lblsave(filename: str | pathlib.Path, lbl: NDArray[np.uint8]) -> None:
 
 def imshow(image: NDArray[np.uint8]) -> None:
     _utils.numpy_to_pillow(image).show()
+
+
+def flowread(
+    filename: str | pathlib.Path,
+    mmap_mode: Literal["r", "c"] | None = "r",
+) -> NDArray[np.float32]:
+    """Read optical flow from file.
+
+    Middlebury ``.flo`` files are memory-mapped, so the flow is read from disk
+    lazily and without copies. KITTI 16-bit ``.png`` files are decoded with
+    OpenCV, and pixels marked invalid are read as zero flow.
+
+    Args:
+        filename: Filename ending with '.flo' or '.png'.
+        mmap_mode: Memory-map mode of a '.flo' file, as in :func:`numpy.load`:
+            'r' for read-only, 'c' for copy-on-write, or None to read it into
+            memory. Ignored for '.png'.
+
+    Returns:
+        Optical flow (u, v) with shape (H, W, 2) and dtype np.float32.
+    """
+    suffix = pathlib.Path(filename).suffix.lower()
+    if suffix == ".flo":
+        return _read_flo(filename, mmap_mode=mmap_mode)
+    if suffix == ".png":
+        return _read_kitti_flow(filename)
+    raise ValueError(f"filename must end with '.flo' or '.png': {filename}")
+
+
+def flowwrite(filename: str | pathlib.Path, flow: NDArray[np.floating]) -> None:
+    """Write optical flow to file.
+
+    Args:
+        filename: Filename ending with '.flo' (Middlebury) or '.png' (KITTI
+            16-bit, where non-finite vectors are marked invalid).
+        flow: Optical flow (u, v) with shape (H, W, 2).
+    """
+    if flow.ndim != 3 or flow.shape[2] != 2:
+        raise ValueError(f"flow must have shape (H, W, 2), but got {flow.shape}")
+    suffix = pathlib.Path(filename).suffix.lower()
+    if suffix not in (".flo", ".png"):
+        raise ValueError(f"filename must end with '.flo' or '.png': {filename}")
+
+    path = pathlib.Path(filename)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if suffix == ".flo":
+        height, width = flow.shape[:2]
+        with open(path, "wb") as f:
+            f.write(np.array(_FLO_MAGIC, dtype="<f4").tobytes())
+            f.write(np.array([width, height], dtype="<i4").tobytes())
+            np.ascontiguousarray(flow, dtype="<f4").tofile(f)
+    else:
+        _write_kitti_flow(path, flow)
+
+
+def flowread_dir(
+    dirname: str | pathlib.Path,
+    batch_size: int = 1,
+    pattern: str = "*",
+) -> Iterator[tuple[list[pathlib.Path], NDArray[np.float32]]]:
+    """Stream optical flow files in a directory in batches.
+
+    Files are read in sorted order with :func:`flowread`, so each batch only
+    copies its own frames, and can be passed as is to
+    :class:`~imgviz.Flow2Rgb`. A batch ends early where the flow size changes.
+
+    Args:
+        dirname: Directory of '.flo' or '.png' flow files.
+        batch_size: Maximum number of frames per batch.
+        pattern: Glob pattern of the files to read, e.g. '*_10.png'.
+
+    Yields:
+        Tuple of (filenames, flows) with flows of shape (N, H, W, 2).
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, but got {batch_size}")
+    filenames = sorted(
+        path
+        for path in pathlib.Path(dirname).glob(pattern)
+        if path.suffix.lower() in (".flo", ".png")
+    )
+
+    batch_files: list[pathlib.Path] = []
+    batch_flows: list[NDArray[np.float32]] = []
+    for filename in filenames:
+        flow = flowread(filename)
+        if batch_flows and (
+            len(batch_flows) == batch_size or flow.shape != batch_flows[0].shape
+        ):
+            yield batch_files, np.stack(batch_flows)
+            batch_files, batch_flows = [], []
+        batch_files.append(filename)
+        batch_flows.append(flow)
+    if batch_flows:
+        yield batch_files, np.stack(batch_flows)
+
+
+def _read_flo(
+    filename: str | pathlib.Path, mmap_mode: Literal["r", "c"] | None
+) -> NDArray[np.float32]:
+    with open(filename, "rb") as f:
+        header = f.read(_FLO_HEADER_SIZE)
+        if len(header) < _FLO_HEADER_SIZE or (
+            np.frombuffer(header, dtype="<f4", count=1)[0] != _FLO_MAGIC
+        ):
+            raise OSError(f"invalid .flo file: {filename}")
+        width, height = np.frombuffer(header, dtype="<i4", offset=4).tolist()
+        n_byte = f.seek(0, 2)
+    if n_byte < _FLO_HEADER_SIZE + 8 * width * height:
+        raise OSError(f"truncated .flo file: {filename}")
+
+    shape = (height, width, 2)
+    if mmap_mode is None:
+        flow = np.fromfile(
+            filename, dtype="<f4", count=2 * width * height, offset=_FLO_HEADER_SIZE
+        )
+        return flow.reshape(shape).astype(np.float32, copy=False)
+    return np.memmap(
+        filename, dtype="<f4", mode=mmap_mode, offset=_FLO_HEADER_SIZE, shape=shape
+    )
+
+
+def _read_kitti_flow(filename: str | pathlib.Path) -> NDArray[np.float32]:
+    if cv2 is None:
+        raise ImportError("opencv-python is required to read 16-bit flow PNGs")
+    bgr = cv2.imread(str(filename), cv2.IMREAD_UNCHANGED)
+    if bgr is None or bgr.dtype != np.uint16 or bgr.ndim != 3 or bgr.shape[2] != 3:
+        raise OSError(f"invalid KITTI flow file: {filename}")
+    flow = bgr[:, :, 2:0:-1].astype(np.float32)
+    flow -= _KITTI_OFFSET
+    flow /= _KITTI_SCALE
+    flow[bgr[:, :, 0] == 0] = 0
+    return flow
+
+
+def _write_kitti_flow(path: pathlib.Path, flow: NDArray[np.floating]) -> None:
+    if cv2 is None:
+        raise ImportError("opencv-python is required to write 16-bit flow PNGs")
+    valid = np.isfinite(flow).all(axis=2)
+    encoded = np.round(np.nan_to_num(flow) * _KITTI_SCALE + _KITTI_OFFSET)
+    bgr = np.empty(flow.shape[:2] + (3,), dtype=np.uint16)
+    bgr[:, :, 2:0:-1] = np.clip(encoded, 0, 2**16 - 1)
+    bgr[:, :, 0] = valid
+    bgr[~valid, 1:] = 0
+    if not cv2.imwrite(str(path), bgr):
+        raise OSError(f"failed to write KITTI flow file: {path}")
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+import imgviz
+
+
+def test_EmaRange_tracks_min_max() -> None:
+    estimator = imgviz.EmaRange(decay=0.5, stride=1)
+    assert estimator.vmin is None
+
+    estimator.update(np.array([0.0, 10.0]))
+    assert (estimator.vmin, estimator.vmax) == (0.0, 10.0)
+
+    estimator.update(np.array([2.0, 20.0, np.nan]))
+    assert (estimator.vmin, estimator.vmax) == (1.0, 15.0)
+
+
+def test_EmaRange_ignores_frames_without_finite_values() -> None:
+    estimator = imgviz.EmaRange()
+
+    estimator.update(np.array([np.nan, np.inf]))
+
+    assert estimator.vmin is None
+    assert estimator.vmax is None
+
+
+def test_PercentileRange_matches_percentiles() -> None:
+    rng = np.random.default_rng(seed=0)
+    samples = rng.normal(size=100_000)
+    estimator = imgviz.PercentileRange(low=5, high=95, bins=4096, decay=1)
+
+    for chunk in np.array_split(samples, 10):
+        estimator.update(chunk)
+
+    expected_low, expected_high = np.percentile(samples, [5, 95])
+    assert estimator.vmin == pytest.approx(expected_low, abs=0.01)
+    assert estimator.vmax == pytest.approx(expected_high, abs=0.01)
+
+
+def test_PercentileRange_widens_for_drifting_stream() -> None:
+    estimator = imgviz.PercentileRange(low=0, high=100, decay=0)
+
+    estimator.update(np.linspace(0, 1, 100))
+    estimator.update(np.linspace(100, 101, 100))
+
+    assert estimator.vmin == pytest.approx(100, abs=0.5)
+    assert estimator.vmax == pytest.approx(101, abs=0.5)
+
+
+def test_PercentileRange_rejects_invalid_percentiles() -> None:
+    with pytest.raises(ValueError, match="percentiles must satisfy"):
+        imgviz.PercentileRange(low=90, high=10)
+
+
+def test_Colorize_autorange_follows_stream() -> None:
+    colorizer = imgviz.Colorize(autorange=imgviz.EmaRange(decay=0, stride=2))
+    first = np.linspace(0, 1, 100, dtype=np.float32).reshape(10, 10)
+
+    colorizer(first)
+    colorizer(first * 4)
+
+    assert colorizer.vmin == pytest.approx(0.0)
+    assert colorizer.vmax == pytest.approx(4 * first[::2, ::2].max())
+
+
+def test_Colorize_autorange_keeps_explicit_vmin() -> None:
+    colorizer = imgviz.Colorize(vmin=-1.0, autorange=imgviz.EmaRange(stride=1))
+
+    colorizer(np.linspace(0, 1, 100, dtype=np.float32).reshape(10, 10))
+
+    assert colorizer.vmin == -1.0
+    assert colorizer.vmax == pytest.approx(1.0)
+
+
+def test_Flow2Rgb_autorange() -> None:
+    converter = imgviz.Flow2Rgb(autorange=imgviz.EmaRange(decay=0, stride=1))
+    flow = np.full((4, 4, 2), [3.0, 4.0], dtype=np.float32)
+
+    converter(flow)
+    viz = converter(flow * 2)
+
+    assert converter.max_norm == pytest.approx(10.0)
+    np.testing.assert_array_equal(viz, imgviz.flow2rgb(flow * 2, max_norm=10.0))
+
+
+def test_Flow2Rgb_rejects_max_norm_with_autorange() -> None:
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        imgviz.Flow2Rgb(max_norm=1.0, autorange=imgviz.EmaRange())
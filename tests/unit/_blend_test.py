@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from imgviz._blend import blend
+
+
+def _reference(
+    image: NDArray[np.uint8],
+    color: NDArray,
+    alpha: float | NDArray[np.floating],
+    rounding: str = "round",
+) -> NDArray[np.uint8]:
+    values = (1 - alpha) * image.astype(float) + alpha * np.asarray(color, float)
+    if rounding == "round":
+        values = values.round()
+    return np.clip(values, 0, 255).astype(np.uint8)
+
+
+@pytest.fixture
+def image() -> NDArray[np.uint8]:
+    rng = np.random.default_rng(seed=0)
+    return rng.integers(0, 256, size=(20, 30, 3), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("rounding", ["round", "floor"])
+@pytest.mark.parametrize("alpha", [0.0, 0.3, 0.5, 1 / 3, 1.0])
+def test_blend_scalar_alpha(
+    image: NDArray[np.uint8], alpha: float, rounding: str
+) -> None:
+    color = np.array([255, 10, 128], dtype=np.uint8)
+
+    result = blend(image, color=color, alpha=alpha, rounding=rounding)
+
+    expected = _reference(image, color, alpha, rounding=rounding)
+    np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize("n_label", [3, 40])
+def test_blend_per_label(image: NDArray[np.uint8], n_label: int) -> None:
+    rng = np.random.default_rng(seed=1)
+    colors = rng.integers(0, 256, size=(n_label, 3), dtype=np.uint8)
+    alphas = rng.random(n_label)
+    index = rng.integers(0, n_label, size=image.shape[:2])
+
+    result = blend(image, color=colors, alpha=alphas, index=index)
+
+    expected = _reference(image, colors[index], alphas[index][:, :, None])
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_blend_per_pixel_alpha(image: NDArray[np.uint8]) -> None:
+    alpha = np.random.default_rng(seed=2).random(image.shape[:2])
+    color = image[::-1].copy()
+
+    result = blend(image, color=color, alpha=alpha)
+
+    np.testing.assert_array_equal(result, _reference(image, color, alpha[:, :, None]))
+
+
+def test_blend_mask_and_out(image: NDArray[np.uint8]) -> None:
+    mask = np.zeros(image.shape[:2], dtype=bool)
+    mask[5:10, 3:25] = True
+    out = image.copy()
+
+    result = blend(out, color=(0, 0, 255), alpha=0.4, mask=mask, out=out)
+
+    assert result is out
+    np.testing.assert_array_equal(out[~mask], image[~mask])
+    np.testing.assert_array_equal(
+        out[mask], _reference(image[mask], np.array([0, 0, 255]), 0.4)
+    )
+
+
+def test_blend_float32_matches_float32_arithmetic(image: NDArray[np.uint8]) -> None:
+    alpha = 0.3
+    color = np.array([1, 2, 3], dtype=np.float32)
+
+    result = blend(image, color=color, alpha=alpha, dtype=np.float32)
+
+    expected = ((1 - alpha) * image.astype(np.float32) + alpha * color).round()
+    np.testing.assert_array_equal(result, expected.astype(np.uint8))
+
+
+def test_blend_requires_index_for_per_label_alpha(image: NDArray[np.uint8]) -> None:
+    with pytest.raises(ValueError, match="index is required"):
+        blend(image, color=(0, 0, 0), alpha=np.array([0.5, 0.2]))
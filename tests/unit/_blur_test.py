@@ -32,10 +32,10 @@ def test_blur_within_mask() -> None:
     assert not np.array_equal(dst[mask], img[mask])
 
 
-def test_blur_rejects_non_uint8_image() -> None:
-    img = np.zeros((40, 50, 3), dtype=np.uint16)
+def test_blur_rejects_non_numeric_image() -> None:
+    img = np.zeros((40, 50, 3), dtype=bool)
 
-    with pytest.raises(ValueError, match=r"image\.dtype must be uint8"):
+    with pytest.raises(ValueError, match=r"image\.dtype must be integer or floating"):
         imgviz.blur(img, sigma=4.0)
 
 
@@ -51,3 +51,137 @@ def test_blur_rejects_invalid_ndim() -> None:
 
     with pytest.raises(ValueError, match=r"image\.ndim must be 2 or 3"):
         imgviz.blur(img, sigma=4.0)
+
+
+@pytest.mark.parametrize("sigma", [0.0, 1.0, 4.0, 12.5])
+@pytest.mark.parametrize("shape", [(90, 120, 3), (90, 120)], ids=["rgb", "gray"])
+def test_blur_within_mask_matches_whole_image(
+    sigma: float, shape: tuple[int, ...]
+) -> None:
+    rng = np.random.default_rng(seed=0)
+    img = rng.integers(0, 256, size=shape).astype(np.uint8)
+    mask = np.zeros((90, 120), dtype=bool)
+    mask[0:10, 0:15] = True
+    mask[40:52, 50:70] = True
+    mask[45:60, 100:120] = True
+    mask[85:90, 5:8] = True
+    mask &= rng.random((90, 120)) < 0.9
+
+    dst = imgviz.blur(img, sigma=sigma, mask=mask)
+
+    expected = img.copy()
+    expected[mask] = imgviz.blur(img, sigma=sigma)[mask]
+    np.testing.assert_array_equal(dst, expected)
+
+
+@pytest.mark.parametrize("shape", [(30, 40, 3), (30, 40, 4), (30, 40, 2), (30, 40, 6)])
+def test_blur_multiband_matches_per_channel(shape: tuple[int, ...]) -> None:
+    rng = np.random.default_rng(seed=0)
+    img = rng.integers(0, 256, size=shape).astype(np.uint8)
+
+    dst = imgviz.blur(img, sigma=3.0)
+
+    for c in range(shape[2]):
+        np.testing.assert_array_equal(dst[..., c], imgviz.blur(img[..., c], sigma=3.0))
+
+
+@pytest.mark.parametrize("sigma", [0.5, 2.0, 5.0])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_blur_float_matches_scipy(
+    sigma: float, dtype: type[np.float32] | type[np.float64]
+) -> None:
+    scipy_ndimage = pytest.importorskip("scipy.ndimage")
+    rng = np.random.default_rng(seed=0)
+    img = rng.random((60, 70, 3)).astype(dtype)
+
+    dst = imgviz.blur(img, sigma=sigma)
+
+    expected = scipy_ndimage.gaussian_filter(
+        img.astype(np.float64), sigma=(sigma, sigma, 0), mode="nearest", truncate=4.0
+    )
+    assert dst.dtype == dtype
+    np.testing.assert_allclose(
+        dst, expected, atol=1e-6 if dtype == np.float32 else 1e-12
+    )
+
+
+def test_blur_box_approximates_gaussian() -> None:
+    rng = np.random.default_rng(seed=0)
+    img = rng.random((120, 150)).astype(np.float32)
+    img[40:80, 50:100] += 1.0
+
+    dst = imgviz.blur(img, sigma=10.0, method="box")
+
+    expected = imgviz.blur(img, sigma=10.0)
+    assert dst.dtype == np.float32
+    # Away from the borders, where the boxes clamp differently.
+    assert np.abs(dst - expected)[30:-30, 30:-30].max() < 0.03
+
+
+@pytest.mark.parametrize("sigma", [0.1, 0.5])
+def test_blur_box_small_sigma_averages_neighbors(sigma: float) -> None:
+    rng = np.random.default_rng(seed=0)
+    img = rng.random((20, 30)).astype(np.float64)
+
+    dst = imgviz.blur(img, sigma=sigma, method="box")
+
+    # One box of radius 1 per axis, i.e. the 3x3 mean away from the borders.
+    windows = np.lib.stride_tricks.sliding_window_view(img, (3, 3))
+    np.testing.assert_allclose(dst[1:-1, 1:-1], windows.mean(axis=(2, 3)))
+    np.testing.assert_array_equal(imgviz.blur(img, sigma=0, method="box"), img)
+
+
+def test_blur_box_channels_match_single_channels() -> None:
+    rng = np.random.default_rng(seed=0)
+    img = rng.random((37, 53, 3)).astype(np.float64)
+
+    dst = imgviz.blur(img, sigma=6.0, method="box")
+
+    for c in range(3):
+        np.testing.assert_allclose(
+            dst[:, :, c], imgviz.blur(img[:, :, c], sigma=6.0, method="box")
+        )
+
+
+def test_blur_box_is_ignored_for_uint8() -> None:
+    rng = np.random.default_rng(seed=0)
+    img = rng.integers(0, 256, size=(40, 50, 3)).astype(np.uint8)
+
+    np.testing.assert_array_equal(
+        imgviz.blur(img, sigma=5.0, method="box"), imgviz.blur(img, sigma=5.0)
+    )
+
+
+@pytest.mark.parametrize("method", ["gaussian", "box"])
+def test_blur_integer_image_rounds_back(method: str) -> None:
+    rng = np.random.default_rng(seed=0)
+    img = rng.integers(0, 65536, size=(40, 50)).astype(np.uint16)
+
+    dst = imgviz.blur(img, sigma=20.0, method=method)  # type: ignore[arg-type]
+
+    assert dst.dtype == np.uint16
+    expected = imgviz.blur(img.astype(np.float32), sigma=20.0, method=method)  # type: ignore[arg-type]
+    np.testing.assert_array_equal(dst, np.round(expected))
+
+
+@pytest.mark.parametrize("method", ["gaussian", "box"])
+def test_blur_float_within_mask_matches_whole_image(method: str) -> None:
+    rng = np.random.default_rng(seed=0)
+    img = rng.random((90, 120, 3)).astype(np.float32)
+    mask = np.zeros((90, 120), dtype=bool)
+    mask[5:20, 10:30] = True
+    mask[60:80, 80:110] = True
+
+    dst = imgviz.blur(img, sigma=15.0, mask=mask, method=method)  # type: ignore[arg-type]
+
+    expected = img.copy()
+    expected[mask] = imgviz.blur(img, sigma=15.0, method=method)[mask]  # type: ignore[arg-type]
+    np.testing.assert_allclose(dst, expected, atol=1e-5)
+    np.testing.assert_array_equal(dst[~mask], img[~mask])
+
+
+def test_blur_rejects_unknown_method() -> None:
+    img = np.zeros((40, 50), dtype=np.float32)
+
+    with pytest.raises(ValueError, match="method must be 'gaussian' or 'box'"):
+        imgviz.blur(img, method="median")  # type: ignore[arg-type]
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+import skimage.morphology
+import skimage.segmentation
+
+from imgviz._boundary import find_boundaries
+
+
+@pytest.mark.parametrize("width", [1, 2, 4])
+@pytest.mark.parametrize("dtype", [bool, np.int32])
+def test_find_boundaries_matches_skimage(width: int, dtype: type) -> None:
+    rng = np.random.default_rng(seed=0)
+    label = rng.integers(-1, 3, size=(30, 40)).astype(dtype)
+
+    expected = skimage.segmentation.find_boundaries(label, connectivity=2)
+    for _ in range(width - 1):
+        expected = skimage.morphology.binary_dilation(expected)
+
+    np.testing.assert_array_equal(find_boundaries(label, width=width), expected)
+
+
+def test_find_boundaries_marks_both_sides() -> None:
+    mask = np.zeros((5, 6), dtype=bool)
+    mask[:, 3:] = True
+
+    boundary = find_boundaries(mask)
+
+    np.testing.assert_array_equal(boundary.any(axis=0), [0, 0, 1, 1, 0, 0])
+    assert boundary[:, 2:4].all()
+
+
+def test_find_boundaries_batch_matches_single() -> None:
+    rng = np.random.default_rng(seed=0)
+    masks = rng.random((3, 20, 20)) > 0.8
+
+    batch = find_boundaries(masks, width=3)
+
+    for mask, boundary in zip(masks, batch):
+        np.testing.assert_array_equal(boundary, find_boundaries(mask, width=3))
+
+
+def test_find_boundaries_rejects_zero_width() -> None:
+    with pytest.raises(ValueError, match="width must be >= 1"):
+        find_boundaries(np.zeros((4, 4), dtype=bool), width=0)
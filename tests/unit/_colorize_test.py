@@ -1,6 +1,7 @@
 import cmap
 import numpy as np
 import pytest
+from numpy.typing import NDArray
 
 import imgviz
 
@@ -24,7 +25,7 @@ def test_colorize_invalid_dtype() -> None:
 
 
 def test_colorize_invalid_ndim() -> None:
-    scalar = np.zeros((4, 4, 3), dtype=np.float32)
+    scalar = np.zeros((2, 4, 4, 3), dtype=np.float32)
 
     with pytest.raises(ValueError, match="2 dimensional"):
         imgviz.colorize(scalar)
@@ -97,3 +98,88 @@ def test_colorize_nan_renders_as_black() -> None:
     out = imgviz.colorize(scalar, vmin=0.0, vmax=1.0)
 
     np.testing.assert_array_equal(out[0, 1], [0, 0, 0])
+
+
+@pytest.mark.parametrize("cmap_name", ["viridis", "jet"])
+def test_colorize_lut_matches_per_pixel_colormap(cmap_name: str) -> None:
+    data = imgviz.data.arc2017()
+
+    via_lut = imgviz.colorize(data["depth"], cmap=cmap_name)
+    per_pixel = imgviz.colorize(data["depth"], cmap=cmap_name, lut_size=None)
+
+    np.testing.assert_array_equal(via_lut, per_pixel)
+
+
+@pytest.mark.parametrize("lut_size", [1024, 4096])
+def test_colorize_lut_size(lut_size: int) -> None:
+    scalar = np.linspace(0, 1, 10000, dtype=np.float32).reshape(100, 100)
+    scalar[0, 0] = np.nan
+
+    out = imgviz.colorize(scalar, lut_size=lut_size)
+
+    np.testing.assert_array_equal(out[0, 0], [0, 0, 0])
+    expected = imgviz.colorize(scalar, lut_size=None)
+    # Finer bins differ from the 256-bin colormap by at most about one bin.
+    assert np.abs(out.astype(int) - expected).max() <= 3
+
+
+def test_colorize_calls_other_callables_per_pixel_by_default() -> None:
+    scalar = np.linspace(0, 1, 10000, dtype=np.float32).reshape(100, 100)
+
+    def cmap_func(x: NDArray) -> NDArray:
+        return np.stack([x, x**2, 1 - x, np.ones_like(x)], axis=-1)
+
+    out = imgviz.colorize(scalar, cmap=cmap_func)
+
+    np.testing.assert_array_equal(
+        out, imgviz.colorize(scalar, cmap=cmap_func, lut_size=None)
+    )
+    # Sampling at 256 bin centers would shift the colors.
+    assert not np.array_equal(
+        out, imgviz.colorize(scalar, cmap=cmap_func, lut_size=256)
+    )
+
+
+def test_colorize_invalid_lut_size() -> None:
+    with pytest.raises(ValueError, match="lut_size must be"):
+        imgviz.Colorize(lut_size=0)
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.int8, np.uint16, np.int16])
+def test_colorize_integer_matches_float32(dtype: type[np.integer]) -> None:
+    info = np.iinfo(dtype)
+    rng = np.random.default_rng(seed=0)
+    scalar = rng.integers(info.min, info.max, size=(20, 30), endpoint=True)
+    scalar = scalar.astype(dtype)
+
+    out = imgviz.colorize(scalar)
+
+    np.testing.assert_array_equal(out, imgviz.colorize(scalar.astype(np.float32)))
+
+
+def test_Colorize_integer_window_is_cached() -> None:
+    colorizer = imgviz.Colorize(vmin=1000, vmax=3000)
+    depth = np.array([[0, 1000], [2000, 3000]], dtype=np.uint16)
+
+    first = colorizer(depth)
+    second = colorizer(depth[::-1])
+
+    np.testing.assert_array_equal(second, first[::-1])
+    np.testing.assert_array_equal(
+        first, imgviz.colorize(depth.astype(np.float32), vmin=1000, vmax=3000)
+    )
+
+
+def test_colorize_batch_shares_normalization() -> None:
+    rng = np.random.default_rng(seed=0)
+    batch = rng.random((3, 10, 12)).astype(np.float32)
+    batch[1] *= 2
+
+    out = imgviz.colorize(batch)
+
+    assert out.shape == (3, 10, 12, 3)
+    vmin, vmax = batch.min(), batch.max()
+    for frame, frame_out in zip(batch, out):
+        np.testing.assert_array_equal(
+            frame_out, imgviz.colorize(frame, vmin=vmin, vmax=vmax)
+        )
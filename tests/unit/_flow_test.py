@@ -100,3 +100,157 @@ def test_Flow2Rgb_keeps_explicit_max_norm(flow_3_4: NDArray[np.float32]) -> None
 
     assert converter.max_norm == pytest.approx(2.0)
     np.testing.assert_array_equal(viz, imgviz.flow2rgb(flow_3_4, max_norm=2.0))
+
+
+def test_flow2rgb_batch_shares_max_norm() -> None:
+    rng = np.random.default_rng(seed=0)
+    batch = rng.normal(size=(3, 8, 10, 2)).astype(np.float32)
+
+    viz, max_norm = imgviz.flow2rgb(batch, return_max=True)
+
+    assert viz.shape == (3, 8, 10, 3)
+    assert max_norm == np.linalg.norm(batch, axis=-1).max()
+    for frame, frame_viz in zip(batch, viz):
+        np.testing.assert_array_equal(
+            frame_viz, imgviz.flow2rgb(frame, max_norm=max_norm)
+        )
+
+
+def _reference_flow_color(
+    flow_u: NDArray[np.float32], flow_v: NDArray[np.float32]
+) -> NDArray[np.uint8]:
+    # Channel-by-channel float64 colorization that the float32 pass replaced.
+    colorwheel = imgviz._flow._make_colorwheel()
+    ncols = colorwheel.shape[0]
+
+    rad = np.sqrt(np.square(flow_u) + np.square(flow_v))
+    a = np.arctan2(-flow_v, -flow_u) / np.pi
+    fk = (a + 1) / 2 * (ncols - 1) + 1
+    k0 = np.floor(fk).astype(np.int32)
+    f = fk - k0
+    k0[k0 == ncols] = 1
+    k1 = k0 + 1
+    k1[k1 == ncols] = 1
+
+    flow_image = np.zeros(flow_u.shape + (3,), np.uint8)
+    for i in range(3):
+        col = (1 - f) * colorwheel[k0, i] / 255.0 + f * colorwheel[k1, i] / 255.0
+        idx = rad <= 1
+        col[idx] = 1 - rad[idx] * (1 - col[idx])
+        col[~idx] = col[~idx] * 0.75
+        flow_image[:, :, i] = np.floor(255 * col)
+    return flow_image
+
+
+def test_flow2rgb_within_one_of_float64_reference() -> None:
+    rng = np.random.default_rng(seed=0)
+    flow = rng.normal(size=(200, 300, 2)).astype(np.float32)
+
+    viz, max_norm = imgviz.flow2rgb(flow, return_max=True)
+
+    scaled = flow / (max_norm + np.finfo(np.float32).eps)
+    expected = _reference_flow_color(scaled[:, :, 0], scaled[:, :, 1])
+    assert np.abs(viz.astype(int) - expected).max() <= 1
+
+
+def test_flow2quiver() -> None:
+    data = imgviz.data.middlebury()
+    flow: NDArray[np.float32] = data["flow"]
+
+    quiver = imgviz.flow2quiver(flow, image=data["rgb"], stride=16)
+
+    assert quiver.dtype == np.uint8
+    assert quiver.shape == data["rgb"].shape
+    assert not np.array_equal(quiver, data["rgb"])
+
+
+def test_flow2quiver_colors_arrows_like_flow2rgb() -> None:
+    rng = np.random.default_rng(seed=0)
+    flow = rng.normal(scale=3, size=(64, 64, 2)).astype(np.float32)
+
+    quiver = imgviz.flow2quiver(flow, stride=16)
+
+    # Tails sit at the cell centers and take the dense color of their vector.
+    flow_rgb = imgviz.flow2rgb(flow)
+    ys, xs = np.meshgrid([8, 24, 40, 56], [8, 24, 40, 56], indexing="ij")
+    np.testing.assert_array_equal(quiver[ys, xs], flow_rgb[ys, xs])
+
+
+def test_flow2quiver_arrow_length_and_direction() -> None:
+    flow = np.zeros((32, 32, 2), dtype=np.float32)
+    flow[..., 0] = 4.0  # u: +x
+
+    quiver = imgviz.flow2quiver(flow, stride=32, scale=2.0, color=(255, 0, 0))
+
+    drawn = np.any(quiver != 0, axis=2)
+    np.testing.assert_array_equal(np.flatnonzero(drawn[16]), np.arange(16, 25))
+
+
+def test_flow2quiver_batch() -> None:
+    rng = np.random.default_rng(seed=0)
+    flow = rng.normal(size=(2, 32, 48, 2)).astype(np.float32)
+
+    quiver = imgviz.flow2quiver(flow, stride=8, scale=2.0, max_norm=3.0)
+
+    assert quiver.shape == (2, 32, 48, 3)
+    for frame_quiver, frame_flow in zip(quiver, flow):
+        np.testing.assert_array_equal(
+            frame_quiver,
+            imgviz.flow2quiver(frame_flow, stride=8, scale=2.0, max_norm=3.0),
+        )
+
+
+def test_flow2quiver_skips_non_finite_vectors() -> None:
+    flow = np.full((16, 16, 2), np.nan, dtype=np.float32)
+
+    quiver = imgviz.flow2quiver(flow, stride=4, color=(255, 255, 255))
+
+    np.testing.assert_array_equal(quiver, 0)
+
+
+@pytest.mark.parametrize("scale", [None, 1e30])
+def test_flow2quiver_draws_huge_vectors(scale: float | None) -> None:
+    flow = np.zeros((16, 16, 2), dtype=np.float32)
+    flow[..., 0] = 3e38
+
+    quiver = imgviz.flow2quiver(flow, stride=4, scale=scale, color=(255, 255, 255))
+
+    # Every arrow points right, through the rest of its row.
+    np.testing.assert_array_equal(quiver[2, 2:], 255)
+    assert not quiver[:, 0].any()
+
+
+def test_flow2quiver_ignores_non_finite_vectors_in_max_norm() -> None:
+    rng = np.random.default_rng(seed=0)
+    flow = rng.normal(scale=3, size=(64, 64, 2)).astype(np.float32)
+    flow_with_nan = flow.copy()
+    flow_with_nan[0, 0] = np.nan
+    flow_with_nan[0, 1] = np.inf
+
+    quiver = imgviz.flow2quiver(flow_with_nan, stride=16)
+
+    # The non-finite pixels are not sampled, so zeroing them only drops them
+    # from the maximum norm.
+    flow_with_zero = flow.copy()
+    flow_with_zero[0, :2] = 0
+    assert np.any(quiver != 0)
+    np.testing.assert_array_equal(quiver, imgviz.flow2quiver(flow_with_zero, stride=16))
+
+
+def test_flow2quiver_drops_alpha_of_rgba_image() -> None:
+    rng = np.random.default_rng(seed=0)
+    flow = rng.normal(size=(32, 48, 2)).astype(np.float32)
+    rgba = rng.integers(0, 256, size=(32, 48, 4), dtype=np.uint8)
+
+    quiver = imgviz.flow2quiver(flow, image=rgba, stride=8)
+
+    np.testing.assert_array_equal(
+        quiver, imgviz.flow2quiver(flow, image=rgba[:, :, :3], stride=8)
+    )
+
+
+def test_flow2quiver_rejects_mismatched_image() -> None:
+    flow = np.zeros((32, 48, 2), dtype=np.float32)
+
+    with pytest.raises(ValueError, match="image must have shape"):
+        imgviz.flow2quiver(flow, image=np.zeros((32, 40, 3), dtype=np.uint8))
@@ -1,3 +1,5 @@
+from typing import Literal
+
 import numpy as np
 import pytest
 from numpy.typing import ArrayLike
@@ -99,3 +101,225 @@ def test_heatmap_rejects_non_finite_weights() -> None:
 def test_heatmap_rejects_invalid_sigma(sigma: float) -> None:
     with pytest.raises(ValueError, match="sigma must be"):
         imgviz.heatmap([(1, 1)], shape=(10, 10), sigma=sigma)
+
+
+@pytest.mark.parametrize("sigma", [1.5, 3.0, 10.0])
+@pytest.mark.parametrize("method", ["bilinear", "nearest"])
+def test_heatmap_splat_matches_exact_within_tolerance(
+    sigma: float, method: Literal["bilinear", "nearest"]
+) -> None:
+    rng = np.random.default_rng(seed=0)
+    points = rng.uniform(-20, 120, size=(200, 2))
+    weights = rng.uniform(0.5, 2.0, size=200)
+
+    splat = imgviz.heatmap(
+        points, (100, 80), sigma=sigma, weights=weights, method=method
+    )
+    exact = imgviz.heatmap(
+        points, (100, 80), sigma=sigma, weights=weights, method="exact"
+    )
+
+    tolerance = 0.25 / sigma**2 + 0.012 if method == "bilinear" else 0.5 / sigma
+    assert splat.dtype == np.float64
+    assert np.abs(splat - exact).max() <= tolerance * weights.sum()
+    for point in points[:20]:
+        single_error = np.abs(
+            imgviz.heatmap(point[None], (100, 80), sigma=sigma, method=method)
+            - imgviz.heatmap(point[None], (100, 80), sigma=sigma, method="exact")
+        ).max()
+        assert single_error <= tolerance
+
+
+@pytest.mark.parametrize("method", ["bilinear", "nearest"])
+def test_heatmap_splat_is_exact_on_integer_points(
+    method: Literal["bilinear", "nearest"],
+) -> None:
+    points = np.array([[10, 10], [-5, 40], [50, 78], [99, 0]], dtype=np.float64)
+    weights = np.array([1.0, 2.0, 0.5, 3.0])
+
+    splat = imgviz.heatmap(points, (100, 80), sigma=4.0, weights=weights, method=method)
+    exact = imgviz.heatmap(
+        points, (100, 80), sigma=4.0, weights=weights, method="exact"
+    )
+
+    np.testing.assert_allclose(splat, exact, atol=1e-12)
+
+
+def test_heatmap_defaults_to_exact() -> None:
+    points = [(10.3, 20.7), (55.5, 40.25)]
+
+    res = imgviz.heatmap(points, (100, 80), sigma=4.0)
+
+    np.testing.assert_array_equal(
+        res, imgviz.heatmap(points, (100, 80), sigma=4.0, method="exact")
+    )
+
+
+@pytest.mark.parametrize("method", ["bilinear", "nearest"])
+def test_heatmap_splat_is_zero_outside_support(
+    method: Literal["bilinear", "nearest"],
+) -> None:
+    res = imgviz.heatmap([(100.3, 150.7)], (200, 300), sigma=5, method=method)
+
+    assert res.min() == 0
+    # The truncated Gaussian reaches ceil(3 sigma) = 15 pixels past the
+    # splatted pixels, at most (101, 151).
+    support = np.zeros((200, 300), dtype=bool)
+    support[100 - 15 : 101 + 16, 150 - 15 : 151 + 16] = True
+    assert not res[~support].any()
+    assert (res[support] > 0).sum() > 0.9 * support.sum()
+
+
+def test_heatmap_splat_rejects_negative_weights() -> None:
+    with pytest.raises(ValueError, match="weights must be non-negative"):
+        imgviz.heatmap([(5, 5)], (10, 10), weights=[-1.0], method="bilinear")
+
+
+def test_heatmap_rejects_unknown_method() -> None:
+    with pytest.raises(ValueError, match="method must be"):
+        imgviz.heatmap(
+            np.zeros((1, 2)),
+            (10, 10),
+            method="gaussian",  # type: ignore[arg-type]
+        )
+
+
+def test_Heatmap_matches_heatmap_of_all_points() -> None:
+    rng = np.random.default_rng(seed=0)
+    points = rng.uniform(-10, 110, size=(300, 2))
+    weights = rng.uniform(0.5, 2.0, size=300)
+
+    heat = imgviz.Heatmap(shape=(100, 80), sigma=5.0)
+    for start in range(0, 300, 100):
+        heat.add(points[start : start + 100], weights[start : start + 100])
+    density = heat.density()
+
+    assert density.dtype == np.float32
+    expected = imgviz.heatmap(
+        points, (100, 80), sigma=5.0, weights=weights, method="bilinear"
+    )
+    np.testing.assert_allclose(density, expected, atol=1e-5 * expected.max())
+
+
+def test_Heatmap_decays_by_half_life() -> None:
+    heat = imgviz.Heatmap(shape=(50, 50), sigma=3.0, half_life=2.0)
+    heat.add([(10, 10)], time=0)
+    heat.add([(40, 40)], time=4)
+
+    density = heat.density()
+    assert density[10, 10] == pytest.approx(0.25, rel=1e-4)
+    assert density[40, 40] == pytest.approx(1.0, rel=1e-4)
+
+    density = heat.density(time=6)
+    assert heat.time == 6
+    assert density[10, 10] == pytest.approx(0.125, rel=1e-4)
+    assert density[40, 40] == pytest.approx(0.5, rel=1e-4)
+
+
+def test_Heatmap_decay_survives_rescaling() -> None:
+    heat = imgviz.Heatmap(shape=(20, 20), sigma=2.0, half_life=1.0)
+    for time in range(100):
+        heat.add([(10, 10)], time=time)
+
+    # Geometric series 1 + 1/2 + 1/4 + ...
+    assert heat.density()[10, 10] == pytest.approx(2.0, rel=1e-4)
+
+
+def test_Heatmap_expires_points_outside_window() -> None:
+    heat = imgviz.Heatmap(shape=(50, 50), sigma=3.0, window=5)
+    heat.add([(10, 10)], time=0)
+    heat.add([(40, 40)], time=3)
+
+    density = heat.density(time=5)
+    assert density[10, 10] == pytest.approx(1.0, rel=1e-4)
+
+    density = heat.density(time=6)
+    assert density[10, 10] == pytest.approx(0.0, abs=1e-5)
+    assert density[40, 40] == pytest.approx(1.0, rel=1e-4)
+
+    np.testing.assert_array_equal(heat.density(time=100), 0)
+
+
+@pytest.mark.parametrize("half_life", [None, 3.0])
+def test_Heatmap_expired_cells_are_exactly_zero(half_life: float | None) -> None:
+    heat = imgviz.Heatmap(shape=(100, 100), sigma=2.0, window=2, half_life=half_life)
+    rng = np.random.default_rng(seed=0)
+    heat.add(rng.uniform(5, 15, size=(50, 2)), weights=rng.random(50), time=1)
+    heat.add(rng.uniform(5, 15, size=(50, 2)), weights=rng.random(50), time=2)
+    heat.add(rng.uniform(80, 85, size=(5, 2)), time=3)
+
+    density = heat.density(time=4.5)
+
+    # Only the last batch is live, far from the expired ones.
+    assert not density[:40, :40].any()
+    assert density[80:85, 80:85].all()
+
+
+def test_Heatmap_advances_one_step_per_add() -> None:
+    heat = imgviz.Heatmap(shape=(20, 20), sigma=2.0, window=1)
+    heat.add([(5, 5)])
+    heat.add([(15, 15)])
+    heat.add([(15, 5)])
+
+    assert heat.time == 3
+    density = heat.density()
+    assert density[5, 5] == pytest.approx(0.0, abs=1e-5)
+    assert density[15, 15] > 0.5
+
+
+def test_Heatmap_density_is_non_negative_float32() -> None:
+    heat = imgviz.Heatmap(shape=(200, 300), sigma=5.0, half_life=3.0, window=4)
+    rng = np.random.default_rng(seed=0)
+    for time in range(10):
+        heat.add(rng.uniform(90, 110, size=(50, 2)), time=time)
+
+    density = heat.density()
+
+    assert density.dtype == np.float32
+    assert density.min() == 0
+    assert not density[:70].any()
+    assert not density[130:].any()
+
+
+def test_Heatmap_rejects_negative_weights() -> None:
+    heat = imgviz.Heatmap(shape=(20, 20))
+
+    with pytest.raises(ValueError, match="weights must be non-negative"):
+        heat.add([(5, 5)], weights=[-1.0])
+
+
+def test_Heatmap_render() -> None:
+    heat = imgviz.Heatmap(shape=(40, 60))
+    heat.add([(20, 30)])
+
+    rgb = heat.render()
+    assert rgb.shape == (40, 60, 3)
+    assert rgb.dtype == np.uint8
+
+    colorizer = imgviz.Colorize(vmin=0, vmax=2)
+    rgb = heat.render(colorizer)
+    np.testing.assert_array_equal(rgb, imgviz.colorize(heat.density(), vmin=0, vmax=2))
+
+
+def test_Heatmap_rejects_time_going_back() -> None:
+    heat = imgviz.Heatmap(shape=(20, 20))
+    heat.add([(5, 5)], time=10)
+
+    with pytest.raises(ValueError, match="time must be finite and >= the current"):
+        heat.add([(5, 5)], time=9)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"sigma": 0.0}, "sigma must be"),
+        ({"half_life": 0.0}, "half_life must be"),
+        ({"window": -1.0}, "window must be"),
+        ({"method": "exact"}, "method must be"),
+    ],
+)
+def test_Heatmap_rejects_invalid_arguments(
+    kwargs: dict[str, float | str], match: str
+) -> None:
+    with pytest.raises(ValueError, match=match):
+        imgviz.Heatmap(shape=(20, 20), **kwargs)  # type: ignore[arg-type]
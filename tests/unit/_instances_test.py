@@ -34,6 +34,56 @@ def test_masks_to_bboxes_leaves_empty_mask_as_zeros() -> None:
     np.testing.assert_array_equal(bboxes, np.zeros((1, 4)))
 
 
+def test_masks_to_bboxes_matches_argwhere() -> None:
+    rng = np.random.default_rng(seed=0)
+    masks = rng.random((6, 20, 30)) > 0.97
+    masks[2] = False
+
+    bboxes = masks_to_bboxes(masks)
+
+    for mask, bbox in zip(masks, bboxes):
+        if not mask.any():
+            np.testing.assert_array_equal(bbox, np.zeros(4))
+            continue
+        where = np.argwhere(mask)
+        np.testing.assert_array_equal(
+            bbox, np.concatenate([where.min(axis=0), where.max(axis=0)])
+        )
+
+
+def test_masks_to_bboxes_empty_sequence() -> None:
+    assert masks_to_bboxes([]).shape == (0, 4)
+
+
+def test_instance_map_to_bboxes() -> None:
+    instance_map = np.full((30, 40), -1, dtype=np.int64)
+    instance_map[2:10, 3:7] = 0
+    instance_map[12:29, 20:39] = 2
+    instance_map[5, 30] = 2
+
+    bboxes = imgviz.instance_map_to_bboxes(instance_map, n_instance=3)
+
+    np.testing.assert_array_equal(bboxes, [[2, 3, 9, 6], [0, 0, 0, 0], [5, 20, 28, 38]])
+
+
+def test_instance_map_to_bboxes_defaults_to_max_id() -> None:
+    instance_map = np.full((10, 10), -1, dtype=np.int32)
+    instance_map[1:3, 4:6] = 1
+
+    bboxes = imgviz.instance_map_to_bboxes(instance_map)
+
+    np.testing.assert_array_equal(bboxes, [[0, 0, 0, 0], [1, 4, 2, 5]])
+
+
+def test_instance_map_to_bboxes_matches_masks_to_bboxes() -> None:
+    class_label = imgviz.data.arc2017()["class_label"]
+    masks = np.stack([class_label == i for i in range(class_label.max() + 1)])
+
+    np.testing.assert_array_equal(
+        imgviz.instance_map_to_bboxes(class_label), masks_to_bboxes(masks)
+    )
+
+
 @pytest.fixture
 def image() -> NDArray[np.uint8]:
     return np.full((50, 50, 3), 30, dtype=np.uint8)
@@ -170,3 +220,71 @@ def test_instances2rgb_skips_zero_area_bbox(image: NDArray[np.uint8]) -> None:
     out = imgviz.instances2rgb(image=image, labels=[1], bboxes=[zero_area_bbox])
 
     np.testing.assert_array_equal(out, image)
+
+
+def test_instances2rgb_atlas_text_backend(
+    image: NDArray[np.uint8], bbox: list[float]
+) -> None:
+    pillow = imgviz.instances2rgb(
+        image=image, labels=[1], bboxes=[bbox], captions=["cat"]
+    )
+    atlas = imgviz.instances2rgb(
+        image=image, labels=[1], bboxes=[bbox], captions=["cat"], text_backend="atlas"
+    )
+
+    np.testing.assert_array_equal(atlas, pillow)
+
+
+def test_instances2rgb_later_mask_paints_over_earlier(
+    image: NDArray[np.uint8],
+) -> None:
+    first = np.zeros((50, 50), dtype=bool)
+    first[10:30, 10:30] = True
+    second = np.zeros((50, 50), dtype=bool)
+    second[20:40, 20:40] = True
+
+    no_bboxes = [[0.0, 0.0, 0.0, 0.0]] * 2
+
+    out = imgviz.instances2rgb(
+        image=image, labels=[1, 2], bboxes=no_bboxes, masks=[first, second]
+    )
+
+    instance_colors = imgviz.label_colormap()[1:]
+    expected_first = (0.5 * image[0, 0] + 0.5 * instance_colors[0]).astype(np.uint8)
+    expected_second = (0.5 * image[0, 0] + 0.5 * instance_colors[1]).astype(np.uint8)
+    np.testing.assert_array_equal(out[15, 15], expected_first)
+    np.testing.assert_array_equal(out[25, 25], expected_second)
+    np.testing.assert_array_equal(out[35, 35], expected_second)
+
+
+def test_instances2rgb_accepts_instance_map(image: NDArray[np.uint8]) -> None:
+    instance_map = np.full((50, 50), -1, dtype=np.int32)
+    instance_map[5:20, 5:25] = 0
+    instance_map[25:45, 10:40] = 1
+    masks = np.stack([instance_map == 0, instance_map == 1])
+
+    from_map = imgviz.instances2rgb(
+        image=image, labels=[3, 4], masks=instance_map, boundary_width=2
+    )
+    from_masks = imgviz.instances2rgb(
+        image=image, labels=[3, 4], masks=masks, boundary_width=2
+    )
+
+    np.testing.assert_array_equal(from_map, from_masks)
+
+
+def test_instances2rgb_rejects_out_of_range_instance_map(
+    image: NDArray[np.uint8],
+) -> None:
+    instance_map = np.zeros((50, 50), dtype=np.int32)
+    instance_map[0, 0] = 1
+    with pytest.raises(ValueError, match="instance-id map values must be"):
+        imgviz.instances2rgb(image=image, labels=[1], masks=instance_map)
+
+
+def test_instances2rgb_rejects_float_instance_map(
+    image: NDArray[np.uint8],
+) -> None:
+    instance_map = np.zeros((50, 50), dtype=np.float32)
+    with pytest.raises(ValueError, match="instance-id map dtype must be integer"):
+        imgviz.instances2rgb(image=image, labels=[1], masks=instance_map)
@@ -87,6 +87,32 @@ def test_label_colormap_is_cached_and_readonly() -> None:
         cmap[0] = (1, 2, 3)
 
 
+def test_label_colormap_n_label() -> None:
+    cmap = imgviz.label_colormap(n_label=1000)
+    assert cmap.shape == (1000, 3)
+    assert imgviz.label_colormap(n_label=1000) is cmap
+    np.testing.assert_array_equal(cmap[:256], imgviz.label_colormap())
+    assert len(np.unique(cmap, axis=0)) == 1000
+
+
+def test_label2rgb_sparse_large_label_ids() -> None:
+    label = np.zeros((4, 4), dtype=np.int64)
+    label[:2] = 1_000_000
+    label[3, 3] = 2**40
+
+    labelviz = imgviz.label2rgb(label=label, alpha={1_000_000: 1.0})
+
+    cmap = imgviz.label_colormap(n_label=1_000_001)
+    np.testing.assert_array_equal(labelviz[0, 0], cmap[1_000_000])
+    np.testing.assert_array_equal(labelviz[2, 0], cmap[0])
+
+
+def test_label2rgb_rejects_label_outside_colormap() -> None:
+    label = np.array([[0, 5]], dtype=np.int32)
+    with pytest.raises(ValueError, match="colormap has 3 colors"):
+        imgviz.label2rgb(label=label, colormap=imgviz.label_colormap(n_label=3))
+
+
 def test_label2rgb_casts_bool_label() -> None:
     label = np.array([[True, False], [False, True]], dtype=bool)
 
@@ -112,6 +138,17 @@ def test_label2rgb_accepts_gray_image() -> None:
     np.testing.assert_array_equal(labelviz[0, 1], expected_obj)
 
 
+@pytest.mark.parametrize("batch", [(), (3,)])
+def test_label2rgb_accepts_single_channel_image(batch: tuple[int, ...]) -> None:
+    rng = np.random.default_rng(seed=0)
+    label = rng.integers(0, 3, size=batch + (4, 5)).astype(np.int32)
+    gray = rng.integers(0, 256, size=batch + (4, 5)).astype(np.uint8)
+
+    labelviz = imgviz.label2rgb(label=label, image=gray[..., None])
+
+    np.testing.assert_array_equal(labelviz, imgviz.label2rgb(label=label, image=gray))
+
+
 def test_label2rgb_rejects_out_of_range_alpha() -> None:
     label = np.array([[0, 1]], dtype=np.int32)
     with pytest.raises(ValueError, match=r"alpha values must be in \[0, 1\]"):
@@ -143,3 +180,53 @@ def test_label2rgb_thresh_suppress_draws_no_text(
     )
 
     np.testing.assert_array_equal(suppressed, plain)
+
+
+def test_label2rgb_boundary_width(labeled_square: NDArray[np.int32]) -> None:
+    plain = imgviz.label2rgb(label=labeled_square)
+    outlined = imgviz.label2rgb(label=labeled_square, boundary_width=2)
+
+    is_outline = (outlined == (200, 200, 200)).all(axis=2)
+    assert is_outline[4:16, 4:16].any()
+    assert not is_outline[8:12, 8:12].any()
+    np.testing.assert_array_equal(outlined[~is_outline], plain[~is_outline])
+
+
+@pytest.mark.parametrize("label_names", [None, {1: "obj", 2: "other"}])
+def test_label2rgb_batch_matches_per_frame(
+    label_names: dict[int, str] | None,
+) -> None:
+    rng = np.random.default_rng(seed=0)
+    label = rng.integers(-1, 3, size=(3, 40, 50)).astype(np.int32)
+    image = rng.integers(0, 256, size=(3, 40, 50, 3), dtype=np.uint8)
+
+    batch = imgviz.label2rgb(
+        label, image=image, label_names=label_names, font_size=8, boundary_width=1
+    )
+
+    assert batch.shape == (3, 40, 50, 3)
+    for i in range(len(label)):
+        np.testing.assert_array_equal(
+            batch[i],
+            imgviz.label2rgb(
+                label[i],
+                image=image[i],
+                label_names=label_names,
+                font_size=8,
+                boundary_width=1,
+            ),
+        )
+
+
+@pytest.mark.parametrize(
+    "image_shape",
+    [(2, 40, 50, 3), (3, 40, 40, 3), (3, 50, 40), (3, 40, 50, 4), (40, 50, 3)],
+)
+def test_label2rgb_batch_rejects_mismatched_image(
+    image_shape: tuple[int, ...],
+) -> None:
+    label = np.zeros((3, 40, 50), dtype=np.int32)
+    image = np.zeros(image_shape, dtype=np.uint8)
+
+    with pytest.raises(ValueError, match="image must have shape"):
+        imgviz.label2rgb(label, image=image)
@@ -1,9 +1,13 @@
+import pathlib
+import sys
+
 import numpy as np
 import pytest
 import sklearn.decomposition
 from numpy.typing import NDArray
 
 import imgviz
+from imgviz import _nchannel
 
 
 @pytest.fixture
@@ -99,3 +103,109 @@ def test_nchannel2rgb_matches_example() -> None:
 
     assert out.shape == (*res4.shape[:2], 3)
     assert out.dtype == np.uint8
+
+
+def test_nchannel2rgb_does_not_need_sklearn(
+    nchannel: NDArray[np.float32], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setitem(sys.modules, "sklearn", None)
+    monkeypatch.setitem(sys.modules, "sklearn.decomposition", None)
+
+    out = imgviz.nchannel2rgb(nchannel)
+
+    assert out.shape == (8, 8, 3)
+    assert out.dtype == np.uint8
+
+
+def test_Nchannel2Rgb_keeps_fitted_basis(nchannel: NDArray[np.float32]) -> None:
+    converter = imgviz.Nchannel2Rgb()
+    assert converter.pca is None
+
+    converter(nchannel)
+    pca = converter.pca
+    converter(nchannel * 2.0)
+
+    assert converter.pca is pca
+    np.testing.assert_array_equal(
+        imgviz.nchannel2rgb(nchannel, pca=pca, dtype=np.float32),
+        converter(nchannel, dtype=np.float32),
+    )
+
+
+class _RowSliced:
+    # Array-like that only supports slicing rows and conversion, like h5py.
+    def __init__(self, array: NDArray) -> None:
+        self._array = array
+        self.shape = array.shape
+        self.dtype = array.dtype
+
+    def __getitem__(self, key: slice) -> "_RowSliced":
+        if not isinstance(key, slice):
+            raise TypeError("only row slices are supported")
+        return _RowSliced(self._array[key])
+
+    def __array__(
+        self, dtype: np.dtype | None = None, copy: bool | None = None
+    ) -> NDArray:
+        return np.asarray(self._array, dtype=dtype)
+
+
+@pytest.fixture
+def large_nchannel() -> NDArray[np.float32]:
+    rng = np.random.default_rng(seed=0)
+    return rng.random((120, 90, 32), dtype=np.float32)
+
+
+def test_nchannel2rgb_streams_memmap_into_memmap(
+    tmp_path: pathlib.Path, large_nchannel: NDArray[np.float32]
+) -> None:
+    nchannel = np.lib.format.open_memmap(
+        tmp_path / "nchannel.npy", mode="w+", dtype=np.float32, shape=(120, 90, 32)
+    )
+    nchannel[:] = large_nchannel
+    out = np.lib.format.open_memmap(
+        tmp_path / "rgb.npy", mode="w+", dtype=np.uint8, shape=(120, 90, 3)
+    )
+
+    result = imgviz.nchannel2rgb(nchannel, n_samples=1000, out=out)
+
+    assert result is out
+    np.testing.assert_array_equal(
+        out, imgviz.nchannel2rgb(large_nchannel, n_samples=1000)
+    )
+
+
+def test_nchannel2rgb_accepts_row_sliced_array_like(
+    large_nchannel: NDArray[np.float32],
+) -> None:
+    out = imgviz.nchannel2rgb(
+        _RowSliced(large_nchannel),  # type: ignore[arg-type]
+        n_samples=1000,
+    )
+
+    np.testing.assert_array_equal(
+        out, imgviz.nchannel2rgb(large_nchannel, n_samples=1000)
+    )
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.float32])
+def test_nchannel2rgb_strips_match_single_pass(
+    large_nchannel: NDArray[np.float32],
+    dtype: type[np.uint8] | type[np.float32],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    expected = imgviz.nchannel2rgb(large_nchannel, dtype=dtype)
+
+    monkeypatch.setattr(imgviz._utils, "CHUNK_SIZE", 10_000)
+    monkeypatch.setattr(_nchannel, "_MAX_KEPT_SIZE", 0)
+    out = imgviz.nchannel2rgb(large_nchannel, dtype=dtype)
+
+    # Strips only change the float32 matmul blocking.
+    np.testing.assert_allclose(out, expected, atol=1 if dtype == np.uint8 else 1e-5)
+
+
+def test_nchannel2rgb_rejects_mismatched_out(
+    nchannel: NDArray[np.float32],
+) -> None:
+    with pytest.raises(ValueError, match="out must have shape"):
+        imgviz.nchannel2rgb(nchannel, out=np.empty((8, 8, 3), dtype=np.float32))
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+import sklearn.decomposition
+from numpy.typing import NDArray
+
+from imgviz._pca import PCA
+
+
+@pytest.fixture
+def features() -> NDArray[np.float32]:
+    rng = np.random.default_rng(seed=0)
+    latent = rng.normal(size=(5000, 3)) * [5.0, 3.0, 2.0]
+    mixing = rng.normal(size=(3, 32))
+    noise = rng.normal(scale=0.1, size=(5000, 32))
+    return (latent @ mixing + noise + 10).astype(np.float32)
+
+
+@pytest.mark.parametrize("n_samples", [None, 1000])
+def test_pca_matches_sklearn(features: NDArray[np.float32], n_samples: int) -> None:
+    expected = sklearn.decomposition.PCA(n_components=3).fit(features)
+
+    pca = PCA(n_components=3, n_samples=n_samples).fit(features)
+
+    assert pca.components_ is not None
+    cosine = np.abs(np.sum(pca.components_ * expected.components_, axis=1))
+    np.testing.assert_allclose(cosine, 1, atol=1e-3 if n_samples else 1e-5)
+
+
+def test_pca_transform_matches_sklearn(features: NDArray[np.float32]) -> None:
+    expected = sklearn.decomposition.PCA(n_components=3).fit_transform(features)
+
+    projected = PCA(n_components=3, n_samples=None).fit_transform(features)
+
+    assert projected.dtype == np.float32
+    np.testing.assert_allclose(projected, expected, atol=1e-3)
+
+
+def test_pca_ignores_non_finite_vectors(features: NDArray[np.float32]) -> None:
+    corrupted = features.copy()
+    corrupted[::10, 0] = np.nan
+
+    pca = PCA(n_components=3, n_samples=None).fit(corrupted)
+    expected = PCA(n_components=3, n_samples=None).fit(
+        np.delete(features, np.s_[::10], axis=0)
+    )
+
+    np.testing.assert_allclose(pca.components_, expected.components_, atol=1e-6)
+
+
+def test_pca_transform_requires_fit(features: NDArray[np.float32]) -> None:
+    with pytest.raises(ValueError, match="must be fitted"):
+        PCA().transform(features)
+
+
+def test_pca_rejects_too_many_components(features: NDArray[np.float32]) -> None:
+    with pytest.raises(ValueError, match="n_components must be <="):
+        PCA(n_components=33).fit(features)
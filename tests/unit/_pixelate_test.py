@@ -51,3 +51,105 @@ def test_pixelate_block_exceeds_both_dimensions_yields_uniform() -> None:
 
     assert dst.shape == img.shape
     np.testing.assert_array_equal(dst, np.full_like(dst, dst[0, 0]))
+
+
+@pytest.mark.parametrize("block", [3, 8, 13])
+@pytest.mark.parametrize("dtype", [np.uint8, np.float32, np.float64])
+def test_pixelate_within_mask_matches_whole_image(
+    block: int, dtype: type[np.floating] | type[np.uint8]
+) -> None:
+    rng = np.random.default_rng(seed=0)
+    img = rng.integers(0, 256, size=(97, 123, 3)).astype(dtype)
+    mask = np.zeros((97, 123), dtype=bool)
+    mask[0:10, 0:15] = True
+    mask[40:52, 50:70] = True
+    mask[45:60, 100:123] = True
+    mask[90:97, 5:8] = True
+    mask &= rng.random((97, 123)) < 0.9
+
+    dst = imgviz.pixelate(img, block=block, mask=mask)
+
+    expected = img.copy()
+    expected[mask] = imgviz.pixelate(img, block=block)[mask]
+    np.testing.assert_array_equal(dst, expected)
+
+
+@pytest.mark.parametrize("block", [3, 8, 13])
+@pytest.mark.parametrize("dtype", [np.uint16, np.int16, np.float64])
+def test_pixelate_within_mask_matches_whole_image_pillow(
+    monkeypatch: pytest.MonkeyPatch, block: int, dtype: type[np.number]
+) -> None:
+    monkeypatch.setattr(imgviz._resize, "cv2", None)
+    rng = np.random.default_rng(seed=0)
+    low, high = (-(2**15), 2**15) if dtype == np.int16 else (0, 2**16)
+    img = rng.integers(low, high, size=(97, 123)).astype(dtype)
+    mask = np.zeros((97, 123), dtype=bool)
+    mask[0:10, 0:15] = True
+    mask[40:52, 50:70] = True
+    mask[45:60, 100:123] = True
+    mask[90:97, 5:8] = True
+    mask &= rng.random((97, 123)) < 0.9
+
+    dst = imgviz.pixelate(img, block=block, mask=mask)
+
+    expected = img.copy()
+    expected[mask] = imgviz.pixelate(img, block=block)[mask]
+    np.testing.assert_array_equal(dst, expected)
+
+
+@pytest.mark.parametrize(
+    "shape", [(40, 48), (40, 48, 3), (43, 50, 5)], ids=["gray", "rgb", "ragged"]
+)
+@pytest.mark.parametrize("dtype", [np.uint8, np.int16, np.float32, np.float64])
+def test_pixelate_mean_is_block_average(
+    shape: tuple[int, ...], dtype: type[np.number]
+) -> None:
+    rng = np.random.default_rng(seed=0)
+    img = rng.integers(-100 if dtype == np.int16 else 0, 256, size=shape).astype(dtype)
+
+    dst = imgviz.pixelate(img, block=8, method="mean")
+
+    assert dst.shape == img.shape
+    assert dst.dtype == img.dtype
+    for y in range(0, shape[0], 8):
+        for x in range(0, shape[1], 8):
+            tile = img[y : y + 8, x : x + 8].astype(np.float64)
+            expected = tile.mean(axis=(0, 1))
+            if np.issubdtype(dtype, np.integer):
+                expected = np.round(expected)
+            tile_dst = dst[y : y + 8, x : x + 8]
+            np.testing.assert_allclose(
+                tile_dst, np.broadcast_to(expected, tile_dst.shape), rtol=1e-6
+            )
+
+
+def test_pixelate_mean_block_exceeds_image_yields_uniform() -> None:
+    rng = np.random.default_rng(seed=2)
+    img = rng.integers(0, 256, size=(8, 10, 3)).astype(np.uint8)
+
+    dst = imgviz.pixelate(img, block=100, method="mean")
+
+    np.testing.assert_array_equal(
+        dst, np.broadcast_to(np.round(img.mean(axis=(0, 1))), img.shape)
+    )
+
+
+def test_pixelate_mean_within_mask_matches_whole_image() -> None:
+    rng = np.random.default_rng(seed=0)
+    img = rng.integers(0, 256, size=(97, 123, 3)).astype(np.uint8)
+    mask = np.zeros((97, 123), dtype=bool)
+    mask[3:10, 0:15] = True
+    mask[40:52, 50:70] = True
+    mask[90:97, 110:123] = True
+
+    dst = imgviz.pixelate(img, block=8, mask=mask, method="mean")
+
+    expected = img.copy()
+    expected[mask] = imgviz.pixelate(img, block=8, method="mean")[mask]
+    np.testing.assert_array_equal(dst, expected)
+
+
+def test_pixelate_rejects_unknown_method() -> None:
+    img = np.zeros((10, 10, 3), dtype=np.uint8)
+    with pytest.raises(ValueError, match="method must be 'resize' or 'mean'"):
+        imgviz.pixelate(img, method="median")  # type: ignore[arg-type]
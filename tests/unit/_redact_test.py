@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+import imgviz
+
+
+@pytest.fixture
+def image() -> NDArray[np.uint8]:
+    rng = np.random.default_rng(seed=0)
+    return rng.integers(0, 256, size=(80, 100, 3)).astype(np.uint8)
+
+
+def _box_mask(
+    shape: tuple[int, int], boxes: list[tuple[int, int, int, int]]
+) -> NDArray[np.bool_]:
+    mask = np.zeros(shape, dtype=bool)
+    for y1, x1, y2, x2 in boxes:
+        mask[y1 : y2 + 1, x1 : x2 + 1] = True
+    return mask
+
+
+@pytest.mark.parametrize("effect", ["blur", "pixelate"])
+def test_redact_matches_masked_effect(image: NDArray[np.uint8], effect: str) -> None:
+    # Overlapping boxes are merged into one region.
+    boxes = [(10, 10, 29, 39), (20, 30, 44, 59), (60, 80, 200, 200)]
+
+    dst = imgviz.redact(image, boxes=boxes, effect=effect)  # type: ignore[arg-type]
+
+    mask = _box_mask((80, 100), boxes)
+    if effect == "blur":
+        expected = imgviz.blur(image, mask=mask)
+    else:
+        expected = imgviz.pixelate(image, mask=mask)
+    np.testing.assert_array_equal(dst, expected)
+    assert not np.shares_memory(dst, image)
+
+
+@pytest.mark.parametrize("block", [3, 8, 13])
+def test_redact_pixelate_uint16_pillow(
+    monkeypatch: pytest.MonkeyPatch, block: int
+) -> None:
+    monkeypatch.setattr(imgviz._resize, "cv2", None)
+    rng = np.random.default_rng(seed=0)
+    image = rng.integers(0, 2**16, size=(97, 123)).astype(np.uint16)
+    boxes = [(0, 0, 9, 14), (40, 50, 59, 69), (45, 100, 59, 122), (90, 5, 96, 7)]
+
+    dst = imgviz.redact(image, boxes=boxes, effect="pixelate", block=block)
+
+    mask = _box_mask((97, 123), boxes)
+    expected = image.copy()
+    expected[mask] = imgviz.pixelate(image, block=block)[mask]
+    np.testing.assert_array_equal(dst, expected)
+
+
+def test_redact_polygons(image: NDArray[np.uint8]) -> None:
+    polygon = [(10, 10), (10, 60), (50, 35)]
+
+    dst = imgviz.redact(image, polygons=[polygon], sigma=4.0)
+
+    mask = imgviz.draw.polygon(
+        np.zeros((80, 100), dtype=np.uint8), yx=polygon, fill=1, outline=1
+    ).astype(bool)
+    np.testing.assert_array_equal(dst, imgviz.blur(image, sigma=4.0, mask=mask))
+
+
+def test_redact_stack_in_place(image: NDArray[np.uint8]) -> None:
+    frames = np.stack([image, image[::-1], image[:, ::-1]])
+    boxes_per_frame = [[(5, 5, 20, 30)], np.zeros((0, 4)), [(40, 50, 70, 90)]]
+    polygons_per_frame = [None, [[(0, 0), (0, 30), (30, 0)]], None]
+    expected = np.stack(
+        [
+            imgviz.redact(frame, boxes=boxes, polygons=polygons, effect="pixelate")
+            for frame, boxes, polygons in zip(
+                frames, boxes_per_frame, polygons_per_frame
+            )
+        ]
+    )
+
+    dst = imgviz.redact(
+        frames,
+        boxes=boxes_per_frame,
+        polygons=polygons_per_frame,
+        effect="pixelate",
+        out=frames,
+    )
+
+    assert dst is frames
+    np.testing.assert_array_equal(frames, expected)
+
+
+def test_redact_into_out(image: NDArray[np.uint8]) -> None:
+    out = np.zeros_like(image)
+
+    dst = imgviz.redact(image, boxes=[(10, 10, 20, 20)], out=out)
+
+    assert dst is out
+    np.testing.assert_array_equal(out, imgviz.redact(image, boxes=[(10, 10, 20, 20)]))
+
+
+def test_redact_without_regions_copies(image: NDArray[np.uint8]) -> None:
+    dst = imgviz.redact(image)
+
+    np.testing.assert_array_equal(dst, image)
+    assert dst is not image
+
+
+def test_redact_rejects_mismatched_frame_count(image: NDArray[np.uint8]) -> None:
+    frames = np.stack([image, image])
+
+    with pytest.raises(ValueError, match="boxes must have one entry per frame"):
+        imgviz.redact(frames, boxes=[[(0, 0, 5, 5)]])
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"boxes": [(0, 0, 5)]}, r"boxes must have shape \(M, 4\)"),
+        ({"polygons": [[(0, 0), (5, 5)]]}, "polygons must have vertices"),
+        ({"effect": "fill"}, "effect must be 'blur' or 'pixelate'"),
+        ({"block": 0, "effect": "pixelate"}, "block must be >= 1"),
+        ({"out": np.zeros((80, 100), dtype=np.uint8)}, "out must have shape"),
+    ],
+)
+def test_redact_rejects_invalid_arguments(
+    image: NDArray[np.uint8], kwargs: dict, match: str
+) -> None:
+    with pytest.raises(ValueError, match=match):
+        imgviz.redact(image, **kwargs)
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+import imgviz
+
+
+def test_region_stats() -> None:
+    label = np.full((20, 30), -1, dtype=np.int32)
+    label[2:6, 3:9] = 4
+    label[10:20, 0:30] = 7
+
+    stats = imgviz.region_stats(label)
+
+    np.testing.assert_array_equal(stats.labels, [-1, 4, 7])
+    np.testing.assert_array_equal(stats.areas, [600 - 24 - 300, 24, 300])
+    np.testing.assert_allclose(stats.centroids[1:], [[3.5, 5.5], [14.5, 14.5]])
+    np.testing.assert_array_equal(stats.bboxes[1:], [[2, 3, 5, 8], [10, 0, 19, 29]])
+
+
+def test_region_stats_matches_per_label_masks() -> None:
+    label = imgviz.data.arc2017()["class_label"]
+
+    stats = imgviz.region_stats(label)
+
+    for label_id, area, centroid, bbox in zip(*stats):
+        mask = label == label_id
+        where = np.argwhere(mask)
+        assert area == mask.sum()
+        np.testing.assert_allclose(centroid, where.mean(axis=0))
+        np.testing.assert_array_equal(
+            bbox, np.concatenate([where.min(axis=0), where.max(axis=0)])
+        )
+
+
+def test_region_stats_sparse_large_ids() -> None:
+    label = np.zeros((4, 4), dtype=np.int64)
+    label[0, 0] = 1_000_000_000
+
+    stats = imgviz.region_stats(label)
+
+    np.testing.assert_array_equal(stats.labels, [0, 1_000_000_000])
+    np.testing.assert_array_equal(stats.areas, [15, 1])
+    np.testing.assert_array_equal(stats.bboxes[1], [0, 0, 0, 0])
+
+
+def test_region_stats_rejects_float_label() -> None:
+    with pytest.raises(ValueError, match="label dtype must be integer"):
+        imgviz.region_stats(np.zeros((4, 4), dtype=np.float32))
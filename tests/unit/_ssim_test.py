@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+import skimage.metrics
+from numpy.typing import NDArray
+
+import imgviz
+from imgviz._ssim import structural_similarity
+
+
+@pytest.fixture
+def pair() -> tuple[NDArray[np.float32], NDArray[np.float32]]:
+    a = imgviz.rgb2gray(imgviz.data.arc2017()["rgb"]).astype(np.float32)
+    rng = np.random.default_rng(seed=0)
+    b = a + rng.normal(scale=5, size=a.shape).astype(np.float32)
+    b[100:150, 200:300] = 0
+    return a, b
+
+
+@pytest.mark.parametrize("win_size", [3, 7, 11])
+def test_structural_similarity_matches_skimage(
+    pair: tuple[NDArray[np.float32], NDArray[np.float32]], win_size: int
+) -> None:
+    a, b = pair
+
+    similarity = structural_similarity(a, b, data_range=255, win_size=win_size)
+
+    _, expected = skimage.metrics.structural_similarity(
+        a.astype(np.float64),
+        b.astype(np.float64),
+        data_range=255,
+        win_size=win_size,
+        full=True,
+    )
+    assert similarity.dtype == np.float32
+    np.testing.assert_allclose(similarity, expected, atol=5e-4)
+
+
+def test_structural_similarity_bands_match_single_pass(
+    pair: tuple[NDArray[np.float32], NDArray[np.float32]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    a, b = pair
+    expected = structural_similarity(a, b, data_range=255)
+
+    monkeypatch.setattr(imgviz._utils, "CHUNK_SIZE", 1000)
+    similarity = structural_similarity(a, b, data_range=255)
+
+    np.testing.assert_array_equal(similarity, expected)
+
+
+def test_structural_similarity_marks_nan_windows() -> None:
+    rng = np.random.default_rng(seed=0)
+    a = rng.random((20, 30), dtype=np.float32)
+    b = a.copy()
+    a[10, 15] = np.nan
+    b[0, 0] = np.nan
+
+    similarity = structural_similarity(a, b, data_range=1)
+
+    expected = np.zeros((20, 30), dtype=bool)
+    expected[7:14, 12:19] = True
+    expected[:4, :4] = True
+    np.testing.assert_array_equal(np.isnan(similarity), expected)
+    np.testing.assert_allclose(similarity[~expected], 1, atol=1e-5)
+
+
+def test_structural_similarity_rejects_small_image() -> None:
+    with pytest.raises(ValueError, match="at least win_size"):
+        structural_similarity(np.zeros((5, 9)), np.zeros((5, 9)), data_range=1)
@@ -39,3 +39,33 @@ def test_apply_mask_rejects_shape_mismatch() -> None:
 
     with pytest.raises(ValueError, match="mask.shape must be"):
         _utils.apply_mask(image=image, transformed=image, mask=mask)
+
+
+def test_mask_regions_splits_groups_apart_by_more_than_gap() -> None:
+    mask = np.zeros((40, 50), dtype=bool)
+    mask[2:5, 3:6] = True
+    mask[2:4, 9:12] = True
+    mask[20:30, 40:45] = True
+    mask[22, 10] = True
+
+    regions = _utils.mask_regions(mask, gap=(4, 2))
+
+    assert regions == [
+        (slice(2, 5), slice(3, 6)),
+        (slice(2, 4), slice(9, 12)),
+        (slice(22, 23), slice(10, 11)),
+        (slice(20, 30), slice(40, 45)),
+    ]
+    covered = np.zeros_like(mask)
+    for ys, xs in regions:
+        covered[ys, xs] |= mask[ys, xs]
+    np.testing.assert_array_equal(covered, mask)
+
+
+def test_mask_regions_merges_groups_within_gap() -> None:
+    mask = np.zeros((10, 20), dtype=bool)
+    mask[1:3, 2:4] = True
+    mask[4:6, 6:8] = True
+
+    assert _utils.mask_regions(mask, gap=(2, 2)) == [(slice(1, 6), slice(2, 8))]
+    assert _utils.mask_regions(np.zeros((5, 5), dtype=bool), gap=(1, 1)) == []
@@ -98,3 +98,115 @@ def test_arrow_rejects_bad_point_shape(
             fill=(255, 0, 0),
             **kwargs,  # type: ignore[arg-type]
         )
+
+
+def test_arrows_draws_every_arrow(white_image: NDArray[np.uint8]) -> None:
+    res = imgviz.draw.arrows(
+        white_image,
+        yx1=[(20, 10), (60, 10)],
+        yx2=[(20, 90), (60, 90)],
+        fill=[(255, 0, 0), (0, 0, 255)],
+    )
+    assert res.shape == white_image.shape
+    assert res.dtype == white_image.dtype
+    np.testing.assert_array_equal(res[20, 10:91], [(255, 0, 0)] * 81)
+    np.testing.assert_array_equal(res[60, 10:91], [(0, 0, 255)] * 81)
+    assert np.array_equal(white_image, np.full_like(white_image, 255))
+
+
+def test_arrows_matches_arrow_shaft_and_head(white_image: NDArray[np.uint8]) -> None:
+    kwargs = dict(fill=(255, 0, 0), head_length_ratio=0.3)
+    single = imgviz.draw.arrow(white_image, yx1=(50, 10), yx2=(50, 90), **kwargs)
+    batched = imgviz.draw.arrows(white_image, yx1=[(50, 10)], yx2=[(50, 90)], **kwargs)
+    drawn_single = np.any(single != white_image, axis=2)
+    drawn_batched = np.any(batched != white_image, axis=2)
+    np.testing.assert_array_equal(drawn_batched[50], drawn_single[50])
+    # Barbs differ only by rasterization, not by position.
+    assert (drawn_single ^ drawn_batched).sum() <= 0.1 * drawn_single.sum()
+
+
+def test_arrows_width(white_image: NDArray[np.uint8]) -> None:
+    thin = imgviz.draw.arrows(
+        white_image, yx1=[(50, 10)], yx2=[(50, 90)], fill=(0, 0, 0)
+    )
+    thick = imgviz.draw.arrows(
+        white_image, yx1=[(50, 10)], yx2=[(50, 90)], fill=(0, 0, 0), width=3
+    )
+    assert (thick == 0).all(axis=2)[49:52, 10:91].all()
+    assert (thin != white_image).sum() < (thick != white_image).sum()
+
+
+def test_arrows_clips_to_image(white_image: NDArray[np.uint8]) -> None:
+    res = imgviz.draw.arrows(
+        white_image, yx1=[(-50, 50)], yx2=[(150, 50)], fill=(0, 255, 0)
+    )
+    np.testing.assert_array_equal(res[:, 50], [(0, 255, 0)] * 100)
+
+
+def test_arrows_skips_non_finite_arrows(white_image: NDArray[np.uint8]) -> None:
+    yx1 = [(10, 10), (np.nan, 20), (30, 30), (-1e308, 50)]
+    yx2 = [(10, 90), (20, 80), (np.inf, 30), (1e308, 50)]
+    fill = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (0, 0, 0)]
+
+    res = imgviz.draw.arrows(white_image, yx1=yx1, yx2=yx2, fill=fill)
+
+    expected = imgviz.draw.arrows(white_image, yx1=yx1[:1], yx2=yx2[:1], fill=fill[:1])
+    np.testing.assert_array_equal(res, expected)
+
+
+def test_arrows_clips_far_endpoints(white_image: NDArray[np.uint8]) -> None:
+    # Sampling these shafts one pixel per step would take about 1e15 pixels.
+    res = imgviz.draw.arrows(
+        white_image,
+        yx1=[(-1e15, 50), (40, -1e15)],
+        yx2=[(1e15, 50), (40, 1e15)],
+        fill=(0, 255, 0),
+        width=3,
+    )
+
+    np.testing.assert_array_equal(res[:, 49:52], 0 * res[:, 49:52] + (0, 255, 0))
+    np.testing.assert_array_equal(res[39:42], 0 * res[39:42] + (0, 255, 0))
+    assert (res != white_image).any(axis=2).sum() == 3 * 100 + 3 * 100 - 9
+
+
+def test_arrows_inplace_on_pillow(white_image: NDArray[np.uint8]) -> None:
+    yx1 = np.array([(10, 10), (80, 20)])
+    yx2 = np.array([(50, 90), (30, 60)])
+    image = PIL.Image.fromarray(white_image)
+
+    imgviz.draw.arrows_(image, yx1=yx1, yx2=yx2, fill=(255, 0, 0))
+
+    expected = imgviz.draw.arrows(white_image, yx1=yx1, yx2=yx2, fill=(255, 0, 0))
+    np.testing.assert_array_equal(np.asarray(image), expected)
+
+
+def test_arrows_later_arrows_overwrite_earlier(
+    white_image: NDArray[np.uint8],
+) -> None:
+    # Crossing arrows, each drawn many times, so every crossing pixel is
+    # written repeatedly by both colors.
+    yx1 = np.tile([[10, 50], [50, 10]], (50, 1))
+    yx2 = np.tile([[90, 50], [50, 90]], (50, 1))
+    fill = np.tile([[255, 0, 0], [0, 0, 255]], (50, 1)).astype(np.uint8)
+
+    dst = imgviz.draw.arrows(white_image, yx1=yx1, yx2=yx2, fill=fill)
+
+    np.testing.assert_array_equal(dst[50, 50], [0, 0, 255])
+    np.testing.assert_array_equal(dst[30, 50], [255, 0, 0])
+
+
+def test_arrows_rejects_mismatched_colors(white_image: NDArray[np.uint8]) -> None:
+    with pytest.raises(ValueError, match="one color per arrow"):
+        imgviz.draw.arrows(
+            white_image,
+            yx1=[(10, 10), (20, 20)],
+            yx2=[(30, 30), (40, 40)],
+            fill=[(255, 0, 0)] * 3,
+        )
+
+
+def test_arrows_rejects_mismatched_tips(white_image: NDArray[np.uint8]) -> None:
+    with pytest.raises(ValueError, match="yx2 must have shape"):
+        imgviz.draw.arrows(
+            white_image, yx1=[(10, 10), (20, 20)], yx2=[(30, 30)], fill=(0, 0, 0)
+        )
@@ -1,4 +1,8 @@
+import concurrent.futures
+
 import numpy as np
+import PIL.Image
+import pytest
 
 import imgviz
 
@@ -23,3 +27,112 @@ def test_text_size_blank_line_adds_height() -> None:
     height_without, _ = imgviz.draw.text_size("a\nb", size=20)
     height_with, _ = imgviz.draw.text_size("a\n\nb", size=20)
     assert height_with > height_without
+
+
+def test_text_size_is_cached() -> None:
+    imgviz.draw.text_cache_clear()
+
+    first = imgviz.draw.text_size("cached", size=21)
+    second = imgviz.draw.text_size("cached", size=21)
+
+    assert first == second
+    info = imgviz.draw.text_cache_info()
+    assert info.text_size.misses == 1
+    assert info.text_size.hits == 1
+    assert info.font.misses == 1
+
+
+def test_text_reuses_cached_font() -> None:
+    imgviz.draw.text_cache_clear()
+    img = np.full((50, 50, 3), 255, dtype=np.uint8)
+
+    imgviz.draw.text(img, yx=(0, 0), text="a", size=17)
+    imgviz.draw.text(img, yx=(0, 0), text="b", size=17)
+
+    info = imgviz.draw.text_cache_info()
+    assert info.font.misses == 1
+    assert info.font.hits == 1
+
+
+def test_set_text_cache_size() -> None:
+    try:
+        imgviz.draw.set_text_cache_size(font=1, text_size=2)
+        for text in ["a", "b", "c"]:
+            imgviz.draw.text_size(text, size=20)
+
+        info = imgviz.draw.text_cache_info()
+        assert info.font.maxsize == 1
+        assert info.text_size.maxsize == 2
+        assert info.text_size.currsize == 2
+    finally:
+        imgviz.draw.set_text_cache_size()
+
+
+def test_set_text_cache_size_rejects_negative() -> None:
+    with pytest.raises(ValueError, match="font must be >= 0"):
+        imgviz.draw.set_text_cache_size(font=-1)
+
+
+def test_text_atlas_backend_matches_pillow() -> None:
+    img = np.full((80, 200, 3), 255, dtype=np.uint8)
+
+    pillow = imgviz.draw.text(img, yx=(5, 5), text="cat 0.9\ndog", size=20)
+    atlas = imgviz.draw.text(
+        img, yx=(5, 5), text="cat 0.9\ndog", size=20, backend="atlas"
+    )
+
+    np.testing.assert_array_equal(atlas, pillow)
+
+
+def test_text_atlas_backend_in_place_on_pillow_image() -> None:
+    img = np.full((40, 40), 255, dtype=np.uint8)
+    expected = imgviz.draw.text(img, yx=(-5, 30), text="AB", size=20, color=0)
+
+    dst = PIL.Image.fromarray(img)
+    imgviz.draw.text_(dst, yx=(-5, 30), text="AB", size=20, color=0, backend="atlas")
+
+    np.testing.assert_array_equal(np.asarray(dst), expected)
+
+
+def test_text_atlas_backend_renders_glyphs_once() -> None:
+    imgviz.draw.text_cache_clear()
+    img = np.full((50, 100, 3), 255, dtype=np.uint8)
+
+    imgviz.draw.text(img, yx=(0, 0), text="aaa", size=20, backend="atlas")
+    imgviz.draw.text_(
+        PIL.Image.fromarray(img), yx=(0, 0), text="aaa", size=20, backend="atlas"
+    )
+    imgviz.draw.text(img, yx=(0, 0), text="aaa", size=20, backend="atlas")
+
+    # One lookup per draw.
+    info = imgviz.draw.text_cache_info()
+    assert info.glyph_atlas.misses == 1
+    assert info.rendered_text.misses == 1
+    assert info.rendered_text.hits == 2
+
+
+def test_text_rejects_unsupported_backend() -> None:
+    img = np.full((50, 100, 3), 255, dtype=np.uint8)
+    with pytest.raises(ValueError, match="unsupported backend"):
+        imgviz.draw.text(img, yx=(0, 0), text="a", size=20, backend="cairo")  # type: ignore[arg-type]
+
+
+def test_text_atlas_backend_from_threads() -> None:
+    imgviz.draw.text_cache_clear()
+    img = np.full((30, 300, 3), 255, dtype=np.uint8)
+    texts = [f"label {i} {chr(65 + i)}" for i in range(16)]
+    expected = [imgviz.draw.text(img, yx=(0, 0), text=text, size=20) for text in texts]
+    imgviz.draw.text_cache_clear()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda text: imgviz.draw.text(
+                    img, yx=(0, 0), text=text, size=20, backend="atlas"
+                ),
+                texts,
+            )
+        )
+
+    for result, pillow in zip(results, expected):
+        np.testing.assert_array_equal(result, pillow)
@@ -59,3 +59,93 @@ def test_lblsave(tmp_path: pathlib.Path) -> None:
     label_cls_read = imgviz.io.imread(png_file)
 
     np.testing.assert_array_equal(label_cls, label_cls_read)
+
+
+@pytest.fixture
+def flow() -> NDArray[np.float32]:
+    rng = np.random.default_rng(seed=0)
+    return rng.normal(scale=10, size=(15, 20, 2)).astype(np.float32)
+
+
+@pytest.mark.parametrize("mmap_mode", ["r", "c", None])
+def test_flowwrite_flowread_flo_roundtrip(
+    tmp_path: pathlib.Path, flow: NDArray[np.float32], mmap_mode: str | None
+) -> None:
+    imgviz.io.flowwrite(tmp_path / "flow.flo", flow)
+    read = imgviz.io.flowread(tmp_path / "flow.flo", mmap_mode=mmap_mode)
+
+    assert read.dtype == np.float32
+    assert isinstance(read, np.memmap) == (mmap_mode is not None)
+    assert read.flags.writeable == (mmap_mode != "r")
+    np.testing.assert_array_equal(read, flow)
+
+
+def test_flowread_middlebury_matches_sample_data() -> None:
+    flow = imgviz.io.flowread(
+        pathlib.Path(imgviz.data.__file__).parent / "middlebury/grove3.flo"
+    )
+
+    np.testing.assert_array_equal(flow, imgviz.data.middlebury()["flow"])
+
+
+def test_flowread_rejects_invalid_flo(tmp_path: pathlib.Path) -> None:
+    (tmp_path / "bad.flo").write_bytes(b"HEIP" + bytes(8))
+
+    with pytest.raises(OSError, match="invalid .flo file"):
+        imgviz.io.flowread(tmp_path / "bad.flo")
+
+
+def test_flowread_rejects_truncated_flo(
+    tmp_path: pathlib.Path, flow: NDArray[np.float32]
+) -> None:
+    imgviz.io.flowwrite(tmp_path / "flow.flo", flow)
+    data = (tmp_path / "flow.flo").read_bytes()
+    (tmp_path / "flow.flo").write_bytes(data[:-4])
+
+    with pytest.raises(OSError, match="truncated .flo file"):
+        imgviz.io.flowread(tmp_path / "flow.flo")
+
+
+def test_flowwrite_flowread_kitti_png_roundtrip(
+    tmp_path: pathlib.Path, flow: NDArray[np.float32]
+) -> None:
+    flow[0, 0] = np.nan
+
+    imgviz.io.flowwrite(tmp_path / "flow.png", flow)
+    read = imgviz.io.flowread(tmp_path / "flow.png")
+
+    assert read.dtype == np.float32
+    assert read.shape == flow.shape
+    # Invalid vectors read as zero; valid ones are quantized to 1/64 pixel.
+    np.testing.assert_array_equal(read[0, 0], 0)
+    np.testing.assert_allclose(read[1:], flow[1:], atol=1 / 64)
+
+
+def test_flowread_rejects_unknown_extension(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(ValueError, match="filename must end with '.flo' or '.png'"):
+        imgviz.io.flowread(tmp_path / "flow.npy")
+
+
+def test_flowread_dir(tmp_path: pathlib.Path, flow: NDArray[np.float32]) -> None:
+    for i in range(5):
+        imgviz.io.flowwrite(tmp_path / f"{i:02d}.flo", flow + i)
+    imgviz.io.flowwrite(tmp_path / "05.flo", flow[:10])
+
+    batches = list(imgviz.io.flowread_dir(tmp_path, batch_size=2))
+
+    assert [[path.name for path in files] for files, _ in batches] == [
+        ["00.flo", "01.flo"],
+        ["02.flo", "03.flo"],
+        ["04.flo"],
+        ["05.flo"],
+    ]
+    assert [flows.shape for _, flows in batches] == [
+        (2, 15, 20, 2),
+        (2, 15, 20, 2),
+        (1, 15, 20, 2),
+        (1, 10, 20, 2),
+    ]
+    np.testing.assert_array_equal(batches[1][1][1], flow + 3)
+
+    flow2rgb = imgviz.Flow2Rgb()
+    assert flow2rgb(batches[0][1]).shape == (2, 15, 20, 3)